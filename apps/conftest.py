@@ -2,8 +2,27 @@ from rest_framework import test
 
 import pytest
 
+from apps.core.test_utils import QueriesBudgetAPIClient
+from apps.payments.services.stripe import account as stripe_account_services
+from apps.payments.test_utils import FakeStripeClient
+
+
+@pytest.fixture
+def api_client(request) -> test.APIClient:
+    """Create api client.
+
+    Client checks queries budgets declared by views, use
+    `no_queries_budget` mark to disable checks for test.
+
+    """
+    if request.node.get_closest_marker("no_queries_budget"):
+        return test.APIClient()
+    return QueriesBudgetAPIClient()
+
 
 @pytest.fixture
-def api_client() -> test.APIClient:
-    """Create api client."""
-    return test.APIClient()
+def fake_stripe_client(monkeypatch) -> FakeStripeClient:
+    """Replace Stripe client for accounts with local fake."""
+    client = FakeStripeClient()
+    monkeypatch.setattr(stripe_account_services, "stripe_client", client)
+    return client
@@ -13,6 +13,7 @@ from ...constants import (
     ConsultationStatus,
     SessionType,
 )
+from ...rate_cards import get_rate
 from ..mixins import ConsultationTotalCostMixin
 from .consultation_attachment import ConsultationAttachmentSerializer
 
@@ -35,6 +36,7 @@ class ConsultationReadSerializer(
             "from_user",
             "to_user",
             "status",
+            "payment_status",
             "created",
             "session_type",
             "attachments",
@@ -96,16 +98,19 @@ class ConsultationCreateSerializer(
     def validate(self, attrs: dict) -> dict:
         """Ensure cost is suitable with user's rate/offered price."""
         attrs = super().validate(attrs)
-        chosen_rate = models.ConsultationRate.objects.filter(
-            user=attrs["to_user"],
-            template__session_type=attrs["session_type"],
-            template__duration=attrs["duration"],
-        ).first()
+        chosen_rate = get_rate(
+            user_id=attrs["to_user"].id,
+            session_type=attrs["session_type"],
+            duration=attrs["duration"],
+        )
         if not chosen_rate:
             raise serializers.ValidationError(
                 _("Consultation rate not found."),
             )
-        if not chosen_rate.allow_offered and attrs["cost"] != chosen_rate.rate:
+        if (
+            not chosen_rate["allow_offered"]
+            and attrs["cost"] != chosen_rate["rate"]
+        ):
             raise serializers.ValidationError(
                 _("Can't offer price for this consultation."),
             )
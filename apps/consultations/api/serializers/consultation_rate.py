@@ -9,6 +9,7 @@ from apps.core.api.serializers import (
 )
 
 from ...models import ConsultationRate
+from ...rate_cards import invalidate_rate_cards
 
 
 class ConsultationRateNestedSerializer(NestedCreateUpdateListSerializer):
@@ -26,6 +27,12 @@ class ConsultationRateNestedSerializer(NestedCreateUpdateListSerializer):
             )
         return attrs
 
+    def update(self, instance, validated_data):
+        """Update rates and drop cached rate cards of their users."""
+        updated_instances = super().update(instance, validated_data)
+        invalidate_rate_cards(rate.user_id for rate in instance)
+        return updated_instances
+
     def get_data_for_insertion(self, instances_mapping, validated_data):
         """Disable create operation for consultation rates when update."""
         return []
@@ -1,4 +1,4 @@
-from django.db.models import Q
+from django.db.models import Prefetch, Q
 
 from rest_framework import mixins, response
 from rest_framework import serializers as drf_serializers
@@ -6,8 +6,12 @@ from rest_framework.decorators import action
 
 from drf_spectacular.utils import extend_schema, inline_serializer
 
+from libs.api.throttling import UserRateThrottle
+from libs.transactions import non_atomic_handler
+
 from apps.core.api import mixins as core_mixins
 from apps.core.api.views import BaseViewSet, StringOptionAPIView
+from apps.users.models import User
 
 from ... import models
 from ...constants import SessionType
@@ -15,6 +19,21 @@ from .. import permissions, serializers
 from ..filters import ConsultationFilter
 
 
+def prefetch_consultation_user(field_name: str):
+    """Return prefetch plan item for consultation's user with contact info.
+
+    `select_related` can't annotate related users, so they are prefetched with
+    one query per field instead.
+
+    """
+    def _prefetch(view) -> Prefetch:
+        return Prefetch(
+            field_name,
+            queryset=User.objects.with_contact_info(view.request.user),
+        )
+    return _prefetch
+
+
 # pylint: disable=unused-argument,duplicate-code
 class ConsultationViewSet(
     mixins.ListModelMixin,
@@ -41,6 +60,29 @@ class ConsultationViewSet(
         ),
         "checkout": (permissions.IsReceivedConsultation,),
     }
+    throttle_scope = "consultations"
+    throttles_map = {
+        "create": (UserRateThrottle,),
+        "checkout": (UserRateThrottle,),
+    }
+    prefetch_related_map = {
+        "list": (
+            prefetch_consultation_user("from_user"),
+            prefetch_consultation_user("to_user"),
+            "attachments",
+        ),
+        "retrieve": (
+            prefetch_consultation_user("from_user"),
+            prefetch_consultation_user("to_user"),
+            "attachments",
+        ),
+    }
+    queries_budget_map = {
+        "list": 5,
+        "retrieve": 4,
+    }
+    allow_cursor_pagination = True
+    allow_replica_reads = True
     search_fields = ()
     ordering_fields = (
         "created",
@@ -65,6 +107,7 @@ class ConsultationViewSet(
             ),
         },
     )
+    @non_atomic_handler
     @action(detail=True, methods=["post"])
     def checkout(self, request, pk=None):
         """Start checkout session for consultation."""
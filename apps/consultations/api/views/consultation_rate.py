@@ -3,6 +3,7 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 from ...models import ConsultationRate
+from ...rate_cards import get_rate_card
 from .. import serializers
 
 
@@ -13,10 +14,11 @@ class ConsultationRateAPIView(GenericAPIView):
     serializer_class = serializers.ConsultationRateSerializer
     permission_classes = (IsAuthenticated,)
     lookup_field = "user_id"
+    queries_budget_map = {
+        "get": 1,
+    }
 
     def get(self, *args, **kwargs) -> Response:
-        """Return list of consultation rates from user id."""
-        user_id = kwargs.get("user_id")
-        consultation_rate = super().get_queryset().filter(user_id=user_id)
-        serializer = self.serializer_class(consultation_rate, many=True)
-        return Response(data={"results": serializer.data})
+        """Return list of consultation rates from user's cached rate card."""
+        rate_card = get_rate_card(kwargs["user_id"])
+        return Response(data={"results": list(rate_card.values())})
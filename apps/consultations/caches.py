@@ -0,0 +1,32 @@
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+from libs.cache import CacheNamespace, register_warm_up
+
+from . import models
+
+templates_cache = CacheNamespace("consultation-templates")
+
+
+def load_template_ids() -> list[int]:
+    """Return ids of consultation templates from primary database."""
+    return list(
+        models.ConsultationTemplate.objects.using(DEFAULT_DB_ALIAS)
+        .order_by("id")
+        .values_list("id", flat=True),
+    )
+
+
+def get_template_ids() -> list[int]:
+    """Return cached ids of consultation templates."""
+    return templates_cache.get_or_set("ids", load_template_ids)
+
+
+def invalidate_templates() -> None:
+    """Drop cached templates once transaction is committed."""
+    transaction.on_commit(templates_cache.invalidate)
+
+
+@register_warm_up
+def warm_up_templates() -> None:
+    """Fill cache of consultation templates."""
+    templates_cache.set("ids", load_template_ids())
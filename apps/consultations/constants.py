@@ -18,6 +18,14 @@ class ConsultationStatus(TextChoices):
     CANCELLED = "cancelled", _("Cancelled")
 
 
+class ConsultationPaymentStatus(TextChoices):
+    """Represent payment statuses of consultation."""
+
+    UNPAID = "unpaid", _("Unpaid")
+    PAID = "paid", _("Paid")
+    FAILED = "failed", _("Failed")
+
+
 class SessionType(TextChoices):
     """Represent available session types in Consultation."""
 
@@ -0,0 +1,108 @@
+# Generated by Django 5.0.4 on 2026-10-17 23:14
+
+import django.db.models.deletion
+import django_extensions.db.fields
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncMonth
+
+
+def fill_consultation_stats(apps, schema_editor) -> None:
+    """Calculate consultation stats for existing users."""
+    Consultation = apps.get_model("consultations", "Consultation")
+    UserConsultationStats = apps.get_model(
+        "consultations",
+        "UserConsultationStats",
+    )
+    MonthlyEarnings = apps.get_model("consultations", "MonthlyEarnings")
+
+    stats = {}
+    received_totals = Consultation.objects.values("to_user").annotate(
+        consultation_count=Count("id"),
+        earnings=Sum("cost"),
+    ).order_by()
+    for total in received_totals:
+        stats[total["to_user"]] = UserConsultationStats(
+            user_id=total["to_user"],
+            consultation_count=total["consultation_count"],
+            earnings=total["earnings"],
+        )
+    requested_totals = Consultation.objects.values("from_user").annotate(
+        request_count=Count("id"),
+    ).order_by()
+    for total in requested_totals:
+        user_stats = stats.setdefault(
+            total["from_user"],
+            UserConsultationStats(user_id=total["from_user"]),
+        )
+        user_stats.request_count = total["request_count"]
+    UserConsultationStats.objects.bulk_create(stats.values(), batch_size=1000)
+
+    monthly_totals = Consultation.objects.annotate(
+        month=TruncMonth("created"),
+    ).values("to_user", "month").annotate(
+        consultation_count=Count("id"),
+        earnings=Sum("cost"),
+    ).order_by()
+    MonthlyEarnings.objects.bulk_create(
+        (
+            MonthlyEarnings(
+                user_id=total["to_user"],
+                month=total["month"].date(),
+                consultation_count=total["consultation_count"],
+                earnings=total["earnings"],
+            )
+            for total in monthly_totals
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('consultations', '0006_consultation_completed_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserConsultationStats',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', django_extensions.db.fields.CreationDateTimeField(auto_now_add=True, verbose_name='created')),
+                ('modified', django_extensions.db.fields.ModificationDateTimeField(auto_now=True, verbose_name='modified')),
+                ('consultation_count', models.PositiveIntegerField(default=0, verbose_name='Received consultations count')),
+                ('request_count', models.PositiveIntegerField(default=0, verbose_name='Requested consultations count')),
+                ('earnings', models.DecimalField(decimal_places=2, default=0, max_digits=14, verbose_name='Earnings')),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='consultation_stats', to=settings.AUTH_USER_MODEL, verbose_name='User')),
+            ],
+            options={
+                'verbose_name': 'User Consultation Stats',
+                'verbose_name_plural': 'User Consultation Stats',
+            },
+        ),
+        migrations.CreateModel(
+            name='MonthlyEarnings',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', django_extensions.db.fields.CreationDateTimeField(auto_now_add=True, verbose_name='created')),
+                ('modified', django_extensions.db.fields.ModificationDateTimeField(auto_now=True, verbose_name='modified')),
+                ('month', models.DateField(help_text='First day of the month.', verbose_name='Month')),
+                ('consultation_count', models.PositiveIntegerField(default=0, verbose_name='Received consultations count')),
+                ('earnings', models.DecimalField(decimal_places=2, default=0, max_digits=14, verbose_name='Earnings')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='monthly_earnings', to=settings.AUTH_USER_MODEL, verbose_name='User')),
+            ],
+            options={
+                'verbose_name': 'Monthly Earnings',
+                'verbose_name_plural': 'Monthly Earnings',
+                'ordering': ('-month',),
+                'unique_together': {('user', 'month')},
+            },
+        ),
+        migrations.RunPython(
+            fill_consultation_stats,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
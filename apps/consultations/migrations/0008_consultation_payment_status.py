@@ -0,0 +1,18 @@
+# Generated by Django 5.0.4 on 2026-10-17 23:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('consultations', '0007_user_consultation_stats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='consultation',
+            name='payment_status',
+            field=models.CharField(choices=[('unpaid', 'Unpaid'), ('paid', 'Paid'), ('failed', 'Failed')], default='unpaid', help_text='Updated from Stripe checkout session events.', verbose_name='Payment Status'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.0.4 on 2026-10-18 00:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('consultations', '0008_consultation_payment_status'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='consultation',
+            index=models.Index(fields=['created', 'id'], name='consultations_created_id_idx'),
+        ),
+    ]
@@ -1,4 +1,5 @@
 from .consultation import Consultation
 from .consultation_attachment import ConsultationAttachment
 from .consultation_rate import ConsultationRate
+from .consultation_stats import MonthlyEarnings, UserConsultationStats
 from .consultation_template import ConsultationTemplate
@@ -2,7 +2,7 @@ import typing
 from datetime import datetime
 
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
@@ -12,8 +12,17 @@ from apps.core.models import BaseModel
 
 from ...payments.models import StripeCheckoutSession
 from ...payments.services.stripe.session import create_checkout_session_payment
-from ..constants import ConsultationStatus, SessionType
+from ..constants import (
+    ConsultationPaymentStatus,
+    ConsultationStatus,
+    SessionType,
+)
 from ..exceptions import ConsultationActionError
+from ..querysets import ConsultationQuerySet
+from .consultation_stats import (
+    track_consultation_stats,
+    untrack_consultation_stats,
+)
 
 
 # pylint: disable=duplicate-code
@@ -37,6 +46,12 @@ class Consultation(BaseModel):
         choices=ConsultationStatus.choices,
         default=ConsultationStatus.REQUESTED,
     )
+    payment_status = models.CharField(
+        verbose_name=_("Payment Status"),
+        choices=ConsultationPaymentStatus.choices,
+        default=ConsultationPaymentStatus.UNPAID,
+        help_text=_("Updated from Stripe checkout session events."),
+    )
     session_type = models.CharField(
         verbose_name=_("Session Type"),
         choices=SessionType.choices,
@@ -72,18 +87,52 @@ class Consultation(BaseModel):
         blank=True,
     )
 
+    objects = ConsultationQuerySet.as_manager()
+
     class Meta:
         verbose_name = _("Consultation")
         verbose_name_plural = _("Consultations")
+        indexes = (
+            # Used by keyset pagination of consultations list
+            models.Index(
+                fields=("created", "id"),
+                name="consultations_created_id_idx",
+            ),
+        )
 
     def __str__(self):
         return f"Consultation from {self.from_user} to {self.to_user}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember loaded cost to track its changes in stats."""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_cost = instance.__dict__.get("cost")
+        return instance
+
     def save(self, *args, **kwargs) -> None:
-        """Set value for `completed_at` when consultation is completed."""
+        """Set value for `completed_at` when consultation is completed.
+
+        Also apply changes to precomputed users' consultation stats.
+
+        """
         if self.status == ConsultationStatus.COMPLETED:
             self.completed_at = timezone.now()
-        super().save(*args, **kwargs)
+        is_created = self._state.adding
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            track_consultation_stats(
+                consultation=self,
+                is_created=is_created,
+                previous_cost=getattr(self, "_loaded_cost", None),
+            )
+        self._loaded_cost = self.cost
+
+    def delete(self, *args, **kwargs):
+        """Remove consultation from precomputed users' consultation stats."""
+        with transaction.atomic():
+            untrack_consultation_stats(self)
+            return super().delete(*args, **kwargs)
 
     def clean_to_user(self) -> None:
         """Ensure to_user can't be same as from_user."""
@@ -147,7 +196,7 @@ class Consultation(BaseModel):
         if existing_session:
             return existing_session.get_stripe_data()
         session = create_checkout_session_payment(
-            self.from_user.get_stripe_account().stripe_account,
+            self.from_user.get_stripe_account().stripe_id,
             self.session_type,
             int(self.cost * 100),
             int(self.fee * self.cost * 100),
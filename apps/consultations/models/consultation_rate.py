@@ -6,6 +6,8 @@ from django.utils.translation import gettext_lazy as _
 
 from apps.core.models import BaseModel
 
+from ..rate_cards import invalidate_rate_cards
+
 
 class ConsultationRate(BaseModel):
     """Represent user's rate for a consultation based on type and duration."""
@@ -41,6 +43,16 @@ class ConsultationRate(BaseModel):
     def __str__(self):
         return f"User {self.user_id} rate {self.rate} for {self.template_id}"
 
+    def save(self, *args, **kwargs) -> None:
+        """Drop cached rate card of user."""
+        super().save(*args, **kwargs)
+        invalidate_rate_cards([self.user_id])
+
+    def delete(self, *args, **kwargs):
+        """Drop cached rate card of user."""
+        invalidate_rate_cards([self.user_id])
+        return super().delete(*args, **kwargs)
+
     def clean_rate(self) -> None:
         """Ensure rate must be greater than 0."""
         if isinstance(self.rate, Decimal) and self.rate <= 0:
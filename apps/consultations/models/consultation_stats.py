@@ -0,0 +1,169 @@
+import datetime
+from decimal import Decimal
+
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from apps.core.models import BaseModel
+
+
+def _increment(
+    model: type[models.Model],
+    lookup: dict,
+    deltas: dict,
+) -> None:
+    """Atomically increment counters of row found by `lookup`.
+
+    Row is created if it doesn't exist yet, increments are applied with `F()`
+    expressions, so concurrent updates don't overwrite each other.
+
+    """
+    deltas = {field: delta for field, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    model.objects.get_or_create(**lookup)
+    model.objects.filter(**lookup).update(
+        **{field: models.F(field) + delta for field, delta in deltas.items()},
+    )
+
+
+class UserConsultationStats(BaseModel):
+    """Store precomputed consultation aggregates for user's dashboard."""
+
+    user = models.OneToOneField(
+        to="users.User",
+        verbose_name=_("User"),
+        related_name="consultation_stats",
+        on_delete=models.CASCADE,
+    )
+    consultation_count = models.PositiveIntegerField(
+        verbose_name=_("Received consultations count"),
+        default=0,
+    )
+    request_count = models.PositiveIntegerField(
+        verbose_name=_("Requested consultations count"),
+        default=0,
+    )
+    earnings = models.DecimalField(
+        verbose_name=_("Earnings"),
+        max_digits=14,
+        decimal_places=2,
+        default=0,
+    )
+
+    class Meta:
+        verbose_name = _("User Consultation Stats")
+        verbose_name_plural = _("User Consultation Stats")
+
+    def __str__(self):
+        return f"Consultation stats for User {self.user_id}"
+
+    @classmethod
+    def increment(cls, user_id: int, **deltas) -> None:
+        """Increment user's counters by provided deltas."""
+        _increment(cls, {"user_id": user_id}, deltas)
+
+
+class MonthlyEarnings(BaseModel):
+    """Store user's received consultations and earnings per month."""
+
+    user = models.ForeignKey(
+        to="users.User",
+        verbose_name=_("User"),
+        related_name="monthly_earnings",
+        on_delete=models.CASCADE,
+    )
+    month = models.DateField(
+        verbose_name=_("Month"),
+        help_text=_("First day of the month."),
+    )
+    consultation_count = models.PositiveIntegerField(
+        verbose_name=_("Received consultations count"),
+        default=0,
+    )
+    earnings = models.DecimalField(
+        verbose_name=_("Earnings"),
+        max_digits=14,
+        decimal_places=2,
+        default=0,
+    )
+
+    class Meta:
+        verbose_name = _("Monthly Earnings")
+        verbose_name_plural = _("Monthly Earnings")
+        unique_together = ("user", "month")
+        ordering = ("-month",)
+
+    def __str__(self):
+        return f"Earnings of User {self.user_id} for {self.month:%Y-%m}"
+
+    @classmethod
+    def increment(
+        cls,
+        user_id: int,
+        date: datetime.date,
+        **deltas,
+    ) -> None:
+        """Increment user's counters in bucket for month of `date`."""
+        _increment(
+            cls,
+            {"user_id": user_id, "month": date.replace(day=1)},
+            deltas,
+        )
+
+
+def track_consultation_stats(
+    consultation,
+    is_created: bool,
+    previous_cost: Decimal | None,
+) -> None:
+    """Apply changes of saved consultation to precomputed stats."""
+    month = consultation.created.date()
+    if is_created:
+        UserConsultationStats.increment(
+            consultation.to_user_id,
+            consultation_count=1,
+            earnings=consultation.cost,
+        )
+        UserConsultationStats.increment(
+            consultation.from_user_id,
+            request_count=1,
+        )
+        MonthlyEarnings.increment(
+            consultation.to_user_id,
+            month,
+            consultation_count=1,
+            earnings=consultation.cost,
+        )
+        return
+    if previous_cost is None or previous_cost == consultation.cost:
+        return
+    cost_delta = Decimal(consultation.cost) - previous_cost
+    UserConsultationStats.increment(
+        consultation.to_user_id,
+        earnings=cost_delta,
+    )
+    MonthlyEarnings.increment(
+        consultation.to_user_id,
+        month,
+        earnings=cost_delta,
+    )
+
+
+def untrack_consultation_stats(consultation) -> None:
+    """Remove deleted consultation from precomputed stats."""
+    UserConsultationStats.increment(
+        consultation.to_user_id,
+        consultation_count=-1,
+        earnings=-consultation.cost,
+    )
+    UserConsultationStats.increment(
+        consultation.from_user_id,
+        request_count=-1,
+    )
+    MonthlyEarnings.increment(
+        consultation.to_user_id,
+        consultation.created.date(),
+        consultation_count=-1,
+        earnings=-consultation.cost,
+    )
@@ -3,7 +3,9 @@ from django.utils.translation import gettext_lazy as _
 
 from apps.core.models import BaseModel
 
+from ..caches import invalidate_templates
 from ..constants import CONSULTATION_FEE_RATE, SessionType
+from ..rate_cards import invalidate_all_rate_cards
 
 
 class ConsultationTemplate(BaseModel):
@@ -25,3 +27,15 @@ class ConsultationTemplate(BaseModel):
 
     def __str__(self):
         return f"{self.session_type} - {self.duration} minutes"
+
+    def save(self, *args, **kwargs) -> None:
+        """Drop cached templates and rate cards, which include templates."""
+        super().save(*args, **kwargs)
+        invalidate_templates()
+        invalidate_all_rate_cards()
+
+    def delete(self, *args, **kwargs):
+        """Drop cached templates and rate cards, which include templates."""
+        invalidate_templates()
+        invalidate_all_rate_cards()
+        return super().delete(*args, **kwargs)
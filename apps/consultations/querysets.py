@@ -0,0 +1,68 @@
+import typing
+
+from django.db import models, transaction
+
+# Fields which precomputed users' consultation stats depend on
+STATS_FIELDS = frozenset(
+    (
+        "from_user",
+        "from_user_id",
+        "to_user",
+        "to_user_id",
+        "cost",
+        "created",
+    ),
+)
+
+
+class ConsultationQuerySet(models.QuerySet):
+    """Keep users' consultation stats in sync on bulk operations.
+
+    Bulk updates and deletes bypass `Consultation.save` and
+    `Consultation.delete`, so stats of affected users are recomputed.
+
+    """
+
+    def _get_user_ids(self) -> set[int]:
+        """Return ids of users who sent or received consultations."""
+        return {
+            user_id
+            for user_ids in self.values_list("from_user_id", "to_user_id")
+            for user_id in user_ids
+        }
+
+    def _refresh_users_stats(self, user_ids: typing.Iterable[int]) -> None:
+        """Recompute consultation stats of users."""
+        # Imported here, because services import consultations' models
+        from .services import refresh_users_consultation_stats
+
+        refresh_users_consultation_stats(user_ids)
+
+    def update(self, **kwargs):
+        """Update consultations and recompute stats of their users."""
+        if STATS_FIELDS.isdisjoint(kwargs):
+            return super().update(**kwargs)
+        with transaction.atomic(using=self.db):
+            user_ids = self._get_user_ids()
+            result = super().update(**kwargs)
+            for field_name in ("from_user", "to_user"):
+                user = kwargs.get(field_name, kwargs.get(f"{field_name}_id"))
+                if isinstance(user, models.Model):
+                    user = user.pk
+                if isinstance(user, int):
+                    user_ids.add(user)
+            self._refresh_users_stats(user_ids)
+        return result
+
+    update.alters_data = True
+
+    def delete(self):
+        """Delete consultations and recompute stats of their users."""
+        with transaction.atomic(using=self.db):
+            user_ids = self._get_user_ids()
+            result = super().delete()
+            self._refresh_users_stats(user_ids)
+        return result
+
+    delete.alters_data = True
+    delete.queryset_only = True
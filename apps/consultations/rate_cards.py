@@ -0,0 +1,76 @@
+import typing
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+from . import models
+
+RATE_CARD_CACHE_KEY = "consultations:rate-card:{user_id}"
+RATE_CARD_CACHE_KEY_PATTERN = RATE_CARD_CACHE_KEY.format(user_id="*")
+
+# Rate card maps (session type, duration) to serialized user's rate
+RateCard = dict[tuple[str, int], dict]
+
+
+def get_rate_card_key(user_id: int) -> str:
+    """Return cache key of user's rate card."""
+    return RATE_CARD_CACHE_KEY.format(user_id=user_id)
+
+
+def build_rate_card(user_id: int) -> RateCard:
+    """Serialize user's rates into rate card.
+
+    Rates are read from primary database, so card isn't cached from replica,
+    which hasn't replayed changes yet.
+
+    """
+    # Imported here, because API serializers import users' models, which
+    # depend on consultations' services
+    from .api.serializers import ConsultationRateSerializer
+
+    rates = models.ConsultationRate.objects.using(DEFAULT_DB_ALIAS).filter(
+        user_id=user_id,
+    ).select_related("template").order_by("template_id")
+    return {
+        (rate["session_type"], rate["duration"]): dict(rate)
+        for rate in ConsultationRateSerializer(rates, many=True).data
+    }
+
+
+def get_rate_card(user_id: int) -> RateCard:
+    """Return user's rate card from cache, build it on cache miss."""
+    key = get_rate_card_key(user_id)
+    rate_card = cache.get(key)
+    if rate_card is None:
+        rate_card = build_rate_card(user_id)
+        cache.set(key, rate_card, settings.RATE_CARD_CACHE_TIMEOUT)
+    return rate_card
+
+
+def get_rate(
+    user_id: int,
+    session_type: str,
+    duration: int,
+) -> dict | None:
+    """Return serialized user's rate for session type and duration."""
+    return get_rate_card(user_id).get((session_type, duration))
+
+
+def invalidate_rate_cards(user_ids: typing.Iterable[int]) -> None:
+    """Drop cached rate cards of users once transaction is committed.
+
+    Cards are dropped after commit, so concurrent requests can't cache
+    rates which are about to be changed.
+
+    """
+    keys = [get_rate_card_key(user_id) for user_id in set(user_ids)]
+    if keys:
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def invalidate_all_rate_cards() -> None:
+    """Drop all cached rate cards, used when templates change."""
+    transaction.on_commit(
+        lambda: cache.delete_pattern(RATE_CARD_CACHE_KEY_PATTERN),
+    )
@@ -1,6 +1,13 @@
 import typing
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Coalesce, TruncMonth
 
 from apps.consultations import models
+from apps.consultations.caches import get_template_ids
+from apps.consultations.rate_cards import invalidate_rate_cards
 
 if typing.TYPE_CHECKING:
     from apps.users.models import User
@@ -13,11 +20,80 @@ def create_default_consultation_rates(
     """Create default consultation rates for user."""
     rates = [
         models.ConsultationRate(user_id=user.pk, template_id=template_id)
-        for template_id in models.ConsultationTemplate.objects.values_list(
-            "id",
-            flat=True,
-        )
+        for template_id in get_template_ids()
     ]
     if save:
         models.ConsultationRate.objects.bulk_create(rates)
+        invalidate_rate_cards([user.pk])
     return rates
+
+
+def bulk_create_default_consultation_rates(
+    user_ids: typing.Iterable[int],
+) -> list[models.ConsultationRate]:
+    """Create default consultation rates for many users at once."""
+    template_ids = get_template_ids()
+    return models.ConsultationRate.objects.bulk_create(
+        [
+            models.ConsultationRate(user_id=user_id, template_id=template_id)
+            for user_id in user_ids
+            for template_id in template_ids
+        ],
+        batch_size=1000,
+    )
+
+
+def refresh_consultation_stats(user: "User") -> models.UserConsultationStats:
+    """Recalculate user's precomputed consultation stats from scratch.
+
+    Totals are calculated with single aggregate query, monthly buckets are
+    calculated with single grouped query.
+
+    """
+    received = Q(to_user=user)
+    totals = models.Consultation.objects.filter(
+        received | Q(from_user=user),
+    ).aggregate(
+        consultation_count=Count("id", filter=received),
+        request_count=Count("id", filter=Q(from_user=user)),
+        earnings=Coalesce(Sum("cost", filter=received), Decimal(0)),
+    )
+    monthly_totals = models.Consultation.objects.filter(
+        received,
+    ).annotate(
+        month=TruncMonth("created"),
+    ).values("month").annotate(
+        consultation_count=Count("id"),
+        earnings=Sum("cost"),
+    ).order_by()
+    with transaction.atomic():
+        stats, _ = models.UserConsultationStats.objects.update_or_create(
+            user=user,
+            defaults=totals,
+        )
+        models.MonthlyEarnings.objects.filter(user=user).delete()
+        models.MonthlyEarnings.objects.bulk_create(
+            models.MonthlyEarnings(
+                user=user,
+                month=month_total["month"].date(),
+                consultation_count=month_total["consultation_count"],
+                earnings=month_total["earnings"],
+            )
+            for month_total in monthly_totals
+        )
+    return stats
+
+
+def refresh_users_consultation_stats(user_ids: typing.Iterable[int]) -> None:
+    """Recalculate precomputed consultation stats of several users.
+
+    Used after bulk changes of consultations, which bypass
+    `Consultation.save` and `Consultation.delete`. Users who were deleted
+    are skipped.
+
+    """
+    user_model = models.UserConsultationStats._meta.get_field(
+        "user",
+    ).related_model
+    for user in user_model.objects.filter(id__in=set(user_ids)):
+        refresh_consultation_stats(user)
@@ -1,5 +1,7 @@
 from functools import partial
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse_lazy
 
 from rest_framework import status
@@ -12,7 +14,10 @@ from apps.consultations.constants import (
     ConsultationStatus,
     SessionType,
 )
-from apps.consultations.factories import ConsultationAttachmentFactory
+from apps.consultations.factories import (
+    ConsultationAttachmentFactory,
+    ConsultationFactory,
+)
 from apps.consultations.models import Consultation
 from apps.core.test_utils import get_test_file_url
 from apps.users.factories import UserFactory
@@ -77,6 +82,34 @@ def test_consultation_list_api(
     ).count()
 
 
+def test_consultation_list_api_queries_count(
+    api_client: APIClient,
+    student_user: User,
+) -> None:
+    """Ensure consultations list runs same number of queries for any page."""
+    api_client.force_authenticate(student_user)
+    consultations = ConsultationFactory.create_batch(
+        size=2,
+        from_user=student_user,
+    )
+    ConsultationAttachmentFactory(consultation=consultations[0])
+    with CaptureQueriesContext(connection) as small_page_queries:
+        api_client.get(consultation_list_api)
+
+    consultations = ConsultationFactory.create_batch(
+        size=10,
+        from_user=student_user,
+    )
+    for consultation in consultations:
+        ConsultationAttachmentFactory(consultation=consultation)
+    with CaptureQueriesContext(connection) as big_page_queries:
+        response = api_client.get(consultation_list_api)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.data["results"]) == 12
+    assert len(big_page_queries) == len(small_page_queries)
+
+
 def test_consultation_detail_api(
     api_client: APIClient,
     consultation: Consultation,
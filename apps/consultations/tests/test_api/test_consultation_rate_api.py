@@ -3,6 +3,8 @@ from django.urls import reverse_lazy
 from rest_framework import status
 from rest_framework.test import APIClient
 
+from apps.core.test_utils import queries_budget
+from apps.users.factories import UserFactory
 from apps.users.models import User
 
 
@@ -19,3 +21,26 @@ def test_consultation_rate_list_api(
     response = api_client.get(url)
     assert response.status_code == status.HTTP_200_OK, response.data
     assert len(response.data["results"]) == student_user.rates.count()
+
+
+def test_consultation_rate_list_api_cached(
+    api_client: APIClient,
+    django_capture_on_commit_callbacks,
+) -> None:
+    """Ensure rates are served from cached rate card until rate changes."""
+    user = UserFactory()
+    url = reverse_lazy("v1:consultation-rate", kwargs={"user_id": user.id})
+    api_client.force_authenticate(user)
+    api_client.get(url)
+    with queries_budget(0):
+        response = api_client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+
+    rate = user.rates.first()
+    rate.rate = 45
+    with django_capture_on_commit_callbacks(execute=True):
+        rate.save()
+    response = api_client.get(url)
+    assert {
+        item["id"]: item["rate"] for item in response.data["results"]
+    }[rate.id] == 45
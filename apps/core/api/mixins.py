@@ -106,6 +106,94 @@ class ActionSerializerMixin:
         return serializer_class
 
 
+class ActionQuerySetMixin:
+    """Mixin which allows to define related objects loading per action.
+
+    It uses optional ``select_related_map`` and ``prefetch_related_map``
+    attributes, which work the same way as ``serializers_map``: lookups for
+    current action are used, otherwise lookups for `default` key (if set).
+    Items of ``prefetch_related_map`` may also be callables, which accept the
+    view and return lookup or ``Prefetch``. It's useful when prefetched
+    queryset depends on request.
+    Examples:
+        class NoteViewSet(ActionQuerySetMixin, viewsets.ModelViewSet):
+            queryset = Note.objects.all()
+            select_related_map = {
+                "list": ("author",),
+            }
+            prefetch_related_map = {
+                "default": (
+                    "tags",
+                    lambda view: Prefetch(
+                        "comments",
+                        queryset=Comment.objects.filter(
+                            author=view.request.user,
+                        ),
+                    ),
+                ),
+            }
+
+    """
+
+    select_related_map = None
+    prefetch_related_map = None
+
+    def get_queryset(self):
+        """Load related objects declared for view's action."""
+        queryset = super().get_queryset()
+        if getattr(self, "swagger_fake_view", False):
+            return queryset
+
+        select_related = self.get_lookups_from_map(self.select_related_map)
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+
+        prefetch_related = [
+            lookup(self) if callable(lookup) else lookup
+            for lookup in self.get_lookups_from_map(self.prefetch_related_map)
+        ]
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+        return queryset
+
+    def get_lookups_from_map(self, lookups_map: dict | None) -> tuple:
+        """Return lookups for current action from map."""
+        if not isinstance(lookups_map, dict):
+            return ()
+        if self.action in lookups_map:
+            return tuple(lookups_map[self.action])
+        return tuple(lookups_map.get("default", ()))
+
+
+class ActionThrottlesMixin:
+    """Mixin which allows to define specific throttles per action.
+
+    It uses optional ``throttles_map`` attribute, which works the same way
+    as ``permissions_map``: throttles for current action are used, otherwise
+    throttles for `default` key (if set) or ``throttle_classes``.
+    Examples:
+        class NoteViewSet(ActionThrottlesMixin, viewsets.ModelViewSet):
+            queryset = Note.objects.all()
+            throttle_scope = "notes"
+            throttles_map = {
+                "create": (UserRateThrottle,),
+            }
+
+    """
+
+    throttles_map = None
+
+    def get_throttles(self):
+        """Return throttles list for current ``.action`` attribute value."""
+        if not isinstance(self.throttles_map, dict):
+            return super().get_throttles()
+        if self.action in self.throttles_map:
+            return [t() for t in self.throttles_map[self.action]]
+        if "default" in self.throttles_map:
+            return [t() for t in self.throttles_map["default"]]
+        return super().get_throttles()
+
+
 class UpdateModelWithoutPatchMixin:
     """Same as UpdateModelMixin but without patch method.
 
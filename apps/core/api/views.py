@@ -1,6 +1,19 @@
-from rest_framework import mixins, response
+import hashlib
+import typing
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils import translation
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
+
+from rest_framework import mixins
 from rest_framework.generics import GenericAPIView
 from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.renderers import JSONRenderer
 from rest_framework.viewsets import GenericViewSet
 
 from . import mixins as core_mixins
@@ -10,6 +23,8 @@ from .serializers import StringOptionSerializer
 class BaseViewSet(
     core_mixins.ActionPermissionsMixin,
     core_mixins.ActionSerializerMixin,
+    core_mixins.ActionQuerySetMixin,
+    core_mixins.ActionThrottlesMixin,
     GenericViewSet,
 ):
     """Base viewset for api."""
@@ -50,17 +65,95 @@ class ReadOnlyViewSet(
     """Read only viewset for api views."""
 
 
-class StringOptionAPIView(GenericAPIView):
+# Rendered data of `StaticDataAPIView` by view's key and language
+_static_data_cache: dict[tuple, tuple[bytes, str]] = {}
+
+
+class StaticDataAPIView(GenericAPIView):
+    """Serve JSON, which is the same for every request, from memory.
+
+    Data is declared in `static_data`, it's serialized once per process and
+    language. Responses have strong ETag and long `Cache-Control`, so
+    clients revalidate with 304 responses.
+
+    """
+
+    permission_classes = (AllowAny,)
+    static_data: dict = {}
+
+    def get_static_data(self) -> dict:
+        """Return data served by view."""
+        return self.static_data
+
+    def get_static_data_key(self) -> typing.Hashable:
+        """Return key to cache rendered data with."""
+        return self.__class__
+
+    def get_rendered_static_data(self) -> tuple[bytes, str]:
+        """Return data rendered to JSON and its strong ETag."""
+        key = (self.get_static_data_key(), translation.get_language())
+        if key not in _static_data_cache:
+            content = JSONRenderer().render(self.get_static_data())
+            etag = f'"{hashlib.sha256(content).hexdigest()[:32]}"'
+            _static_data_cache[key] = (content, etag)
+        return _static_data_cache[key]
+
+    def get(self, request, *args, **kwargs) -> HttpResponse:
+        """Return precomputed data."""
+        content, etag = self.get_rendered_static_data()
+        response = get_conditional_response(
+            request,
+            etag=etag,
+        ) or HttpResponse(content, content_type="application/json")
+        response["ETag"] = etag
+        patch_cache_control(
+            response,
+            public=True,
+            max_age=settings.STATIC_DATA_CACHE_MAX_AGE,
+        )
+        patch_vary_headers(response, ("Accept-Language",))
+        return response
+
+
+class StringOptionAPIView(StaticDataAPIView):
     """List all available string options, allow all requests."""
 
     serializer_class = StringOptionSerializer
-    permission_classes = (AllowAny,)
     option_list = ()
 
-    def get(self, *args, **kwargs) -> response.Response:
+    @classmethod
+    def get_options(cls) -> list[dict]:
         """Return all available string options."""
-        data = [
-            {"value": abbr, "label": name} for abbr, name in self.option_list
-        ]
-        serializer = self.get_serializer(data, many=True)
-        return response.Response(data={"results": serializer.data})
+        return StringOptionSerializer(
+            [
+                {"value": abbr, "label": name}
+                for abbr, name in cls.option_list
+            ],
+            many=True,
+        ).data
+
+    def get_static_data(self) -> dict:
+        """Return all available string options."""
+        return {"results": self.get_options()}
+
+
+class StringOptionBundleAPIView(StaticDataAPIView):
+    """List options of several `StringOptionAPIView` in one response.
+
+    Views are passed to `as_view` in `option_views` mapping of response key
+    to view.
+
+    """
+
+    serializer_class = StringOptionSerializer
+    option_views: dict[str, type[StringOptionAPIView]] = {}
+
+    def get_static_data(self) -> dict:
+        """Return options of all views."""
+        return {
+            key: view.get_options() for key, view in self.option_views.items()
+        }
+
+    def get_static_data_key(self) -> typing.Hashable:
+        """Return key which depends on bundled views."""
+        return (self.__class__, tuple(self.option_views.items()))
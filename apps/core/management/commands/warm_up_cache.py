@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+from django.utils.module_loading import autodiscover_modules
+
+from libs.cache import warm_up
+
+
+class Command(BaseCommand):
+    """Fill caches registered in apps' `caches` modules."""
+
+    help = "Fill caches registered in apps' `caches` modules, run on deploy."
+
+    def handle(self, *args, **options):
+        autodiscover_modules("caches")
+        for name in warm_up():
+            self.stdout.write(f"Warmed up: {name}")
@@ -1,5 +1,173 @@
+import contextlib
+import dataclasses
+import os
+import traceback
+from collections import defaultdict
+from pathlib import Path
+
+from django.conf import settings
+from django.db import connection
+
+from rest_framework import test
+
+import pytest
+
+# Statements which are issued by transactions handling, not by code
+IGNORED_SQL_PREFIXES = (
+    "SAVEPOINT",
+    "RELEASE SAVEPOINT",
+    "ROLLBACK TO SAVEPOINT",
+)
+# Files which are not reported as call sites of queries
+IGNORED_CALL_SITE_NAMES = (
+    "test_utils.py",
+    "conftest.py",
+)
+
+
 def get_test_file_url(path: str) -> str:
     """Add localhost to relative URI."""
     if path.startswith("/"):
         return f"http://localhost:8000{path}"
     return f"http://localhost:8000/{path}"
+
+
+@dataclasses.dataclass
+class CapturedQuery:
+    """Represent executed SQL query and place in code which executed it."""
+
+    sql: str
+    call_site: str
+
+
+def get_call_site() -> str:
+    """Return innermost project's frame which led to query execution.
+
+    If query is executed by third-party code or tests only (like paginator's
+    COUNT), innermost frame outside of django is returned.
+
+    """
+    fallback = None
+    for frame in reversed(traceback.extract_stack()):
+        path = Path(frame.filename)
+        location = f"{frame.lineno} in {frame.name}"
+        is_project_file = (
+            path.is_relative_to(settings.BASE_DIR)
+            and "site-packages" not in path.parts
+        )
+        if path.name in IGNORED_CALL_SITE_NAMES:
+            continue
+        if is_project_file and not path.name.startswith("test_"):
+            return f"{path.relative_to(settings.BASE_DIR)}:{location}"
+        if fallback is None and f"{os.sep}django{os.sep}" not in str(path):
+            fallback = f"{path}:{location}"
+    return fallback or "<unknown>"
+
+
+class QueriesCapture:
+    """Collect SQL queries executed within context with their call sites."""
+
+    def __init__(self):
+        self.queries: list[CapturedQuery] = []
+
+    def __len__(self):
+        return len(self.queries)
+
+    def __call__(self, execute, sql, params, many, context):
+        """Record query, used as `connection.execute_wrapper`."""
+        if not str(sql).lstrip().upper().startswith(IGNORED_SQL_PREFIXES):
+            self.queries.append(
+                CapturedQuery(sql=str(sql), call_site=get_call_site()),
+            )
+        return execute(sql, params, many, context)
+
+    @contextlib.contextmanager
+    def capture(self):
+        """Capture queries executed within context."""
+        with connection.execute_wrapper(self):
+            yield self
+
+    def get_report(self) -> str:
+        """Return queries grouped by call site, most frequent go first."""
+        grouped_queries = defaultdict(list)
+        for query in self.queries:
+            grouped_queries[query.call_site].append(query.sql)
+        lines = ["Queries grouped by call site:"]
+        for call_site, queries in sorted(
+            grouped_queries.items(),
+            key=lambda item: -len(item[1]),
+        ):
+            lines.append(f"  {len(queries)}x {call_site}")
+            lines.append(f"      {queries[0]}")
+        return "\n".join(lines)
+
+
+def assert_queries_budget(
+    captured: QueriesCapture,
+    budget: int,
+    description: str = "Code",
+) -> None:
+    """Fail test if captured queries count exceeds budget."""
+    if len(captured) <= budget:
+        return
+    pytest.fail(
+        f"{description} made {len(captured)} queries, budget is {budget}.\n"
+        f"{captured.get_report()}",
+        pytrace=False,
+    )
+
+
+@contextlib.contextmanager
+def queries_budget(budget: int, description: str = "Code"):
+    """Fail test if code within context exceeds queries budget.
+
+    Example:
+        with queries_budget(2):
+            list(User.objects.prefetch_related("contacts"))
+
+    """
+    with QueriesCapture().capture() as captured:
+        yield captured
+    assert_queries_budget(captured, budget, description)
+
+
+def get_view_queries_budget(view) -> int | None:
+    """Return queries budget declared by view for its action.
+
+    Views declare budgets in ``queries_budget_map``, which works the same way
+    as ``serializers_map``. Keys are viewset actions, for plain API views
+    keys are lowercase HTTP methods.
+
+    """
+    budget_map = getattr(view, "queries_budget_map", None)
+    if not isinstance(budget_map, dict):
+        return None
+    action = getattr(view, "action", None) or view.request.method.lower()
+    return budget_map.get(action, budget_map.get("default"))
+
+
+class QueriesBudgetAPIClient(test.APIClient):
+    """API client which enforces queries budgets declared by views.
+
+    Every request is checked against ``queries_budget_map`` of the view that
+    handled it, so N+1 regressions fail tests which call the endpoint.
+
+    """
+
+    def request(self, **kwargs):
+        """Make request and check its queries count."""
+        with QueriesCapture().capture() as captured:
+            response = super().request(**kwargs)
+        renderer_context = getattr(response, "renderer_context", None) or {}
+        view = renderer_context.get("view")
+        budget = get_view_queries_budget(view) if view else None
+        if budget is not None:
+            assert_queries_budget(
+                captured,
+                budget,
+                description=(
+                    f"{kwargs['REQUEST_METHOD']} {kwargs['PATH_INFO']} "
+                    f"({view.__class__.__name__})"
+                ),
+            )
+        return response
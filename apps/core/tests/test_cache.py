@@ -0,0 +1,42 @@
+from unittest import mock
+
+from libs.cache import CacheNamespace, local_cache
+from libs.cache.local import LRUCache
+from libs.cache.namespaces import handle_invalidation_message
+
+
+def test_lru_cache_evicts_least_recently_used() -> None:
+    """Ensure LRU cache keeps recently used entries within limit."""
+    lru_cache = LRUCache(max_entries=2, timeout=60)
+    lru_cache.set("first", 1)
+    lru_cache.set("second", 2)
+    lru_cache.get("first")
+    lru_cache.set("third", 3)
+    assert lru_cache.get("first") == 1
+    assert lru_cache.get("second") is None
+    assert len(lru_cache) == 2
+
+
+def test_cache_namespace_invalidate() -> None:
+    """Ensure namespace loads values once until it's invalidated."""
+    namespace = CacheNamespace("test-namespace")
+    loader = mock.Mock(return_value="value")
+    assert namespace.get_or_set("key", loader) == "value"
+    assert namespace.get_or_set("key", loader) == "value"
+    assert loader.call_count == 1
+
+    namespace.invalidate()
+    namespace.get_or_set("key", loader)
+    assert loader.call_count == 2
+
+
+def test_cache_namespace_invalidation_message() -> None:
+    """Ensure in-process entries are dropped by message of other process."""
+    namespace = CacheNamespace("test-namespace")
+    namespace.set("key", "value")
+    cache_key = namespace.make_key("key")
+    assert local_cache.get(cache_key) == "value"
+    handle_invalidation_message({"keys": [cache_key]})
+    assert local_cache.get(cache_key) is None
+    # Value is still available in redis tier
+    assert namespace.get_or_set("key", mock.Mock()) == "value"
@@ -0,0 +1,45 @@
+from django.urls import reverse_lazy
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.users.constants import PrivacyOptions
+
+constants_api = reverse_lazy("v1:constants")
+privacy_choice_api = reverse_lazy("v1:privacy-choice")
+
+
+def test_string_option_api(api_client: APIClient):
+    """Ensure options are returned with cache headers."""
+    response = api_client.get(privacy_choice_api)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["results"] == [
+        {"value": value, "label": label}
+        for value, label in PrivacyOptions.choices
+    ]
+    assert response["ETag"]
+    assert "max-age" in response["Cache-Control"]
+
+
+def test_string_option_api_not_modified(api_client: APIClient):
+    """Ensure 304 is returned for known ETag."""
+    etag = api_client.get(privacy_choice_api)["ETag"]
+    response = api_client.get(privacy_choice_api, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+def test_constants_bundle_api(api_client: APIClient):
+    """Ensure bundle contains options of all constants endpoints."""
+    response = api_client.get(constants_api)
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert set(data) == {
+        "state_choices",
+        "clinician_choices",
+        "specialty_choices",
+        "session_types",
+        "privacy_choices",
+    }
+    assert data["privacy_choices"] == api_client.get(
+        privacy_choice_api,
+    ).json()["results"]
@@ -0,0 +1,19 @@
+from unittest import mock
+
+from libs.db.backends.postgresql_pool.base import get_pool_stats
+
+
+def test_get_pool_stats() -> None:
+    """Ensure pool's wait time and utilization are calculated."""
+    pool = mock.Mock()
+    pool.get_stats.return_value = {
+        "pool_min": 1,
+        "pool_max": 4,
+        "pool_size": 3,
+        "pool_available": 1,
+        "requests_num": 4,
+        "requests_wait_ms": 10,
+    }
+    stats = get_pool_stats(pool)
+    assert stats["requests_wait_avg_ms"] == 2.5
+    assert stats["utilization"] == 0.5
@@ -0,0 +1,44 @@
+from unittest import mock
+
+from django.test import RequestFactory, override_settings
+
+from libs.db import replicas
+from libs.db.routers import ReplicaRouter
+
+from apps.users.models import User
+
+
+@override_settings(DATABASE_REPLICAS=("replica",))
+def test_replica_router():
+    """Ensure reads go to replica only when request allows it."""
+    router = ReplicaRouter()
+    assert router.db_for_read(User) == "default"
+
+    token = replicas.replica_reads_allowed.set(True)
+    try:
+        with mock.patch.object(
+            replicas,
+            "is_replica_usable",
+            return_value=True,
+        ):
+            assert router.db_for_read(User) == "replica"
+        with mock.patch.object(
+            replicas,
+            "is_replica_usable",
+            return_value=False,
+        ):
+            assert router.db_for_read(User) == "default"
+    finally:
+        replicas.replica_reads_allowed.reset(token)
+    assert router.db_for_write(User) == "default"
+
+
+def test_pin_to_primary():
+    """Ensure client which changed data is pinned by IP and credentials."""
+    request = RequestFactory().post("/", HTTP_AUTHORIZATION="Token secret")
+    replicas.pin_to_primary(request)
+    assert replicas.is_pinned_to_primary(request)
+    assert replicas.is_pinned_to_primary(RequestFactory().get("/"))
+    assert not replicas.is_pinned_to_primary(
+        RequestFactory().get("/", REMOTE_ADDR="10.0.0.1"),
+    )
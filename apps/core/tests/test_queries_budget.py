@@ -0,0 +1,25 @@
+import pytest
+
+from apps.core.test_utils import queries_budget
+from apps.users.models import User
+
+
+def test_queries_budget():
+    """Ensure code within budget passes check."""
+    with queries_budget(1) as captured:
+        list(User.objects.all())
+    assert len(captured) == 1
+
+
+def test_queries_budget_exceeded(clinician_user: User):
+    """Ensure exceeded budget fails test and reports call sites."""
+    def check_user_exists_twice():
+        with queries_budget(1):
+            for _ in range(2):
+                User.objects.filter(id=clinician_user.id).exists()
+
+    with pytest.raises(pytest.fail.Exception) as error_info:
+        check_user_exists_twice()
+    message = str(error_info.value)
+    assert "made 2 queries, budget is 1" in message
+    assert "2x" in message
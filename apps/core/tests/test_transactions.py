@@ -0,0 +1,25 @@
+from django.test import RequestFactory
+from django.urls import resolve, reverse_lazy
+
+import pytest
+
+from libs.transactions import is_atomic_request
+
+checkout_url = reverse_lazy("v1:consultation-checkout", kwargs={"pk": 1})
+
+
+@pytest.mark.parametrize(
+    ["method", "url", "is_atomic"],
+    [
+        ["get", reverse_lazy("v1:contact-list"), False],
+        ["post", reverse_lazy("v1:contact-list"), True],
+        ["post", checkout_url, False],
+        ["post", reverse_lazy("v1:attach-payment"), False],
+        ["post", reverse_lazy("v1:password-reset"), True],
+    ],
+)
+def test_is_atomic_request(method: str, url: str, is_atomic: bool):
+    """Ensure only requests which change data run in transaction."""
+    request = getattr(RequestFactory(), method)(url)
+    view_func = resolve(str(url)).func
+    assert is_atomic_request(request, view_func) is is_atomic
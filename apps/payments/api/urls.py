@@ -13,4 +13,9 @@ urlpatterns = [
         views.AttachPaymentMethodAPIView.as_view(),
         name="attach-payment",
     ),
+    path(
+        "stripe-webhook/",
+        views.StripeWebhookAPIView.as_view(),
+        name="stripe-webhook",
+    ),
 ]
@@ -1,14 +1,22 @@
+from django.db import transaction
 from django.db.models import QuerySet
 from django.utils.translation import gettext_lazy as _
 
+from rest_framework import status
 from rest_framework.generics import GenericAPIView
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 
+import stripe
+
 from libs.open_api.serializers import OpenApiSerializer
+from libs.transactions import non_atomic_handler
 
 from apps.payments.services.stripe.session import create_checkout_session
 
+from ..services.events import save_event
+from ..services.stripe.webhook import construct_event
+from ..tasks import schedule_events_processing
 from . import serializers
 
 
@@ -20,6 +28,7 @@ class CheckoutSessionAPIView(GenericAPIView):
     queryset = QuerySet()
     permission_classes = (IsAuthenticated,)
 
+    @non_atomic_handler
     def post(self, request, *args, **kwargs) -> Response:
         """Create stripe checkout session."""
         return Response(data={"data": create_checkout_session()})
@@ -32,6 +41,7 @@ class AttachPaymentMethodAPIView(GenericAPIView):
     queryset = QuerySet()
     permission_classes = (IsAuthenticated,)
 
+    @non_atomic_handler
     def post(self, request, *args, **kwargs) -> Response:
         """Create stripe customer and attach payment method."""
         serializer = self.get_serializer(data=request.data)
@@ -40,3 +50,33 @@ class AttachPaymentMethodAPIView(GenericAPIView):
         return Response(
             data={"data": _("Attach payment method successfully.")},
         )
+
+
+class StripeWebhookAPIView(GenericAPIView):
+    """Receive events from Stripe webhook.
+
+    Events are only verified and stored here, so Stripe gets response
+    immediately. Processing is done by celery in batches.
+
+    """
+
+    serializer_class = OpenApiSerializer
+    queryset = QuerySet()
+    authentication_classes = ()
+    permission_classes = (AllowAny,)
+
+    def post(self, request, *args, **kwargs) -> Response:
+        """Verify and store Stripe event."""
+        try:
+            event = construct_event(
+                payload=request.body,
+                signature=request.headers.get("Stripe-Signature", ""),
+            )
+        except (ValueError, stripe.SignatureVerificationError):
+            return Response(
+                data={"detail": _("Invalid Stripe event.")},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        save_event(event)
+        transaction.on_commit(schedule_events_processing)
+        return Response(status=status.HTTP_200_OK)
@@ -0,0 +1,11 @@
+from django.db.models import TextChoices
+from django.utils.translation import gettext_lazy as _
+
+
+class StripeEventStatus(TextChoices):
+    """Represent processing statuses of received Stripe events."""
+
+    PENDING = "pending", _("Pending")
+    PROCESSED = "processed", _("Processed")
+    SKIPPED = "skipped", _("Skipped")
+    FAILED = "failed", _("Failed")
@@ -0,0 +1,33 @@
+# Generated by Django 5.0.4 on 2026-10-17 23:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0003_stripecheckoutsession'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='stripeaccount',
+            name='charges_enabled',
+            field=models.BooleanField(default=False, verbose_name='Charges enabled'),
+        ),
+        migrations.AddField(
+            model_name='stripeaccount',
+            name='details_submitted',
+            field=models.BooleanField(default=False, verbose_name='Details submitted'),
+        ),
+        migrations.AddField(
+            model_name='stripeaccount',
+            name='synced_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Synced with Stripe at'),
+        ),
+        migrations.AlterField(
+            model_name='stripeaccount',
+            name='stripe_id',
+            field=models.CharField(max_length=255, unique=True, verbose_name='Stripe ID'),
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.0.4 on 2026-10-17 23:22
+
+import django_extensions.db.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0004_stripe_account_mirror'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='stripecheckoutsession',
+            name='payment_status',
+            field=models.CharField(blank=True, help_text='Payment status of session in Stripe.', max_length=32, verbose_name='Payment Status'),
+        ),
+        migrations.AddField(
+            model_name='stripecheckoutsession',
+            name='status',
+            field=models.CharField(blank=True, help_text='Status of session in Stripe, updated by webhooks.', max_length=32, verbose_name='Status'),
+        ),
+        migrations.AlterField(
+            model_name='stripecheckoutsession',
+            name='stripe_id',
+            field=models.CharField(db_index=True, max_length=255, verbose_name='Stripe ID'),
+        ),
+        migrations.CreateModel(
+            name='StripeEvent',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', django_extensions.db.fields.CreationDateTimeField(auto_now_add=True, verbose_name='created')),
+                ('modified', django_extensions.db.fields.ModificationDateTimeField(auto_now=True, verbose_name='modified')),
+                ('stripe_id', models.CharField(max_length=255, unique=True, verbose_name='Stripe ID')),
+                ('type', models.CharField(max_length=255, verbose_name='Type')),
+                ('stripe_created', models.DateTimeField(verbose_name='Created in Stripe at')),
+                ('data', models.JSONField(help_text='Raw event payload.', verbose_name='Data')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('processed', 'Processed'), ('skipped', 'Skipped'), ('failed', 'Failed')], default='pending', verbose_name='Status')),
+                ('processed_at', models.DateTimeField(blank=True, null=True, verbose_name='Processed At')),
+                ('error', models.TextField(blank=True, verbose_name='Error')),
+            ],
+            options={
+                'verbose_name': 'Stripe Event',
+                'verbose_name_plural': 'Stripe Events',
+                'indexes': [models.Index(condition=models.Q(('status', 'pending')), fields=['stripe_created', 'id'], name='payments_event_pending_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.4 on 2026-10-18 00:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0005_stripe_event'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='stripeevent',
+            name='failed_attempts',
+            field=models.PositiveSmallIntegerField(default=0, help_text='Number of times event processing failed.', verbose_name='Failed attempts'),
+        ),
+    ]
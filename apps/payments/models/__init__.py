@@ -1,3 +1,4 @@
 from .accounts import StripeAccount
 from .customer import StripeCustomer
+from .events import StripeEvent
 from .sessions import StripeCheckoutSession
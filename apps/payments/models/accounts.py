@@ -1,11 +1,29 @@
+from django.conf import settings
 from django.db import models
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+import stripe
+
 from apps.core.models import BaseModel
+from apps.payments.services.stripe.account import get_account
+
+# Stripe account's fields which are mirrored in `StripeAccount`
+MIRRORED_ACCOUNT_FIELDS = (
+    "details_submitted",
+    "charges_enabled",
+)
 
 
 class StripeAccount(BaseModel):
-    """Store stripe Account information."""
+    """Store stripe Account information.
+
+    Fields from `MIRRORED_ACCOUNT_FIELDS` mirror state of Stripe account, so
+    it's not fetched from Stripe on each request. Mirror is refreshed from
+    Stripe when it's older than `STRIPE_ACCOUNT_CACHE_TTL` or when Stripe
+    sends `account.updated` webhook event.
+
+    """
 
     user = models.OneToOneField(
         to="users.User",
@@ -16,6 +34,20 @@ class StripeAccount(BaseModel):
     stripe_id = models.CharField(
         verbose_name=_("Stripe ID"),
         max_length=255,
+        unique=True,
+    )
+    details_submitted = models.BooleanField(
+        verbose_name=_("Details submitted"),
+        default=False,
+    )
+    charges_enabled = models.BooleanField(
+        verbose_name=_("Charges enabled"),
+        default=False,
+    )
+    synced_at = models.DateTimeField(
+        verbose_name=_("Synced with Stripe at"),
+        null=True,
+        blank=True,
     )
 
     class Meta:
@@ -24,3 +56,37 @@ class StripeAccount(BaseModel):
 
     def __str__(self):
         return f"Stripe Account for User {self.user_id}"
+
+    @property
+    def is_stale(self) -> bool:
+        """Check if mirrored Stripe data has expired."""
+        return (
+            self.synced_at is None
+            or self.synced_at + settings.STRIPE_ACCOUNT_CACHE_TTL
+            < timezone.now()
+        )
+
+    def sync(self, account: stripe.Account | dict) -> None:
+        """Update mirrored fields from Stripe account data."""
+        for field in MIRRORED_ACCOUNT_FIELDS:
+            setattr(self, field, bool(account.get(field)))
+        self.synced_at = timezone.now()
+        self.save(
+            update_fields=(*MIRRORED_ACCOUNT_FIELDS, "synced_at", "modified"),
+        )
+
+    def refresh_from_stripe(self) -> None:
+        """Fetch account from Stripe and update mirrored fields."""
+        self.sync(get_account(self.stripe_id))
+
+    def refresh_if_stale(self) -> None:
+        """Refresh mirrored fields only if they have expired."""
+        if self.is_stale:
+            self.refresh_from_stripe()
+
+    @classmethod
+    def sync_by_stripe_id(cls, account: stripe.Account | dict) -> None:
+        """Update mirror of account received from Stripe webhook event."""
+        stripe_account = cls.objects.filter(stripe_id=account["id"]).first()
+        if stripe_account:
+            stripe_account.sync(account)
@@ -0,0 +1,72 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from apps.core.models import BaseModel
+
+from ..constants import StripeEventStatus
+
+
+class StripeEvent(BaseModel):
+    """Store raw event received from Stripe webhook.
+
+    Events are saved as soon as they are received and processed later in
+    batches by celery, `stripe_id` is unique, so redelivered events are
+    stored only once. Failed events are retried by periodic sweep until
+    they reach max number of attempts.
+
+    """
+
+    stripe_id = models.CharField(
+        verbose_name=_("Stripe ID"),
+        max_length=255,
+        unique=True,
+    )
+    type = models.CharField(
+        verbose_name=_("Type"),
+        max_length=255,
+    )
+    stripe_created = models.DateTimeField(
+        verbose_name=_("Created in Stripe at"),
+    )
+    data = models.JSONField(
+        verbose_name=_("Data"),
+        help_text=_("Raw event payload."),
+    )
+    status = models.CharField(
+        verbose_name=_("Status"),
+        choices=StripeEventStatus.choices,
+        default=StripeEventStatus.PENDING,
+    )
+    processed_at = models.DateTimeField(
+        verbose_name=_("Processed At"),
+        null=True,
+        blank=True,
+    )
+    error = models.TextField(
+        verbose_name=_("Error"),
+        blank=True,
+    )
+    failed_attempts = models.PositiveSmallIntegerField(
+        verbose_name=_("Failed attempts"),
+        help_text=_("Number of times event processing failed."),
+        default=0,
+    )
+
+    class Meta:
+        verbose_name = _("Stripe Event")
+        verbose_name_plural = _("Stripe Events")
+        indexes = (
+            models.Index(
+                fields=("stripe_created", "id"),
+                condition=models.Q(status=StripeEventStatus.PENDING),
+                name="payments_event_pending_idx",
+            ),
+        )
+
+    def __str__(self):
+        return f"Stripe Event {self.stripe_id} ({self.type})"
+
+    @property
+    def object(self) -> dict:
+        """Return Stripe object which event is about."""
+        return self.data["data"]["object"]
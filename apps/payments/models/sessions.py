@@ -13,6 +13,7 @@ class StripeCheckoutSession(BaseModel):
     stripe_id = models.CharField(
         _("Stripe ID"),
         max_length=255,
+        db_index=True,
     )
     expires_at = models.DateTimeField(
         verbose_name=_("Expires At"),
@@ -23,6 +24,18 @@ class StripeCheckoutSession(BaseModel):
         verbose_name=_("Consultation"),
         related_name="checkout_session",
     )
+    status = models.CharField(
+        verbose_name=_("Status"),
+        max_length=32,
+        blank=True,
+        help_text=_("Status of session in Stripe, updated by webhooks."),
+    )
+    payment_status = models.CharField(
+        verbose_name=_("Payment Status"),
+        max_length=32,
+        blank=True,
+        help_text=_("Payment status of session in Stripe."),
+    )
 
     class Meta:
         verbose_name = _("Stripe Checkout Session")
@@ -0,0 +1,165 @@
+import logging
+import typing
+from datetime import UTC, datetime
+
+from django.db import transaction
+from django.utils import timezone
+
+import stripe
+
+from apps.consultations.constants import ConsultationPaymentStatus
+from apps.consultations.models import Consultation
+
+from ..constants import StripeEventStatus
+from ..models import StripeAccount, StripeCheckoutSession, StripeEvent
+
+logger = logging.getLogger("django")
+
+CHECKOUT_SESSION_PAYMENT_STATUS_MAP = {
+    "checkout.session.completed": ConsultationPaymentStatus.PAID,
+    "checkout.session.async_payment_succeeded": ConsultationPaymentStatus.PAID,
+    "checkout.session.async_payment_failed": ConsultationPaymentStatus.FAILED,
+}
+
+
+def save_event(event: stripe.Event) -> None:
+    """Store received event, events which are already stored are ignored."""
+    StripeEvent.objects.bulk_create(
+        [
+            StripeEvent(
+                stripe_id=event.id,
+                type=event.type,
+                stripe_created=datetime.fromtimestamp(event.created, tz=UTC),
+                data=event.to_dict_recursive(),
+            ),
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def handle_account_updated(event: StripeEvent) -> None:
+    """Update mirror of connected account."""
+    StripeAccount.sync_by_stripe_id(event.object)
+
+
+def handle_checkout_session_event(event: StripeEvent) -> None:
+    """Update checkout session and payment status of its consultation."""
+    session_data = event.object
+    StripeCheckoutSession.objects.filter(
+        stripe_id=session_data["id"],
+    ).update(
+        status=session_data.get("status") or "",
+        payment_status=session_data.get("payment_status") or "",
+        modified=timezone.now(),
+    )
+    payment_status = CHECKOUT_SESSION_PAYMENT_STATUS_MAP.get(event.type)
+    # Completed session may be still unpaid for asynchronous payment methods,
+    # result of such payment comes with separate event
+    is_unpaid_completion = (
+        event.type == "checkout.session.completed"
+        and session_data.get("payment_status") != "paid"
+    )
+    if payment_status is None or is_unpaid_completion:
+        return
+    Consultation.objects.filter(
+        checkout_session__stripe_id=session_data["id"],
+    ).update(
+        payment_status=payment_status,
+        modified=timezone.now(),
+    )
+
+
+EVENT_HANDLERS: dict[str, typing.Callable[[StripeEvent], None]] = {
+    "account.updated": handle_account_updated,
+    "checkout.session.completed": handle_checkout_session_event,
+    "checkout.session.async_payment_succeeded": handle_checkout_session_event,
+    "checkout.session.async_payment_failed": handle_checkout_session_event,
+    "checkout.session.expired": handle_checkout_session_event,
+}
+
+
+def _get_superseded_events(
+    events: list[StripeEvent],
+) -> set[StripeEvent]:
+    """Return events which are followed by same event for same object.
+
+    Events contain full snapshot of object, so only the latest event of
+    the type has to be applied, when Stripe sends bursts of updates.
+
+    """
+    latest_events = {}
+    for event in events:
+        latest_events[(event.type, event.object.get("id"))] = event
+    return set(events) - set(latest_events.values())
+
+
+def process_events(batch_size: int) -> int:
+    """Process batch of pending events in order they were created in Stripe.
+
+    Events are locked with `SKIP LOCKED`, so several workers can process
+    different batches at the same time. Failure of one event doesn't affect
+    others, failed events are kept with error and retried later by
+    `retry_failed_events`.
+
+    Return number of events taken from queue.
+
+    """
+    with transaction.atomic():
+        events = list(
+            StripeEvent.objects.filter(
+                status=StripeEventStatus.PENDING,
+            ).order_by(
+                "stripe_created",
+                "id",
+            ).select_for_update(
+                skip_locked=True,
+            )[:batch_size],
+        )
+        superseded_events = _get_superseded_events(events)
+        for event in events:
+            handler = EVENT_HANDLERS.get(event.type)
+            event.processed_at = timezone.now()
+            if handler is None or event in superseded_events:
+                event.status = StripeEventStatus.SKIPPED
+                continue
+            try:
+                with transaction.atomic():
+                    handler(event)
+            # pylint: disable=broad-except
+            except Exception as error:
+                logger.exception("Failed to process Stripe event %s", event)
+                event.status = StripeEventStatus.FAILED
+                event.error = str(error)
+                event.failed_attempts += 1
+            else:
+                event.status = StripeEventStatus.PROCESSED
+        StripeEvent.objects.bulk_update(
+            events,
+            fields=("status", "processed_at", "error", "failed_attempts"),
+        )
+    return len(events)
+
+
+def retry_failed_events(max_attempts: int) -> int:
+    """Return failed events to queue unless they ran out of attempts.
+
+    Events which failed `max_attempts` times are kept failed with error for
+    investigation.
+
+    Return number of events returned to queue.
+
+    """
+    return StripeEvent.objects.filter(
+        status=StripeEventStatus.FAILED,
+        failed_attempts__lt=max_attempts,
+    ).update(
+        status=StripeEventStatus.PENDING,
+        modified=timezone.now(),
+    )
+
+
+def has_pending_events() -> bool:
+    """Check if there are events waiting for processing."""
+    return StripeEvent.objects.filter(
+        status=StripeEventStatus.PENDING,
+    ).exists()
@@ -0,0 +1,21 @@
+from django.conf import settings
+
+import stripe
+
+from ..stripe import stripe_client
+
+
+def construct_event(payload: bytes, signature: str) -> stripe.Event:
+    """Verify webhook's signature and return received event.
+
+    Raise `ValueError` for invalid payload and
+    `stripe.SignatureVerificationError` for invalid signature.
+
+    Docs: https://stripe.com/docs/webhooks#verify-official-libraries
+
+    """
+    return stripe_client.construct_event(
+        payload=payload,
+        sig_header=signature,
+        secret=settings.STRIPE_WEBHOOK_SECRET,
+    )
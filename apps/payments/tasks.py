@@ -0,0 +1,52 @@
+from django.conf import settings
+from django.core.cache import cache
+
+from celery import shared_task
+
+from .services.events import (
+    has_pending_events,
+    process_events,
+    retry_failed_events,
+)
+
+# Cache key which is set while events processing task is queued
+EVENTS_PROCESSING_SCHEDULED_KEY = "payments:stripe-events-processing"
+EVENTS_PROCESSING_SCHEDULED_TIMEOUT = 60
+
+
+def schedule_events_processing() -> None:
+    """Queue events processing unless it's already queued.
+
+    Webhooks may come in bursts, so single queued task handles all events
+    received before it starts.
+
+    """
+    if cache.add(
+        EVENTS_PROCESSING_SCHEDULED_KEY,
+        True,
+        timeout=EVENTS_PROCESSING_SCHEDULED_TIMEOUT,
+    ):
+        process_stripe_events.delay()
+
+
+@shared_task
+def process_stripe_events() -> None:
+    """Process pending Stripe events, queue next run if batch was full."""
+    cache.delete(EVENTS_PROCESSING_SCHEDULED_KEY)
+    batch_size = settings.STRIPE_EVENTS_BATCH_SIZE
+    if process_events(batch_size) == batch_size:
+        schedule_events_processing()
+
+
+@shared_task
+def sweep_stripe_events() -> None:
+    """Retry failed events and process events which are left pending.
+
+    Processing is queued by webhooks, so without periodic sweep events left
+    by crashed task or failed events would wait for next webhook. The task
+    is run by celery beat, see `CELERY_BEAT_SCHEDULE`.
+
+    """
+    retry_failed_events(settings.STRIPE_EVENTS_MAX_ATTEMPTS)
+    if has_pending_events():
+        schedule_events_processing()
@@ -0,0 +1,93 @@
+import hashlib
+import hmac
+import itertools
+import json
+import time
+
+import stripe
+
+
+class FakeAccountsService:
+    """Keep Stripe accounts in memory instead of calling Stripe API."""
+
+    def __init__(self):
+        self.accounts: dict[str, dict] = {}
+        self.retrieve_calls_count = 0
+        self._ids = itertools.count(1)
+
+    def create(self, params: dict) -> stripe.Account:
+        """Create account which hasn't completed onboarding yet."""
+        account_id = f"acct_{next(self._ids)}"
+        self.accounts[account_id] = {
+            "id": account_id,
+            "email": params["email"],
+            "details_submitted": False,
+            "charges_enabled": False,
+        }
+        return self.retrieve(account_id, count_call=False)
+
+    def retrieve(
+        self,
+        account: str,
+        count_call: bool = True,
+    ) -> stripe.Account:
+        """Return stored account."""
+        if count_call:
+            self.retrieve_calls_count += 1
+        return stripe.Account.construct_from(self.accounts[account], None)
+
+    def update(self, account: str, **fields) -> stripe.Account:
+        """Change stored account as if it was changed in Stripe."""
+        self.accounts[account].update(fields)
+        return self.retrieve(account, count_call=False)
+
+
+class FakeAccountLinksService:
+    """Generate onboarding links without calling Stripe API."""
+
+    def create(self, params: dict) -> stripe.AccountLink:
+        """Return onboarding link for account."""
+        return stripe.AccountLink.construct_from(
+            {
+                "object": "account_link",
+                "url": f"https://connect.stripe.test/{params['account']}",
+            },
+            None,
+        )
+
+
+class FakeStripeClient:
+    """Local replacement of `StripeClient` for tests."""
+
+    def __init__(self):
+        self.accounts = FakeAccountsService()
+        self.account_links = FakeAccountLinksService()
+
+
+def get_event_payload(
+    event_id: str,
+    event_type: str,
+    data_object: dict,
+    created: int | None = None,
+) -> str:
+    """Return body of Stripe webhook request."""
+    return json.dumps(
+        {
+            "id": event_id,
+            "object": "event",
+            "type": event_type,
+            "created": created or int(time.time()),
+            "data": {"object": data_object},
+        },
+    )
+
+
+def get_webhook_signature(payload: str, secret: str) -> str:
+    """Sign webhook payload the same way Stripe does."""
+    timestamp = int(time.time())
+    signature = hmac.new(
+        secret.encode(),
+        f"{timestamp}.{payload}".encode(),
+        hashlib.sha256,
+    ).hexdigest()
+    return f"t={timestamp},v1={signature}"
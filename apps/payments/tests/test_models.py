@@ -0,0 +1,57 @@
+from django.conf import settings
+from django.utils import timezone
+
+from apps.payments.models import StripeAccount
+from apps.payments.test_utils import FakeStripeClient
+from apps.users.models import User
+
+
+def test_stripe_account_served_from_mirror(
+    fake_stripe_client: FakeStripeClient,
+    clinician_user: User,
+):
+    """Ensure fresh account state is not requested from Stripe."""
+    created_account = clinician_user.get_stripe_account()
+    account = clinician_user.get_stripe_account()
+    assert account.stripe_id == created_account.stripe_id
+    assert account.stripe_id in fake_stripe_client.accounts.accounts
+    assert not account.details_submitted
+    assert fake_stripe_client.accounts.retrieve_calls_count == 0
+
+
+def test_stripe_account_refreshed_when_stale(
+    fake_stripe_client: FakeStripeClient,
+    clinician_user: User,
+):
+    """Ensure expired account state is refreshed from Stripe."""
+    account = clinician_user.get_stripe_account()
+    fake_stripe_client.accounts.update(
+        account.stripe_id,
+        details_submitted=True,
+        charges_enabled=True,
+    )
+    StripeAccount.objects.filter(pk=account.pk).update(
+        synced_at=timezone.now() - settings.STRIPE_ACCOUNT_CACHE_TTL * 2,
+    )
+    account = clinician_user.get_stripe_account()
+    assert account.details_submitted
+    assert account.charges_enabled
+    assert fake_stripe_client.accounts.retrieve_calls_count == 1
+
+
+def test_stripe_account_synced_by_webhook_data(
+    fake_stripe_client: FakeStripeClient,
+    clinician_user: User,
+):
+    """Ensure account's mirror is updated from webhook event data."""
+    account = clinician_user.get_stripe_account()
+    StripeAccount.sync_by_stripe_id(
+        fake_stripe_client.accounts.update(
+            account.stripe_id,
+            details_submitted=True,
+        ),
+    )
+    account.refresh_from_db()
+    assert account.details_submitted
+    assert not account.charges_enabled
+    assert fake_stripe_client.accounts.retrieve_calls_count == 0
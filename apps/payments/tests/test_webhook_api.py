@@ -0,0 +1,153 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.urls import reverse_lazy
+from django.utils import timezone
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+import pytest
+
+from apps.consultations.constants import ConsultationPaymentStatus
+from apps.consultations.factories import ConsultationFactory
+from apps.payments.constants import StripeEventStatus
+from apps.payments.models import (
+    StripeAccount,
+    StripeCheckoutSession,
+    StripeEvent,
+)
+from apps.payments.services import events
+from apps.payments.services.events import process_events
+from apps.payments.tasks import sweep_stripe_events
+from apps.payments.test_utils import get_event_payload, get_webhook_signature
+from apps.users.models import User
+
+stripe_webhook_api = reverse_lazy("v1:stripe-webhook")
+
+WEBHOOK_SECRET = "whsec_test"
+
+
+@pytest.fixture(autouse=True)
+def webhook_secret(settings) -> None:
+    """Set secret which test events are signed with."""
+    settings.STRIPE_WEBHOOK_SECRET = WEBHOOK_SECRET
+
+
+def post_event(api_client: APIClient, payload: str, secret=WEBHOOK_SECRET):
+    """Send signed event to webhook."""
+    return api_client.post(
+        stripe_webhook_api,
+        data=payload,
+        content_type="application/json",
+        HTTP_STRIPE_SIGNATURE=get_webhook_signature(payload, secret),
+    )
+
+
+def test_stripe_webhook_api_invalid_signature(api_client: APIClient):
+    """Ensure events with invalid signature are rejected."""
+    payload = get_event_payload("evt_1", "account.updated", {"id": "acct"})
+    response = post_event(api_client, payload, secret="whsec_invalid")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert not StripeEvent.objects.exists()
+
+
+def test_stripe_webhook_api_account_updated(
+    api_client: APIClient,
+    clinician_user: User,
+    django_capture_on_commit_callbacks,
+):
+    """Ensure redelivered event is stored once and updates account."""
+    account = StripeAccount.objects.create(
+        user=clinician_user,
+        stripe_id="acct_1",
+    )
+    payload = get_event_payload(
+        "evt_1",
+        "account.updated",
+        {"id": "acct_1", "details_submitted": True, "charges_enabled": True},
+    )
+    with django_capture_on_commit_callbacks(execute=True):
+        for _ in range(2):
+            response = post_event(api_client, payload)
+            assert response.status_code == status.HTTP_200_OK
+    event = StripeEvent.objects.get()
+    assert event.status == StripeEventStatus.PROCESSED
+    account.refresh_from_db()
+    assert account.details_submitted
+    assert account.charges_enabled
+
+
+def test_stripe_webhook_api_checkout_session_completed(
+    api_client: APIClient,
+    django_capture_on_commit_callbacks,
+):
+    """Ensure paid checkout session marks consultation as paid."""
+    consultation = ConsultationFactory()
+    session = StripeCheckoutSession.objects.create(
+        stripe_id="cs_1",
+        expires_at=timezone.now() + timedelta(hours=1),
+        consultation=consultation,
+    )
+    payload = get_event_payload(
+        "evt_1",
+        "checkout.session.completed",
+        {"id": "cs_1", "status": "complete", "payment_status": "paid"},
+    )
+    with django_capture_on_commit_callbacks(execute=True):
+        response = post_event(api_client, payload)
+    assert response.status_code == status.HTTP_200_OK
+    session.refresh_from_db()
+    assert session.status == "complete"
+    assert session.payment_status == "paid"
+    consultation.refresh_from_db()
+    assert consultation.payment_status == ConsultationPaymentStatus.PAID
+
+
+def test_stripe_events_batch_skips_superseded_events(
+    api_client: APIClient,
+    clinician_user: User,
+):
+    """Ensure only the latest event for the same object is applied."""
+    account = StripeAccount.objects.create(
+        user=clinician_user,
+        stripe_id="acct_1",
+    )
+    created = int(timezone.now().timestamp())
+    for index, details_submitted in enumerate((False, True)):
+        payload = get_event_payload(
+            f"evt_{index}",
+            "account.updated",
+            {"id": "acct_1", "details_submitted": details_submitted},
+            created=created + index,
+        )
+        post_event(api_client, payload)
+    assert process_events(batch_size=10) == 2
+    assert StripeEvent.objects.get(
+        stripe_id="evt_0",
+    ).status == StripeEventStatus.SKIPPED
+    assert StripeEvent.objects.get(
+        stripe_id="evt_1",
+    ).status == StripeEventStatus.PROCESSED
+    account.refresh_from_db()
+    assert account.details_submitted
+
+
+def test_sweep_stripe_events_retries_failed_events(settings):
+    """Ensure failed events are retried until they run out of attempts."""
+    settings.STRIPE_EVENTS_MAX_ATTEMPTS = 2
+    event = StripeEvent.objects.create(
+        stripe_id="evt_1",
+        type="test.failing",
+        stripe_created=timezone.now(),
+        data={"data": {"object": {"id": "obj_1"}}},
+    )
+    handler = mock.Mock(side_effect=ValueError("Failed"))
+    with mock.patch.dict(events.EVENT_HANDLERS, {event.type: handler}):
+        assert process_events(batch_size=10) == 1
+        sweep_stripe_events()
+        event.refresh_from_db()
+        assert event.status == StripeEventStatus.FAILED
+        assert event.failed_attempts == 2
+        sweep_stripe_events()
+    assert handler.call_count == 2
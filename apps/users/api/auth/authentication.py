@@ -0,0 +1,75 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework import exceptions
+
+from knox.auth import TokenAuthentication
+from knox.crypto import hash_token
+from knox.models import AuthToken
+from knox.settings import CONSTANTS
+
+from ...caches import get_auth_token_key
+from ...models import User
+
+# Columns which aren't read while handling requests
+AUTH_USER_DEFERRED_FIELDS = ("search_document", "search_vector")
+INVALID_TOKEN_MESSAGE = _("Invalid token.")
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """Knox authentication which remembers verified tokens.
+
+    Verified token's digest is mapped to user id and expiry in cache, so
+    following requests with the same token don't query tokens table and
+    only fetch user. Entries live until `AUTH_TOKEN_CACHE_TIMEOUT` or
+    token's expiry, and are dropped on logout and user's deactivation.
+
+    """
+
+    def authenticate_credentials(self, token: bytes) -> tuple:
+        """Return user and token, verified tokens are taken from cache."""
+        try:
+            digest = hash_token(token.decode())
+        # Hex decoding errors are subclasses of `ValueError`
+        except (TypeError, ValueError):
+            raise exceptions.AuthenticationFailed(
+                INVALID_TOKEN_MESSAGE,
+            ) from None
+        cached_token = cache.get(get_auth_token_key(digest))
+        if cached_token is None:
+            user, auth_token = super().authenticate_credentials(token)
+            self.cache_token(auth_token)
+            return user, auth_token
+
+        user_id, expiry = cached_token
+        if expiry is not None and expiry < timezone.now():
+            cache.delete(get_auth_token_key(digest))
+            return super().authenticate_credentials(token)
+        user = User.objects.defer(
+            *AUTH_USER_DEFERRED_FIELDS,
+        ).filter(pk=user_id).first()
+        if user is None:
+            raise exceptions.AuthenticationFailed(INVALID_TOKEN_MESSAGE)
+        auth_token = AuthToken(
+            digest=digest,
+            token_key=token[:CONSTANTS.TOKEN_KEY_LENGTH].decode(),
+            user=user,
+            expiry=expiry,
+        )
+        return self.validate_user(auth_token)
+
+    def cache_token(self, auth_token: AuthToken) -> None:
+        """Remember verified token until it expires or cache times out."""
+        timeout = settings.AUTH_TOKEN_CACHE_TIMEOUT
+        if auth_token.expiry is not None:
+            expires_in = (auth_token.expiry - timezone.now()).total_seconds()
+            timeout = min(timeout, int(expires_in))
+        if timeout <= 0:
+            return
+        cache.set(
+            get_auth_token_key(auth_token.digest),
+            (auth_token.user_id, auth_token.expiry),
+            timeout,
+        )
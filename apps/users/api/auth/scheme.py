@@ -2,7 +2,6 @@ from django.utils.translation import gettext_lazy as _
 
 from drf_spectacular.extensions import OpenApiAuthenticationExtension
 from drf_spectacular.utils import extend_schema, extend_schema_view
-from knox.views import LogoutAllView, LogoutView
 
 from libs.open_api.extend_schema import fix_api_view_warning
 from libs.open_api.serializers import DetailSerializer
@@ -13,7 +12,9 @@ from . import serializers, views
 class KnoxTokenScheme(OpenApiAuthenticationExtension):
     """Scheme to describe knox auth scheme."""
 
-    target_class = "knox.auth.TokenAuthentication"
+    target_class = (
+        "apps.users.api.auth.authentication.CachedTokenAuthentication"
+    )
     name = "TokenAuth"
 
     def get_security_definition(self, auto_schema):
@@ -28,8 +29,8 @@ class KnoxTokenScheme(OpenApiAuthenticationExtension):
 
 
 fix_api_view_warning(views.LoginView)
-fix_api_view_warning(LogoutView)
-fix_api_view_warning(LogoutAllView)
+fix_api_view_warning(views.LogoutView)
+fix_api_view_warning(views.LogoutAllView)
 
 extend_schema_view(
     post=extend_schema(
@@ -6,7 +6,6 @@ from django.contrib.auth import (
 )
 from django.contrib.auth.tokens import PasswordResetTokenGenerator
 from django.core.exceptions import ValidationError
-from django.db.models import Q
 from django.utils.encoding import DjangoUnicodeDecodeError, force_str
 from django.utils.http import urlsafe_base64_decode
 from django.utils.translation import gettext_lazy as _
@@ -54,7 +53,7 @@ class AuthTokenSerializer(serializers.Serializer):
         )
 
         # The authenticate call simply returns None for is_active=False
-        # users. (Assuming the default ModelBackend authentication
+        # users. (Assuming the IdentityBackend authentication
         # backend.)
         if not user:
             msg = _("Unable to log in with provided credentials.")
@@ -96,16 +95,14 @@ class PasswordResetSerializer(serializers.Serializer):
 
     def validate_information(self, information: str) -> str:
         """Check that we have user with input email/username/NPI number."""
-        query = User.objects.filter(
-            Q(email=information)
-            | Q(username=information)
-            | Q(npi_number=information),
+        self._user = services.get_user_by_identity(
+            information,
+            with_npi_number=True,
         )
-        if not query.exists():
+        if self._user is None:
             raise ValidationError(
                 _("There is no user with such email/username/NPI number"),
             )
-        self._user = query.first()
         return information
 
     def create(self, validated_data: dict):
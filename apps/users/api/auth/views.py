@@ -6,8 +6,14 @@ from rest_framework.generics import GenericAPIView
 from rest_framework.response import Response
 
 from knox.views import LoginView as KnoxLoginView
+from knox.views import LogoutAllView as KnoxLogoutAllView
+from knox.views import LogoutView as KnoxLogoutView
 
+from libs.api.throttling import IdentifierRateThrottle, IPRateThrottle
+
+from ...caches import invalidate_auth_tokens
 from . import serializers
+from .authentication import CachedTokenAuthentication
 
 
 class LoginView(KnoxLoginView):
@@ -20,6 +26,9 @@ class LoginView(KnoxLoginView):
 
     permission_classes = (permissions.AllowAny,)
     authentication_classes = ()
+    throttle_classes = (IPRateThrottle, IdentifierRateThrottle)
+    throttle_scope = "login"
+    throttle_identifier_field = "username"
 
     def post(self, request, *args, **kwargs):
         """Login user and get auth token with expiry."""
@@ -29,6 +38,30 @@ class LoginView(KnoxLoginView):
         return super().post(request, format=None)
 
 
+class LogoutView(KnoxLogoutView):
+    """Delete current auth token along with its cache entry."""
+
+    authentication_classes = (CachedTokenAuthentication,)
+
+    def post(self, request, *args, **kwargs):
+        """Logout user from current session."""
+        invalidate_auth_tokens([request.auth.digest])
+        return super().post(request, format=None)
+
+
+class LogoutAllView(KnoxLogoutAllView):
+    """Delete all user's auth tokens along with their cache entries."""
+
+    authentication_classes = (CachedTokenAuthentication,)
+
+    def post(self, request, *args, **kwargs):
+        """Logout user from all sessions."""
+        invalidate_auth_tokens(
+            request.user.auth_token_set.values_list("digest", flat=True),
+        )
+        return super().post(request, format=None)
+
+
 class PasswordResetView(GenericAPIView):
     """Change user's password on reset.
 
@@ -39,6 +72,9 @@ class PasswordResetView(GenericAPIView):
 
     permission_classes = (permissions.AllowAny,)
     serializer_class = serializers.PasswordResetSerializer
+    throttle_classes = (IPRateThrottle, IdentifierRateThrottle)
+    throttle_scope = "password-reset"
+    throttle_identifier_field = "information"
 
     def post(self, request, *args, **kwargs):
         """Request password reset.
@@ -86,7 +122,10 @@ class UserRegisterAPIView(KnoxLoginView):
     permission_classes = (permissions.AllowAny,)
     authentication_classes = ()
     serializer_class = serializers.UserRegisterSerializer
-    auth_backend_class = "apps.users.auth_backends.UsernameBackend"
+    throttle_classes = (IPRateThrottle, IdentifierRateThrottle)
+    throttle_scope = "register"
+    throttle_identifier_field = "email"
+    auth_backend_class = "apps.users.auth_backends.IdentityBackend"
 
     def post(self, request, *args, **kwargs):
         """Complete account creation process for user."""
@@ -1,5 +1,3 @@
-from django.db.models import Q
-
 from django_filters import rest_framework as filters
 
 from apps.users.constants import ClinicianType
@@ -19,21 +17,8 @@ class BaseUserSearchFilter(filters.FilterSet):
 
     # pylint: disable=unused-argument
     def filter_by_search(self, queryset, name, value):
-        """Filter by search phrase."""
-        clinician_type_filter_list = [
-            code
-            for code, label in ClinicianType.choices
-            if value.lower() in label.lower()
-        ]
-        return queryset.filter(
-            Q(username__icontains=value)
-            | Q(first_name__icontains=value)
-            | Q(last_name__icontains=value)
-            | Q(entity__icontains=value)
-            | Q(specialty__icontains=value)
-            | Q(clinician_type__in=clinician_type_filter_list)
-            | Q(specialty_area__icontains=value),
-        )
+        """Filter by search phrase, most relevant users go first."""
+        return queryset.search(value)
 
     class Meta:
         model = User
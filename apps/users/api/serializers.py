@@ -1,4 +1,7 @@
 # pylint: disable=abstract-method
+import typing
+
+from django.db import DEFAULT_DB_ALIAS
 from django.utils.translation import gettext_lazy as _
 
 from rest_framework import serializers
@@ -10,8 +13,19 @@ from apps.consultations.api.serializers.consultation_rate import (
 )
 from apps.consultations.constants import TEMPLATES_COUNT
 from apps.core.api.serializers import BaseSerializer, ModelBaseSerializer
+from apps.users.caches import (
+    USER_CARD_FIELDS,
+    user_cards_cache,
+    user_profiles_cache,
+)
 from apps.users.constants import PrivacyFields, PrivacyOptions
 from apps.users.models import Contact, User
+from apps.users.privacy import (
+    PRIVACY_FIELDS_MAP,
+    get_visibility_annotation_name,
+    hide_restricted_fields,
+)
+from apps.users.utils import get_privacy_user_ids
 
 
 class UserBaseSerializer(ModelBaseSerializer):
@@ -32,7 +46,26 @@ class UserBaseSerializer(ModelBaseSerializer):
         )
 
 
-class UserListSerializer(UserBaseSerializer):
+class PrivacyVisibilitySerializerMixin:
+    """Hide user's fields restricted by privacy settings for viewer.
+
+    Visibility is taken from annotations of
+    `UserQuerySet.with_privacy_visibility`, fields of users fetched without
+    them are hidden from everyone but the user.
+
+    """
+
+    def to_representation(self, instance: User) -> dict:
+        """Replace values of hidden fields with `None`."""
+        request = self.context.get("request")
+        return hide_restricted_fields(
+            instance,
+            super().to_representation(instance),
+            viewer=getattr(request, "user", None),
+        )
+
+
+class UserListSerializer(PrivacyVisibilitySerializerMixin, UserBaseSerializer):
     """Serializer for list of users."""
 
     has_contact = serializers.BooleanField(read_only=True)
@@ -46,7 +79,10 @@ class UserListSerializer(UserBaseSerializer):
         )
 
 
-class UserDetailSerializer(ModelBaseSerializer):
+class UserDetailSerializer(
+    PrivacyVisibilitySerializerMixin,
+    ModelBaseSerializer,
+):
     """Represent serializer for user profile."""
 
     avatar = S3DirectUploadURLField(allow_null=True)
@@ -108,13 +144,11 @@ class UserDetailSerializer(ModelBaseSerializer):
 
     def get_total_contacts(self, user: User) -> int:
         """Return total contacts for the user."""
-        if hasattr(user, "total_contacts"):
-            return user.total_contacts
         request = self.context.get("request")
         # Omit check on privacy settings serialization
         if not request:
             return 0
-        return user.contacts.count()
+        return user.total_contacts
 
     def validate(self, attrs) -> dict:
         """Ensure user only provides `TEMPLATES_COUNT` rates to update."""
@@ -142,6 +176,79 @@ class UserDetailSerializer(ModelBaseSerializer):
         rate_serializer.update(updated_instance.rates.all(), updated_rates)
         return updated_instance
 
+    @classmethod
+    def load_profile(cls, user_id: int, context: dict) -> dict:
+        """Serialize profile of user as it's stored in cache.
+
+        Profile is serialized without viewer's annotations, so it contains
+        all fields, which are hidden for viewers later. User is read from
+        primary database, so profile isn't cached from lagging replica
+        after invalidation.
+
+        """
+        user = (
+            User.objects.using(DEFAULT_DB_ALIAS)
+            .defer("search_document", "search_vector")
+            .get(id=user_id)
+        )
+        # Contact status and visibility of fields depend on viewer, they're
+        # overlaid on cached profile
+        user.has_contact = False
+        for privacy_field in PRIVACY_FIELDS_MAP:
+            setattr(user, get_visibility_annotation_name(privacy_field), True)
+        return {
+            "modified": user.modified,
+            "data": dict(cls(instance=user, context=context).data),
+        }
+
+    @classmethod
+    def get_cached_profile(cls, user: User, context: dict) -> dict:
+        """Return profile of user fetched with viewer's annotations.
+
+        Serialized profile is cached by user's id along with `modified`,
+        profile of older `modified` is serialized again. Contact status and
+        visibility of fields depend on viewer, so they're overlaid from
+        `user`'s annotations.
+
+        """
+        profile = user_profiles_cache.get_or_set(
+            user.id,
+            lambda: cls.load_profile(user.id, context),
+        )
+        if profile["modified"] != user.modified:
+            profile = cls.load_profile(user.id, context)
+            user_profiles_cache.set(user.id, profile)
+        data = hide_restricted_fields(
+            user,
+            dict(profile["data"]),
+            viewer=getattr(context.get("request"), "user", None),
+        )
+        data["has_contact"] = user.has_contact
+        return data
+
+
+class UsersImportSerializer(BaseSerializer):
+    """Serializer for CSV file of users import."""
+
+    file = serializers.FileField(
+        help_text=_("CSV file with header row, columns are users' fields."),
+    )
+    dry_run = serializers.BooleanField(default=False)
+
+
+class ImportRowErrorSerializer(BaseSerializer):
+    """Represent errors of users import row."""
+
+    line = serializers.IntegerField()
+    errors = serializers.DictField()
+
+
+class UsersImportResultSerializer(BaseSerializer):
+    """Represent outcome of users import."""
+
+    created_count = serializers.IntegerField()
+    errors = ImportRowErrorSerializer(many=True)
+
 
 class ContactSerializer(ModelBaseSerializer):
     """Serializer for Contact model."""
@@ -158,19 +265,49 @@ class ContactSerializer(ModelBaseSerializer):
         )
 
 
+class UserCardSerializer(ModelBaseSerializer):
+    """Represent compact user's card."""
+
+    class Meta:
+        model = User
+        fields = USER_CARD_FIELDS
+
+    @classmethod
+    def load_cards_map(cls, user_ids: list[int]) -> dict[int, dict]:
+        """Return cards of users by their ids fetched in single query.
+
+        Cards are cached, so they're read from primary database.
+
+        """
+        users = User.objects.using(DEFAULT_DB_ALIAS).filter(
+            id__in=user_ids,
+        ).only(*cls.Meta.fields)
+        return {user.id: dict(cls(instance=user).data) for user in users}
+
+    @classmethod
+    def get_cards_map(cls, user_ids: typing.Iterable[int]) -> dict[int, dict]:
+        """Return cached cards of users, missing ones are fetched at once."""
+        return user_cards_cache.get_many_or_set(user_ids, cls.load_cards_map)
+
+
 class UserListField(serializers.ListField):
-    """Provide user's name and id for representation."""
+    """Represent list of users' ids as users' cards.
 
-    child = serializers.PrimaryKeyRelatedField(queryset=User.objects.all())
+    Cards are taken from `privacy_users` of serializer's context, which is
+    filled by `PrivacySettingsSerializer` for all fields at once.
 
-    def to_representation(self, data) -> list[dict]:
-        """Convert user's id to id-to-name mapping."""
-        users = User.objects.filter(id__in=data)
-        return [UserDetailSerializer(instance=user).data for user in users]
+    """
 
-    def to_internal_value(self, data) -> list[int]:
-        """Return just list of ints."""
-        return data
+    child = serializers.IntegerField(min_value=1)
+
+    def to_representation(self, data) -> list[dict]:
+        """Convert users' ids to their cards."""
+        cards_map = self.context.get("privacy_users")
+        if cards_map is None:
+            cards_map = UserCardSerializer.get_cards_map(data)
+        return [
+            cards_map[user_id] for user_id in data if user_id in cards_map
+        ]
 
 
 class PrivacyFieldSerializer(BaseSerializer):
@@ -180,24 +317,51 @@ class PrivacyFieldSerializer(BaseSerializer):
     users = UserListField(allow_empty=True, required=True)
 
     def validate(self, attrs):
-        """Check that users exist."""
-        users = attrs["users"]
+        """Check that users are provided for custom group.
 
-        if attrs["type"] == PrivacyOptions.CUSTOM and (
-            not users or not User.objects.filter(id__in=users).exists()
-        ):
-            raise serializers.ValidationError("Incorrect user ID was passed.")
+        Existence of users is checked by `PrivacySettingsSerializer`.
 
+        """
+        if attrs["type"] == PrivacyOptions.CUSTOM and not attrs["users"]:
+            raise serializers.ValidationError("Incorrect user ID was passed.")
         return attrs
 
 
 class PrivacySettingsSerializer(BaseSerializer):
-    """Serializer for user's Privacy Settings."""
+    """Serializer for user's Privacy Settings.
+
+    Users of all fields are resolved with single query on both validation
+    and representation.
+
+    """
 
     about_me = PrivacyFieldSerializer(required=True)
     speciality = PrivacyFieldSerializer(required=True)
     practice_area = PrivacyFieldSerializer(required=True)
 
+    def validate(self, attrs) -> dict:
+        """Check that users of all fields exist."""
+        existing_user_ids = set(
+            User.objects.filter(
+                id__in=get_privacy_user_ids(attrs),
+            ).values_list("id", flat=True),
+        )
+        errors = {
+            privacy_field: {"users": "Incorrect user ID was passed."}
+            for privacy_field, privacy_setting in attrs.items()
+            if set(privacy_setting["users"]) - existing_user_ids
+        }
+        if errors:
+            raise serializers.ValidationError(errors)
+        return attrs
+
+    def to_representation(self, instance) -> dict:
+        """Fetch cards of users referenced by any field."""
+        self.context["privacy_users"] = UserCardSerializer.get_cards_map(
+            get_privacy_user_ids(instance),
+        )
+        return super().to_representation(instance)
+
     def update(self, instance: User, validated_data) -> dict:
         for privacy_field in PrivacyFields.values:
             instance.privacy_settings[privacy_field] = {
@@ -218,13 +382,26 @@ class ResponsePrivacySettingsSerializer(BaseSerializer):
     rating = serializers.DictField()
 
 
+class MonthlyEarningsSerializer(BaseSerializer):
+    """Serializer for displaying user's earnings per month."""
+
+    month = serializers.DateField()
+    consultation_count = serializers.IntegerField()
+    earnings = serializers.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        coerce_to_string=False,
+    )
+
+
 class DashboardSerializer(BaseSerializer):
     """Serializer for displaying user's dashboard."""
 
     consultation_count = serializers.IntegerField()
     request_count = serializers.IntegerField()
     earnings = serializers.DecimalField(
-        max_digits=12,
+        max_digits=14,
         decimal_places=2,
         coerce_to_string=False,
     )
+    monthly_earnings = MonthlyEarningsSerializer(many=True)
@@ -1,17 +1,21 @@
-from django.db.models import Prefetch, QuerySet
+import io
+
+from django.db.models import F, QuerySet
 
 from rest_framework import mixins, response
 from rest_framework import serializers as drf_serializers
 from rest_framework.decorators import action
 from rest_framework.generics import get_object_or_404
+from rest_framework.parsers import MultiPartParser
+from rest_framework.permissions import IsAdminUser
 
 from drf_spectacular.utils import extend_schema, inline_serializer
 from localflavor.us import us_states
 
 from libs.api.filter_backends import CustomDjangoFilterBackend
 from libs.open_api.filters import OrderingFilterBackend
+from libs.transactions import non_atomic_handler
 
-from apps.consultations.models import ConsultationRate
 from apps.core.api.views import (
     BaseViewSet,
     ReadOnlyViewSet,
@@ -20,6 +24,7 @@ from apps.core.api.views import (
 from apps.users.constants import SPECIALTY_TYPES, ClinicianType, PrivacyOptions
 from apps.users.models import User
 
+from ..onboarding import import_users
 from ..services import get_dashboard_stats
 from . import filters, serializers
 
@@ -27,24 +32,61 @@ from . import filters, serializers
 class UsersViewSet(ReadOnlyViewSet):
     """ViewSet for viewing accounts."""
 
-    queryset = User.objects.all().prefetch_related(
-        Prefetch(
-            "rates",
-            queryset=ConsultationRate.objects.select_related("template"),
-        ),
-    )
+    queryset = User.objects.all()
     filterset_class = filters.UserFilter
     serializer_class = serializers.UserListSerializer
     serializers_map = {
         "retrieve": serializers.UserDetailSerializer,
+        "import_users": serializers.UsersImportSerializer,
         "default": serializers.UserDetailSerializer,
     }
+    permissions_map = {
+        "import_users": (IsAdminUser,),
+    }
+    queries_budget_map = {
+        "list": 2,
+        "retrieve": 2,
+    }
+    allow_cursor_pagination = True
+    allow_replica_reads = True
     filter_backends = (CustomDjangoFilterBackend, OrderingFilterBackend)
     ordering_fields = ()
 
+    @extend_schema(
+        responses={"200": serializers.UsersImportResultSerializer},
+    )
+    # Users are created in batches, each batch is committed separately
+    @non_atomic_handler
+    @action(
+        detail=False,
+        methods=("post",),
+        url_path="import",
+        parser_classes=(MultiPartParser,),
+    )
+    def import_users(self, request, *args, **kwargs) -> response.Response:
+        """Import users from CSV file, rows with errors are reported."""
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        csv_file = io.TextIOWrapper(
+            serializer.validated_data["file"].file,
+            encoding="utf-8-sig",
+        )
+        result = import_users(
+            csv_file,
+            dry_run=serializer.validated_data["dry_run"],
+        )
+        return response.Response(
+            serializers.UsersImportResultSerializer(result).data,
+        )
+
     # pylint: disable=no-member
     def get_queryset(self):
-        """If no params are provided, filter with current user's specialty."""
+        """If no params are provided, return user's suggestions feed.
+
+        Feed contains users with the same specialty, clinician type and
+        practice state.
+
+        """
         qs = super().get_queryset()
         query_param_list = self.request.query_params
         filter_list = self.filterset_class.declared_filters.keys()
@@ -58,14 +100,22 @@ class UsersViewSet(ReadOnlyViewSet):
             return qs.none()
         user = self.request.user
         if self.action == "list" and not is_filter_provided:
-            qs = qs.filter(
-                specialty__overlap=user.specialty,
-                clinician_type=user.clinician_type,
-                primary_region_practice_state=(
-                    user.primary_region_practice_state
-                ),
-            ).exclude(id=user.id)
-        return qs.with_has_contact(user).with_total_contacts()
+            qs = qs.filter(suggested_to__user=user)
+        qs = qs.with_contact_info(user)
+        if self.action == "retrieve":
+            # Profile is taken from cache, only fields to check it and
+            # viewer's annotations are fetched
+            qs = qs.only("id", "modified")
+        return qs
+
+    def retrieve(self, request, *args, **kwargs) -> response.Response:
+        """Return cached user's profile with viewer's fields."""
+        return response.Response(
+            serializers.UserDetailSerializer.get_cached_profile(
+                self.get_object(),
+                self.get_serializer_context(),
+            ),
+        )
 
 
 # pylint: disable=unused-argument
@@ -76,6 +126,10 @@ class UserProfileViewSet(
 
     queryset = QuerySet()
     serializer_class = serializers.UserDetailSerializer
+    queries_budget_map = {
+        "privacy_settings": 6,
+    }
+    allow_replica_reads = True
 
     def get_object(self) -> User:
         """Return the current logged-in user."""
@@ -119,6 +173,7 @@ class UserProfileViewSet(
             ),
         },
     )
+    @non_atomic_handler
     @action(
         detail=False,
         methods=("post",),
@@ -166,8 +221,8 @@ class UserProfileViewSet(
         account = user.get_stripe_account()
         return response.Response(
             data={
-                "details_submitted": account["details_submitted"],
-                "charges_enabled": account["charges_enabled"],
+                "details_submitted": account.details_submitted,
+                "charges_enabled": account.charges_enabled,
             },
         )
 
@@ -222,6 +277,15 @@ class ContactViewSet(
         "create": serializers.ContactSerializer,
         "default": serializers.UserDetailSerializer,
     }
+    queries_budget_map = {
+        "list": 2,
+        "create": 5,
+        "destroy": 3,
+    }
+    allow_cursor_pagination = True
+    # Contacts are paged in order they were added to contact list
+    cursor_keyset_fields = ("contact_created", "contact_pk")
+    allow_replica_reads = True
     filter_backends = (CustomDjangoFilterBackend, OrderingFilterBackend)
     ordering_fields = ()
 
@@ -231,9 +295,14 @@ class ContactViewSet(
         if getattr(self, "swagger_fake_view", False):
             return qs.none()
         user = self.request.user
-        return qs.filter(
-            id__in=user.contacts.values("contact"),
-        ).with_has_contact(user).with_total_contacts()
+        return (
+            qs.filter(contact_of__owner=user)
+            .annotate(
+                contact_created=F("contact_of__created"),
+                contact_pk=F("contact_of__id"),
+            )
+            .with_contact_info(user)
+        )
 
     def get_object(self):
         """Return contact object on delete."""
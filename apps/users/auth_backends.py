@@ -1,20 +1,31 @@
 from django.contrib.auth import get_user_model
 from django.contrib.auth.backends import ModelBackend
 
+from .services import get_user_by_identity
+
 User = get_user_model()
 
 
-class UsernameBackend(ModelBackend):
-    """Authentication backend for username login."""
+class IdentityBackend(ModelBackend):
+    """Authentication backend for email or username login.
+
+    Account is resolved with single query, so each login attempt checks
+    password exactly once.
+
+    """
 
     # pylint:disable=arguments-differ,arguments-renamed
-    def authenticate(self, request, username=None, password=None):
-        """Check and return user which login with username."""
-        try:
-            user = User.objects.get(username=username)
-        except User.DoesNotExist:
-            # Not need to re-run set_password() again
-            # as it ran once in first backend checking.
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        """Check and return user which login with any of identities."""
+        if username is None:
+            username = kwargs.get(User.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+        user = get_user_by_identity(username)
+        if user is None:
+            # Run the default password hasher once to reduce the timing
+            # difference between an existing and a nonexistent user.
+            User().set_password(password)
             return None
         if user.check_password(password) and self.user_can_authenticate(user):
             return user
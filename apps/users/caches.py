@@ -0,0 +1,48 @@
+import typing
+
+from django.core.cache import cache
+from django.db import transaction
+
+from libs.cache import CacheNamespace
+
+# Fields displayed in compact users' cards, cards are shared by all viewers,
+# so fields restricted by privacy settings aren't included
+USER_CARD_FIELDS = (
+    "id",
+    "first_name",
+    "last_name",
+    "avatar",
+    "clinician_type",
+)
+
+# Namespace is renamed when cards' fields change, so old cards aren't served
+user_cards_cache = CacheNamespace("user-cards-v2")
+
+# Serialized users' profiles along with `modified` they were serialized at
+user_profiles_cache = CacheNamespace("user-profiles")
+
+AUTH_TOKEN_CACHE_KEY = "users:auth-token:{digest}"
+
+
+def invalidate_user_card(user_id: int) -> None:
+    """Drop cached user's card once transaction is committed."""
+    transaction.on_commit(lambda: user_cards_cache.delete(user_id))
+
+
+def invalidate_user_profiles(user_ids: typing.Iterable[int]) -> None:
+    """Drop cached users' profiles once transaction is committed."""
+    user_ids = list(user_ids)
+    if user_ids:
+        transaction.on_commit(lambda: user_profiles_cache.delete(*user_ids))
+
+
+def get_auth_token_key(digest: str) -> str:
+    """Return cache key of verified auth token."""
+    return AUTH_TOKEN_CACHE_KEY.format(digest=digest)
+
+
+def invalidate_auth_tokens(digests: typing.Iterable[str]) -> None:
+    """Drop verified auth tokens from cache once transaction is committed."""
+    keys = [get_auth_token_key(digest) for digest in digests]
+    if keys:
+        transaction.on_commit(lambda: cache.delete_many(keys))
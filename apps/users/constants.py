@@ -2,6 +2,8 @@ from django.db.models import TextChoices
 from django.utils.translation import gettext_lazy as _
 
 PHONE_NUMBER_LENGTH = 10
+# Number of latest months with earnings displayed on dashboard
+DASHBOARD_MONTHS_COUNT = 12
 
 
 class UserRole(TextChoices):
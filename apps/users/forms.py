@@ -0,0 +1,86 @@
+from django import forms
+from django.core.exceptions import ValidationError
+from django.utils.translation import gettext_lazy as _
+
+from .constants import UserRole
+from .models import User
+
+
+class UserImportForm(forms.ModelForm):
+    """Validate row of users import without database queries.
+
+    Model's validation is skipped, because it checks uniqueness with a query
+    per row. Uniqueness of emails, usernames and NPI numbers is checked for
+    all rows at once by `apps.users.onboarding`.
+
+    """
+
+    specialty = forms.CharField(
+        help_text=_("Specialties separated by semicolon."),
+    )
+
+    class Meta:
+        model = User
+        fields = (
+            "email",
+            "username",
+            "first_name",
+            "last_name",
+            "role",
+            "clinician_type",
+            "specialty",
+            "npi_number",
+            "entity",
+            "credentials",
+            "phone_number",
+            "fax_number",
+            "secondary_email",
+            "address",
+            "primary_region_practice_state",
+            "primary_region_practice_zip",
+            "address_state",
+            "address_zip",
+        )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields["first_name"].required = True
+        self.fields["last_name"].required = True
+
+    def clean_specialty(self) -> list[str]:
+        """Split specialties into list."""
+        return [
+            item.strip()
+            for item in self.cleaned_data["specialty"].split(";")
+            if item.strip()
+        ]
+
+    def clean(self) -> dict:
+        """Run model's checks which don't query database."""
+        cleaned_data = super().clean()
+        user = User(**cleaned_data)
+        for field_name in ("npi_number", "phone_number", "fax_number"):
+            if field_name not in cleaned_data:
+                continue
+            try:
+                getattr(user, f"clean_{field_name}")()
+            except ValidationError as error:
+                self.add_error(field_name, error)
+        if user.role == UserRole.CLINICIAN and not user.npi_number:
+            self.add_error(
+                "npi_number",
+                _("Clinician must provide NPI number."),
+            )
+        if (
+            user.email
+            and user.secondary_email
+            and user.email.lower() == user.secondary_email.lower()
+        ):
+            self.add_error(
+                "secondary_email",
+                _("Secondary email and primary email must be different."),
+            )
+        return cleaned_data
+
+    def _post_clean(self) -> None:
+        """Skip model's validation, it checks uniqueness with queries."""
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+
+from ...onboarding import import_users
+
+
+class Command(BaseCommand):
+    """Import users from CSV file."""
+
+    help = "Import users from CSV file, rows with errors are reported."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Path to CSV file with header row.")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            help="Number of users created in one transaction.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only validate rows without creating users.",
+        )
+
+    def handle(self, *args, **options):
+        with open(options["path"], encoding="utf-8-sig", newline="") as file:
+            result = import_users(
+                file,
+                batch_size=options["batch_size"],
+                dry_run=options["dry_run"],
+            )
+        for error in result.errors:
+            self.stderr.write(f"Line {error.line}: {error.errors}")
+        self.stdout.write(
+            f"Created {result.created_count} users, "
+            f"{len(result.errors)} rows have errors.",
+        )
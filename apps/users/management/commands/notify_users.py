@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+
+from libs.notifications.fan_out import fan_out, get_progress
+
+from ...models import User
+from ...notifications import UserAnnouncementEmailNotification
+
+
+class Command(BaseCommand):
+    """Send announcement email to users who allow notifications."""
+
+    help = "Send announcement email to users who allow notifications."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--subject", required=True)
+        parser.add_argument("--message", required=True)
+        parser.add_argument(
+            "--specialty",
+            action="append",
+            default=[],
+            help="Notify only users with the specialty, can be repeated.",
+        )
+
+    def handle(self, *args, **options):
+        users = User.objects.filter(allow_notifications=True, is_active=True)
+        if options["specialty"]:
+            users = users.filter(specialty__overlap=options["specialty"])
+        fan_out_id = fan_out(
+            UserAnnouncementEmailNotification,
+            users,
+            subject=options["subject"],
+            message=options["message"],
+        )
+        progress = get_progress(fan_out_id)
+        self.stdout.write(
+            f"Notification {fan_out_id} is queued for {progress.total} users.",
+        )
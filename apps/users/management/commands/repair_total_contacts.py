@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from libs.db.utils import iterate_pk_chunks
+
+from ...models import User
+
+
+class Command(BaseCommand):
+    """Recompute users' contacts counters from contacts table."""
+
+    help = "Recompute users' contacts counters from contacts table."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of users which are updated in one transaction.",
+        )
+
+    def handle(self, *args, **options):
+        updated_count = 0
+        for user_ids in iterate_pk_chunks(
+            User.objects.all(),
+            chunk_size=options["batch_size"],
+        ):
+            updated_count += User.objects.filter(
+                id__in=user_ids,
+            ).refresh_total_contacts()
+        self.stdout.write(
+            f"Contacts counters of {updated_count} users are updated.",
+        )
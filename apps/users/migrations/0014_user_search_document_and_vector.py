@@ -0,0 +1,60 @@
+# Generated by Django 5.0.4 on 2026-10-17 23:12
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.operations
+import django.contrib.postgres.search
+import django.db.models.functions.text
+from django.db import migrations, models
+
+from apps.users.search import (
+    get_search_document_expression,
+    get_search_vector_expression,
+)
+
+
+def fill_search_fields(apps, schema_editor) -> None:
+    """Fill search fields for existing users."""
+    User = apps.get_model("users", "User")
+    User.objects.update(
+        search_document=get_search_document_expression(),
+        search_vector=get_search_vector_expression(),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0013_user_credentials'),
+    ]
+
+    operations = [
+        django.contrib.postgres.operations.TrigramExtension(),
+        migrations.AddField(
+            model_name='user',
+            name='search_document',
+            field=models.TextField(blank=True, editable=False, help_text='Searchable fields joined into single string.', verbose_name='Search document'),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True, verbose_name='Search vector'),
+        ),
+        migrations.RunPython(
+            fill_search_fields,
+            reverse_code=migrations.RunPython.noop,
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='clinician_type',
+            field=models.CharField(choices=[('crna', 'Certified Registered Nurse Anesthetist (CRNA)'), ('np', 'Nurse Practitioner (NP)'), ('pa', 'Physician Assistant (PA)'), ('pa_aa', 'Physician Assistant - Anesthesia Assistant (PA-AA)'), ('do', 'Physician: Doctor of Osteopathy (DO)'), ('md', 'Physician: Medical Doctor (MD)'), ('stu', 'Student/In-Training')], db_index=True, max_length=50, verbose_name='Clinician Type'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='users_user_search_vector_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('search_document'), name='gin_trgm_ops'), name='users_user_search_doc_trgm_idx'),
+        ),
+    ]
@@ -0,0 +1,79 @@
+# Generated by Django 5.0.4 on 2026-10-17 23:27
+
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+import django_extensions.db.fields
+from django.conf import settings
+from django.db import migrations, models
+
+
+def fill_suggestions(apps, schema_editor) -> None:
+    """Build suggestions feed for existing users."""
+    connection = schema_editor.connection
+    user_table = connection.ops.quote_name(
+        apps.get_model("users", "User")._meta.db_table,
+    )
+    suggestion_table = connection.ops.quote_name(
+        apps.get_model("users", "UserSuggestion")._meta.db_table,
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            INSERT INTO {suggestion_table}
+                (created, modified, user_id, suggested_user_id)
+            SELECT NOW(), NOW(), viewer.id, suggested.id
+            FROM {user_table} viewer
+            JOIN {user_table} suggested
+                ON suggested.specialty && viewer.specialty
+                AND suggested.clinician_type = viewer.clinician_type
+                AND suggested.primary_region_practice_state
+                    = viewer.primary_region_practice_state
+                AND suggested.id <> viewer.id
+            ON CONFLICT (user_id, suggested_user_id) DO NOTHING
+            """,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0014_user_search_document_and_vector'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserSuggestion',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', django_extensions.db.fields.CreationDateTimeField(auto_now_add=True, verbose_name='created')),
+                ('modified', django_extensions.db.fields.ModificationDateTimeField(auto_now=True, verbose_name='modified')),
+            ],
+            options={
+                'verbose_name': 'User Suggestion',
+                'verbose_name_plural': 'User Suggestions',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['specialty'], name='users_user_specialty_idx'),
+        ),
+        migrations.AddField(
+            model_name='usersuggestion',
+            name='suggested_user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='suggested_to', to=settings.AUTH_USER_MODEL, verbose_name='Suggested user'),
+        ),
+        migrations.AddField(
+            model_name='usersuggestion',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='suggestions', to=settings.AUTH_USER_MODEL, verbose_name='User who gets the suggestion'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='usersuggestion',
+            unique_together={('user', 'suggested_user')},
+        ),
+        migrations.RunPython(
+            code=fill_suggestions,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
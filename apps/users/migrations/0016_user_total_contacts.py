@@ -0,0 +1,40 @@
+# Generated by Django 5.0.4 on 2026-10-17 23:29
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def fill_total_contacts(apps, schema_editor) -> None:
+    """Count contacts of existing users."""
+    User = apps.get_model("users", "User")
+    Contact = apps.get_model("users", "Contact")
+    User.objects.update(
+        total_contacts=Coalesce(
+            models.Subquery(
+                Contact.objects.filter(owner=models.OuterRef("id"))
+                .values("owner")
+                .annotate(count=models.Count("id"))
+                .values("count"),
+            ),
+            0,
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0015_user_suggestion'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='total_contacts',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text="Number of user's contacts, updated with contacts.", verbose_name='Total contacts'),
+        ),
+        migrations.RunPython(
+            code=fill_total_contacts,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
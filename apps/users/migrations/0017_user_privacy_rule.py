@@ -0,0 +1,47 @@
+# Generated by Django 5.0.4 on 2026-10-17 23:33
+
+import django.db.models.deletion
+import django_extensions.db.fields
+from django.conf import settings
+from django.db import migrations, models
+
+from apps.users.privacy import rebuild_privacy_rules
+
+
+def fill_privacy_rules(apps, schema_editor) -> None:
+    """Compile privacy settings of existing users."""
+    rebuild_privacy_rules(
+        user_model=apps.get_model("users", "User"),
+        rule_model=apps.get_model("users", "UserPrivacyRule"),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0016_user_total_contacts'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserPrivacyRule',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', django_extensions.db.fields.CreationDateTimeField(auto_now_add=True, verbose_name='created')),
+                ('modified', django_extensions.db.fields.ModificationDateTimeField(auto_now=True, verbose_name='modified')),
+                ('field', models.CharField(choices=[('about_me', 'About me'), ('speciality', 'Specialty'), ('practice_area', 'Current area of Practice/Speciality')], verbose_name='Field')),
+                ('option', models.CharField(choices=[('public', 'Public'), ('contacts', 'My Contacts'), ('only_me', 'Only Me'), ('custom', 'Custom group'), ('custom_inv', 'Custom group Inverse')], verbose_name='Option')),
+                ('member', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Member of custom group')),
+                ('owner', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='privacy_rules', to=settings.AUTH_USER_MODEL, verbose_name='User whose field is restricted')),
+            ],
+            options={
+                'verbose_name': 'User Privacy Rule',
+                'verbose_name_plural': 'User Privacy Rules',
+                'indexes': [models.Index(fields=['owner', 'field', 'option', 'member'], name='users_privacy_rule_lookup_idx')],
+            },
+        ),
+        migrations.RunPython(
+            code=fill_privacy_rules,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.0.4 on 2026-10-17 23:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0017_user_privacy_rule'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['npi_number'], name='users_user_npi_number_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.0.4 on 2026-10-18 00:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0018_user_npi_number_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(fields=['owner', 'created', 'id'], name='users_contact_owner_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['created', 'id'], name='users_user_created_id_idx'),
+        ),
+    ]
@@ -1,11 +1,17 @@
+import copy
+import typing
+
 from django.conf import settings
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
 from django.contrib.auth.models import UserManager as DjangoUserManager
 from django.contrib.postgres import fields as postgres_fields
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
 from django.core.exceptions import ValidationError
 from django.core.validators import RegexValidator
-from django.db import models
+from django.db import models, transaction
 from django.db.models import Q
+from django.db.models.functions import Upper
 from django.utils.translation import gettext_lazy as _
 
 import citext
@@ -14,17 +20,39 @@ from imagekit import models as imagekitmodels
 from imagekit.processors import ResizeToFill, Transpose
 from localflavor.us import us_states
 
-from apps.consultations.services import create_default_consultation_rates
+from apps.consultations.models import Consultation
+from apps.consultations.services import (
+    create_default_consultation_rates,
+    refresh_users_consultation_stats,
+)
 from apps.core.models import BaseModel
 from apps.payments.services.stripe.account import (
     create_account,
     create_account_link,
-    get_account,
 )
 
 from ..payments.models import StripeAccount
-from .constants import PHONE_NUMBER_LENGTH, ClinicianType, UserRole
-from .querysets import UserQuerySet
+from .caches import (
+    USER_CARD_FIELDS,
+    invalidate_auth_tokens,
+    invalidate_user_card,
+    invalidate_user_profiles,
+)
+from .constants import (
+    PHONE_NUMBER_LENGTH,
+    ClinicianType,
+    PrivacyFields,
+    PrivacyOptions,
+    UserRole,
+)
+from .privacy import get_privacy_rules_data
+from .querysets import ContactQuerySet, UserQuerySet
+from .search import (
+    SEARCH_FIELDS,
+    get_search_document_expression,
+    get_search_vector_expression,
+)
+from .suggestions import SUGGESTION_FIELDS
 from .utils import (
     default_privacy_settings,
     is_valid_npi_number,
@@ -113,6 +141,7 @@ class User(
         verbose_name=_("Clinician Type"),
         max_length=50,
         choices=ClinicianType.choices,
+        db_index=True,
     )
     specialty = postgres_fields.ArrayField(
         verbose_name=_("Specialty"),
@@ -244,27 +273,250 @@ class User(
     privacy_settings = models.JSONField(
         default=default_privacy_settings,
     )
+    search_document = models.TextField(
+        verbose_name=_("Search document"),
+        blank=True,
+        editable=False,
+        help_text=_("Searchable fields joined into single string."),
+    )
+    search_vector = SearchVectorField(
+        verbose_name=_("Search vector"),
+        null=True,
+        editable=False,
+    )
+    total_contacts = models.PositiveIntegerField(
+        verbose_name=_("Total contacts"),
+        default=0,
+        editable=False,
+        help_text=_("Number of user's contacts, updated with contacts."),
+    )
 
     EMAIL_FIELD = "email"
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = []
 
+    # Counters which are changed only with atomic updates, full saves of
+    # instances loaded before the update mustn't overwrite them
+    COUNTER_FIELDS = ("total_contacts",)
+
     objects = UserManager()
 
     class Meta:
         verbose_name = _("User")
         verbose_name_plural = _("Users")
+        indexes = (
+            GinIndex(
+                fields=("search_vector",),
+                name="users_user_search_vector_idx",
+            ),
+            # Used by `icontains` lookups which are compiled to
+            # `UPPER(field) LIKE UPPER(%s)`
+            GinIndex(
+                OpClass(Upper("search_document"), name="gin_trgm_ops"),
+                name="users_user_search_doc_trgm_idx",
+            ),
+            # Used by `overlap` and `contains` lookups on specialty
+            GinIndex(
+                fields=("specialty",),
+                name="users_user_specialty_idx",
+            ),
+            # Used to find account by NPI number on password reset
+            models.Index(
+                fields=("npi_number",),
+                name="users_user_npi_number_idx",
+            ),
+            # Used by keyset pagination of users list
+            models.Index(
+                fields=("created", "id"),
+                name="users_user_created_id_idx",
+            ),
+        )
 
     def __str__(self):
         # pylint: disable=invalid-str-returned
         return self.email
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember loaded privacy settings, suggestion fields and status.
+
+        They are used to track changes.
+
+        """
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_privacy_settings = copy.deepcopy(
+            instance.__dict__.get("privacy_settings"),
+        )
+        instance._loaded_suggestion_values = (
+            instance.get_suggestion_values()
+        )
+        instance._loaded_is_active = instance.__dict__.get("is_active")
+        return instance
+
+    def get_suggestion_values(self) -> dict:
+        """Return loaded values of fields suggestions feed depends on."""
+        return {
+            field_name: copy.deepcopy(self.__dict__.get(field_name))
+            for field_name in SUGGESTION_FIELDS
+        }
+
     def save(self, has_rates=False, *args, **kwargs) -> None:
-        """Create default rates if user is created without providing rates."""
+        """Create default rates if user is created without providing rates.
+
+        Also refresh search fields, suggestions feed, compiled privacy
+        rules and cached card if fields they depend on were saved. Cached
+        profile is dropped on any change, cached auth tokens are dropped
+        when user is deactivated. Fields saved for existing users are
+        decided by `get_update_fields`.
+
+        """
+        is_created = self._state.adding
+        if not (is_created or kwargs.get("force_insert")):
+            kwargs["update_fields"] = self.get_update_fields(
+                kwargs.get("update_fields"),
+            )
+        is_deactivated = (
+            getattr(self, "_loaded_is_active", False) and not self.is_active
+        )
+        is_privacy_changed = is_created or (
+            self.privacy_settings
+            != getattr(self, "_loaded_privacy_settings", None)
+        )
+        is_suggestions_changed = is_created or (
+            self.get_suggestion_values()
+            != getattr(self, "_loaded_suggestion_values", None)
+        )
         super().save(*args, **kwargs)
+        update_fields = kwargs.get("update_fields")
+        if not is_created and (
+            update_fields is None or set(update_fields) & set(USER_CARD_FIELDS)
+        ):
+            invalidate_user_card(self.pk)
+        if not is_created:
+            invalidate_user_profiles([self.pk])
+        if is_deactivated and (
+            update_fields is None or "is_active" in update_fields
+        ):
+            invalidate_auth_tokens(
+                self.auth_token_set.values_list("digest", flat=True),
+            )
+        self._loaded_is_active = self.is_active
+        if is_privacy_changed and (
+            update_fields is None or "privacy_settings" in update_fields
+        ):
+            self.update_privacy_rules()
+        if update_fields is None or set(update_fields) & set(SEARCH_FIELDS):
+            self.update_search_fields()
+        if is_suggestions_changed and (
+            update_fields is None
+            or set(update_fields) & set(SUGGESTION_FIELDS)
+        ):
+            self.update_suggestions()
         if not has_rates and self.rates.count() == 0:
             create_default_consultation_rates(self)
 
+    def get_update_fields(
+        self,
+        update_fields: typing.Iterable[str] | None,
+    ) -> typing.Iterable[str]:
+        """Return fields written by save of existing user.
+
+        Full saves write loaded fields except `COUNTER_FIELDS`. Cached
+        profile is checked against `modified`, so it's saved along with any
+        fields.
+
+        """
+        if update_fields is None:
+            deferred_fields = self.get_deferred_fields()
+            return [
+                field.attname
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.attname not in deferred_fields
+                and field.name not in self.COUNTER_FIELDS
+            ]
+        if not update_fields:
+            return update_fields
+        return {*update_fields, "modified"}
+
+    def update_search_fields(self) -> None:
+        """Recalculate `search_document` and `search_vector` in database."""
+        User.objects.filter(pk=self.pk).update(
+            search_document=get_search_document_expression(),
+            search_vector=get_search_vector_expression(),
+        )
+
+    def delete(self, *args, **kwargs):
+        """Update contacts counters of users who had the user as contact.
+
+        Contacts of deleted user are removed by cascade, which bypasses
+        `ContactQuerySet.delete`. Consultations are removed by cascade too,
+        so consultation stats of users on other side are recomputed. Cached
+        user's card and profile are dropped as well.
+
+        """
+        invalidate_user_card(self.pk)
+        invalidate_user_profiles([self.pk])
+        with transaction.atomic():
+            owner_ids = set(self.contact_of.values_list("owner_id", flat=True))
+            consultation_user_ids = {
+                user_id
+                for user_ids in Consultation.objects.filter(
+                    Q(from_user=self) | Q(to_user=self),
+                ).values_list("from_user_id", "to_user_id")
+                for user_id in user_ids
+            } - {self.pk}
+            result = super().delete(*args, **kwargs)
+            User.objects.filter(id__in=owner_ids).refresh_total_contacts()
+            refresh_users_consultation_stats(consultation_user_ids)
+        return result
+
+    def update_privacy_rules(self) -> None:
+        """Compile privacy settings into `UserPrivacyRule` rows."""
+        with transaction.atomic():
+            self.privacy_rules.all().delete()
+            UserPrivacyRule.objects.bulk_create(
+                UserPrivacyRule(owner=self, **rule_data)
+                for rule_data in get_privacy_rules_data(
+                    self.privacy_settings,
+                )
+            )
+        self._loaded_privacy_settings = copy.deepcopy(self.privacy_settings)
+
+    def update_suggestions(self) -> None:
+        """Refresh entries of suggestions feed which involve the user.
+
+        Feed is symmetric, so user is removed from feeds of previous matches
+        and added to feeds of current ones. Entries inserted concurrently by
+        saves of matched users are skipped.
+
+        """
+        with transaction.atomic():
+            matched_user_ids = list(
+                User.objects.filter(
+                    specialty__overlap=self.specialty,
+                    clinician_type=self.clinician_type,
+                    primary_region_practice_state=(
+                        self.primary_region_practice_state
+                    ),
+                ).exclude(id=self.id).values_list("id", flat=True),
+            )
+            UserSuggestion.objects.filter(
+                Q(user=self) | Q(suggested_user=self),
+            ).delete()
+            UserSuggestion.objects.bulk_create(
+                [
+                    UserSuggestion(user=self, suggested_user_id=user_id)
+                    for user_id in matched_user_ids
+                ] + [
+                    UserSuggestion(user_id=user_id, suggested_user=self)
+                    for user_id in matched_user_ids
+                ],
+                batch_size=1000,
+                ignore_conflicts=True,
+            )
+        self._loaded_suggestion_values = self.get_suggestion_values()
+
     def clean_npi_number(self) -> None:
         """Ensure `npi_number` is a string of 10 numbers."""
         if self.npi_number and not is_valid_npi_number(self.npi_number):
@@ -314,19 +566,31 @@ class User(
         if errors:
             raise ValidationError(errors)
 
-    def get_stripe_account(self) -> stripe.Account:
-        """Fetch linked Stripe Account."""
+    def get_stripe_account(self) -> StripeAccount:
+        """Return linked Stripe Account, create it in Stripe if missing.
+
+        Account's state is served from local mirror, Stripe is requested only
+        if mirror has expired.
+
+        """
         stripe_account = StripeAccount.objects.filter(user=self).first()
         if stripe_account:
-            return get_account(stripe_account.stripe_id)
+            stripe_account.refresh_if_stale()
+            return stripe_account
         account = create_account(self.email)
-        StripeAccount(stripe_id=account.stripe_id, user=self).save()
-        return account
+        # Transaction is opened after Stripe has responded
+        with transaction.atomic():
+            stripe_account = StripeAccount.objects.create(
+                stripe_id=account.id,
+                user=self,
+            )
+            stripe_account.sync(account)
+        return stripe_account
 
     def get_account_link(self) -> stripe.AccountLink:
         """Generate Stripe Account Link."""
         account = self.get_stripe_account()
-        account_link = create_account_link(account_id=account["id"])
+        account_link = create_account_link(account_id=account.stripe_id)
         return account_link
 
 
@@ -346,10 +610,128 @@ class Contact(BaseModel):
         related_name="contact_of",
     )
 
+    objects = ContactQuerySet.as_manager()
+
     class Meta:
         verbose_name = _("Contact")
         verbose_name_plural = _("Contacts")
         unique_together = ("owner", "contact")
+        indexes = (
+            # Used by keyset pagination of user's contacts
+            models.Index(
+                fields=("owner", "created", "id"),
+                name="users_contact_owner_keyset_idx",
+            ),
+        )
 
     def __str__(self):
         return f"Contact of {self.owner_id} - {self.contact_id}"
+
+    def save(self, *args, **kwargs) -> None:
+        """Increment owner's contacts counter when contact is created.
+
+        Owner's cached profile displays the counter, so it's dropped.
+
+        """
+        is_created = self._state.adding
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if is_created:
+                User.objects.filter(id=self.owner_id).update(
+                    total_contacts=models.F("total_contacts") + 1,
+                )
+                invalidate_user_profiles([self.owner_id])
+
+    def delete(self, *args, **kwargs):
+        """Decrement owner's contacts counter and drop cached profile.
+
+        Counter isn't changed if contact was already deleted, for example
+        by cascade from deleted user.
+
+        """
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            # Number of deleted objects is zero, if contact was deleted before
+            if result[0]:
+                User.objects.filter(id=self.owner_id).update(
+                    total_contacts=models.F("total_contacts") - 1,
+                )
+                invalidate_user_profiles([self.owner_id])
+        return result
+
+
+class UserSuggestion(BaseModel):
+    """Represent precomputed feed of users suggested to user.
+
+    Feed is used by default users list, it's updated by `User.save` when
+    fields from `SUGGESTION_FIELDS` change.
+
+    """
+
+    user = models.ForeignKey(
+        to=User,
+        on_delete=models.CASCADE,
+        verbose_name=_("User who gets the suggestion"),
+        related_name="suggestions",
+    )
+    suggested_user = models.ForeignKey(
+        to=User,
+        on_delete=models.CASCADE,
+        verbose_name=_("Suggested user"),
+        related_name="suggested_to",
+    )
+
+    class Meta:
+        verbose_name = _("User Suggestion")
+        verbose_name_plural = _("User Suggestions")
+        unique_together = ("user", "suggested_user")
+
+    def __str__(self):
+        return f"Suggestion for {self.user_id} - {self.suggested_user_id}"
+
+
+class UserPrivacyRule(BaseModel):
+    """Represent user's privacy settings compiled for set-based checks.
+
+    Rows are rebuilt from `User.privacy_settings` on change. Each field has a
+    row without member storing selected option and a row per member of custom
+    group, so visibility of fields for a viewer is checked with indexed
+    lookups instead of parsing JSON of each user.
+
+    """
+
+    owner = models.ForeignKey(
+        to=User,
+        on_delete=models.CASCADE,
+        verbose_name=_("User whose field is restricted"),
+        related_name="privacy_rules",
+    )
+    field = models.CharField(
+        verbose_name=_("Field"),
+        choices=PrivacyFields.choices,
+    )
+    option = models.CharField(
+        verbose_name=_("Option"),
+        choices=PrivacyOptions.choices,
+    )
+    member = models.ForeignKey(
+        to=User,
+        on_delete=models.CASCADE,
+        verbose_name=_("Member of custom group"),
+        related_name="+",
+        null=True,
+        blank=True,
+    )
+
+    class Meta:
+        verbose_name = _("User Privacy Rule")
+        verbose_name_plural = _("User Privacy Rules")
+        indexes = (
+            models.Index(
+                fields=("owner", "field", "option", "member"),
+                name="users_privacy_rule_lookup_idx",
+            ),
+        )
+
+    def __str__(self):
+        return f"Privacy rule of {self.owner_id} - {self.field}"
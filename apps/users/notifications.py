@@ -4,11 +4,8 @@ from django.utils.translation import gettext_lazy as _
 from libs.notifications.email import DefaultEmailNotification
 
 
-class UserPasswordResetEmailNotification(DefaultEmailNotification):
-    """Used to send email with password reset link."""
-
-    subject = _("Password Reset")
-    template = "users/emails/password_reset.html"
+class UserEmailNotification(DefaultEmailNotification):
+    """Base class for emails which are sent to user."""
 
     def __init__(self, user, **template_context):
         super().__init__(**template_context)
@@ -21,8 +18,33 @@ class UserPasswordResetEmailNotification(DefaultEmailNotification):
     def get_template_context(self):
         """Get email's template context."""
         self.template_context.update(
-            new_password_url=settings.FRONTEND_URL + settings.NEW_PASSWORD_URL,
+            user=self.user,
             app_url=settings.FRONTEND_URL,
             app_label=settings.APP_LABEL,
         )
         return self.template_context
+
+
+class UserPasswordResetEmailNotification(UserEmailNotification):
+    """Used to send email with password reset link."""
+
+    subject = _("Password Reset")
+    template = "users/emails/password_reset.html"
+
+    def get_template_context(self):
+        """Get email's template context."""
+        return super().get_template_context() | {
+            "new_password_url": (
+                settings.FRONTEND_URL + settings.NEW_PASSWORD_URL
+            ),
+        }
+
+
+class UserAnnouncementEmailNotification(UserEmailNotification):
+    """Used to announce news to users.
+
+    Expects `subject` and `message` which are the same for all users.
+
+    """
+
+    template = "users/emails/announcement.html"
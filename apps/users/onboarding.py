@@ -0,0 +1,185 @@
+import csv
+import dataclasses
+import typing
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils.translation import gettext_lazy as _
+
+from apps.consultations.services import bulk_create_default_consultation_rates
+
+from .forms import UserImportForm
+from .models import User, UserPrivacyRule, UserSuggestion
+from .privacy import get_privacy_rules_data
+from .search import (
+    get_search_document_expression,
+    get_search_vector_expression,
+)
+from .suggestions import rebuild_suggestions
+
+EMAIL_EXISTS_ERROR = _("User with this email already exists.")
+USERNAME_EXISTS_ERROR = _("User with this username already exists.")
+NPI_NUMBER_EXISTS_ERROR = _("User with this NPI number already exists")
+
+
+@dataclasses.dataclass
+class ImportRowError:
+    """Represent errors of CSV row which wasn't imported."""
+
+    line: int
+    errors: dict
+
+
+@dataclasses.dataclass
+class UsersImportResult:
+    """Represent outcome of users import."""
+
+    created_count: int = 0
+    errors: list[ImportRowError] = dataclasses.field(default_factory=list)
+
+
+def read_rows(csv_file: typing.IO[str]) -> typing.Iterator[tuple[int, dict]]:
+    """Yield CSV rows along with their line numbers."""
+    reader = csv.DictReader(csv_file)
+    for row in reader:
+        yield reader.line_num, {
+            key.strip(): value.strip()
+            for key, value in row.items()
+            if key and value is not None
+        }
+
+
+def validate_rows(
+    rows: typing.Iterable[tuple[int, dict]],
+) -> tuple[list[tuple[int, dict]], list[ImportRowError]]:
+    """Validate rows and their uniqueness.
+
+    Rows are validated without queries first, then uniqueness of emails,
+    usernames and NPI numbers of all valid rows is checked with single
+    query per field, both against existing users and previous rows.
+
+    """
+    valid_rows, errors = [], []
+    for line, row in rows:
+        form = UserImportForm(data=row)
+        if form.is_valid():
+            valid_rows.append((line, form.cleaned_data))
+        else:
+            errors.append(
+                ImportRowError(
+                    line,
+                    {
+                        field_name: list(field_errors)
+                        for field_name, field_errors in form.errors.items()
+                    },
+                ),
+            )
+
+    emails = {
+        email.lower()
+        for _, data in valid_rows
+        for email in (data["email"], data.get("secondary_email"))
+        if email
+    }
+    taken_emails = {
+        email.lower()
+        for email_pair in User.objects.filter(
+            Q(email__in=emails) | Q(secondary_email__in=emails),
+        ).values_list("email", "secondary_email")
+        for email in email_pair
+        if email
+    }
+    taken_usernames = set(
+        User.objects.filter(
+            username__in={data["username"] for _, data in valid_rows},
+        ).values_list("username", flat=True),
+    )
+    taken_npi_numbers = set(
+        User.objects.filter(
+            npi_number__in={
+                data["npi_number"]
+                for _, data in valid_rows
+                if data.get("npi_number")
+            },
+        ).values_list("npi_number", flat=True),
+    )
+
+    unique_rows = []
+    for line, data in valid_rows:
+        row_errors = {}
+        row_emails = {
+            field_name: data[field_name].lower()
+            for field_name in ("email", "secondary_email")
+            if data.get(field_name)
+        }
+        for field_name, email in row_emails.items():
+            if email in taken_emails:
+                row_errors[field_name] = [EMAIL_EXISTS_ERROR]
+        if data["username"] in taken_usernames:
+            row_errors["username"] = [USERNAME_EXISTS_ERROR]
+        if data.get("npi_number") in taken_npi_numbers:
+            row_errors["npi_number"] = [NPI_NUMBER_EXISTS_ERROR]
+        if row_errors:
+            errors.append(ImportRowError(line, row_errors))
+            continue
+        # Following rows can't reuse values of imported row
+        taken_emails.update(row_emails.values())
+        taken_usernames.add(data["username"])
+        if data.get("npi_number"):
+            taken_npi_numbers.add(data["npi_number"])
+        unique_rows.append((line, data))
+    errors.sort(key=lambda error: error.line)
+    return unique_rows, errors
+
+
+def create_users(users_data: list[dict]) -> list[User]:
+    """Create users along with data `User.save` creates for single user.
+
+    Users, their default rates and compiled privacy rules are created with
+    bulk inserts, search fields and suggestions feed are filled with
+    set-based updates.
+
+    """
+    users = []
+    for user_data in users_data:
+        user = User(**user_data)
+        # Imported users set password with password reset
+        user.set_unusable_password()
+        users.append(user)
+    with transaction.atomic():
+        User.objects.bulk_create(users)
+        user_ids = [user.id for user in users]
+        User.objects.filter(id__in=user_ids).update(
+            search_document=get_search_document_expression(),
+            search_vector=get_search_vector_expression(),
+        )
+        bulk_create_default_consultation_rates(user_ids)
+        UserPrivacyRule.objects.bulk_create(
+            UserPrivacyRule(owner=user, **rule_data)
+            for user in users
+            for rule_data in get_privacy_rules_data(user.privacy_settings)
+        )
+        rebuild_suggestions(User, UserSuggestion, user_ids)
+    return users
+
+
+def import_users(
+    csv_file: typing.IO[str],
+    batch_size: int | None = None,
+    dry_run: bool = False,
+) -> UsersImportResult:
+    """Import users from CSV file, rows with errors are skipped.
+
+    Valid rows are created in batches, each batch in own transaction.
+
+    """
+    batch_size = batch_size or settings.USERS_IMPORT_BATCH_SIZE
+    rows, errors = validate_rows(read_rows(csv_file))
+    result = UsersImportResult(errors=errors)
+    if dry_run:
+        return result
+    for index in range(0, len(rows), batch_size):
+        batch = rows[index:index + batch_size]
+        result.created_count += len(create_users([data for _, data in batch]))
+    return result
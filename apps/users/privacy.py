@@ -0,0 +1,99 @@
+from django.db import connection
+
+from .constants import PrivacyFields, PrivacyOptions
+
+# Options which restrict or grant access to listed users
+MEMBERS_PRIVACY_OPTIONS = (PrivacyOptions.CUSTOM, PrivacyOptions.CUSTOM_INV)
+
+# User's fields which are hidden by privacy settings fields
+PRIVACY_FIELDS_MAP = {
+    PrivacyFields.ABOUT_ME: ("description",),
+    PrivacyFields.SPECIALITY: ("specialty",),
+    PrivacyFields.PRACTICE_AREA: ("specialty_area",),
+}
+
+
+def get_visibility_annotation_name(privacy_field: str) -> str:
+    """Return name of annotation with visibility of privacy field."""
+    return f"is_{privacy_field}_visible"
+
+
+def hide_restricted_fields(user, data: dict, viewer=None) -> dict:
+    """Replace values of fields, which are hidden for viewer, with `None`.
+
+    Visibility is taken from annotations of
+    `UserQuerySet.with_privacy_visibility`, fields of users fetched without
+    them are hidden, unless user views own data.
+
+    """
+    if viewer is not None and viewer.pk == user.pk:
+        return data
+    for privacy_field, field_names in PRIVACY_FIELDS_MAP.items():
+        annotation_name = get_visibility_annotation_name(privacy_field)
+        if getattr(user, annotation_name, False):
+            continue
+        for field_name in field_names:
+            if field_name in data:
+                data[field_name] = None
+    return data
+
+
+def get_privacy_rules_data(privacy_settings: dict[str, dict]) -> list[dict]:
+    """Compile privacy settings into data of `UserPrivacyRule` rows.
+
+    Each field gets a row without member which stores selected option, and
+    a row per member for custom groups.
+
+    """
+    rules_data = []
+    for privacy_field, privacy_setting in privacy_settings.items():
+        if privacy_field not in PrivacyFields.values:
+            continue
+        option = privacy_setting["type"]
+        rules_data.append(
+            {"field": privacy_field, "option": option, "member_id": None},
+        )
+        if option not in MEMBERS_PRIVACY_OPTIONS:
+            continue
+        rules_data.extend(
+            {"field": privacy_field, "option": option, "member_id": user_id}
+            for user_id in privacy_setting["users"]
+        )
+    return rules_data
+
+
+def rebuild_privacy_rules(user_model, rule_model) -> None:
+    """Compile privacy settings of all users with set-based queries.
+
+    Models are passed as arguments, so function can be used in migrations.
+
+    """
+    user_table = connection.ops.quote_name(user_model._meta.db_table)
+    rule_table = connection.ops.quote_name(rule_model._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {rule_table}")
+        cursor.execute(
+            f"""
+            INSERT INTO {rule_table}
+                (created, modified, owner_id, field, option, member_id)
+            SELECT NOW(), NOW(), owner_user.id, setting.key,
+                setting.value ->> 'type', NULL
+            FROM {user_table} owner_user,
+                jsonb_each(owner_user.privacy_settings) setting
+            WHERE setting.key = ANY(%(fields)s)
+            UNION ALL
+            SELECT NOW(), NOW(), owner_user.id, setting.key,
+                setting.value ->> 'type', member_user.id
+            FROM {user_table} owner_user,
+                jsonb_each(owner_user.privacy_settings) setting,
+                jsonb_array_elements_text(setting.value -> 'users') member_id
+            JOIN {user_table} member_user
+                ON member_user.id = member_id::integer
+            WHERE setting.key = ANY(%(fields)s)
+                AND setting.value ->> 'type' = ANY(%(options)s)
+            """,
+            {
+                "fields": list(PrivacyFields.values),
+                "options": [str(option) for option in MEMBERS_PRIVACY_OPTIONS],
+            },
+        )
@@ -1,6 +1,13 @@
 import typing
 
-from django.db import models
+from django.contrib.postgres.search import SearchRank
+from django.db import models, transaction
+from django.db.models.functions import Coalesce
+
+from .caches import invalidate_user_profiles
+from .constants import ClinicianType, PrivacyFields, PrivacyOptions
+from .privacy import get_visibility_annotation_name
+from .search import get_search_query
 
 if typing.TYPE_CHECKING:
     from .models import User
@@ -17,6 +24,182 @@ class UserQuerySet(models.QuerySet):
             ),
         )
 
-    def with_total_contacts(self) -> typing.Self:
-        """Annotate field to count number of contacts."""
-        return self.annotate(total_contacts=models.Count("contacts"))
+    def with_privacy_visibility(self, viewer: "User") -> typing.Self:
+        """Annotate visibility of privacy settings fields for viewer.
+
+        Visibility is decided by compiled `UserPrivacyRule` rows with indexed
+        subqueries, so whole page of users is checked within its query.
+
+        """
+        rule_model = self.model._meta.get_field("privacy_rules").related_model
+        contact_model = self.model._meta.get_field("contacts").related_model
+        is_contact_of_owner = models.Exists(
+            contact_model.objects.filter(
+                owner=models.OuterRef("id"),
+                contact=viewer,
+            ),
+        )
+        annotations = {}
+        for privacy_field in PrivacyFields.values:
+            rules = rule_model.objects.filter(
+                owner=models.OuterRef("id"),
+                field=privacy_field,
+            )
+            is_visible = (
+                models.Q(id=viewer.id)
+                | models.Q(
+                    models.Exists(rules.filter(option=PrivacyOptions.PUBLIC)),
+                )
+                | models.Q(
+                    models.Exists(
+                        rules.filter(option=PrivacyOptions.CONTACTS),
+                    ),
+                    is_contact_of_owner,
+                )
+                | models.Q(
+                    models.Exists(
+                        rules.filter(
+                            option=PrivacyOptions.CUSTOM,
+                            member=viewer,
+                        ),
+                    ),
+                )
+                | models.Q(
+                    models.Exists(
+                        rules.filter(option=PrivacyOptions.CUSTOM_INV),
+                    ),
+                    ~models.Exists(
+                        rules.filter(
+                            option=PrivacyOptions.CUSTOM_INV,
+                            member=viewer,
+                        ),
+                    ),
+                )
+            )
+            annotations[get_visibility_annotation_name(privacy_field)] = (
+                models.ExpressionWrapper(
+                    is_visible,
+                    output_field=models.BooleanField(),
+                )
+            )
+        return self.annotate(**annotations)
+
+    def with_contact_info(self, user: "User") -> typing.Self:
+        """Annotate contact fields displayed in user's detail for viewer.
+
+        Number of contacts is not annotated, it's stored in
+        `total_contacts` field. Visibility of privacy settings fields is
+        annotated as well.
+
+        """
+        return self.with_has_contact(user).with_privacy_visibility(user)
+
+    def refresh_total_contacts(self) -> int:
+        """Recompute `total_contacts` counters from contacts table.
+
+        Users rows are locked before counting, so concurrent transactions
+        can't overwrite counters with values counted from stale snapshot.
+
+        """
+        contact_model = self.model._meta.get_field("contacts").related_model
+        with transaction.atomic(using=self.db):
+            user_ids = list(
+                self.select_for_update()
+                .order_by("id")
+                .values_list("id", flat=True),
+            )
+            invalidate_user_profiles(user_ids)
+            return self.model.objects.filter(id__in=user_ids).update(
+                total_contacts=Coalesce(
+                    models.Subquery(
+                        contact_model.objects.filter(
+                            owner=models.OuterRef("id"),
+                        )
+                        .values("owner")
+                        .annotate(count=models.Count("id"))
+                        .values("count"),
+                    ),
+                    0,
+                ),
+            )
+
+    def delete(self):
+        """Delete users and recompute counters of users who had them.
+
+        Contacts of deleted users are removed by cascade, which bypasses
+        `ContactQuerySet.delete`.
+
+        """
+        contact_model = self.model._meta.get_field("contacts").related_model
+        with transaction.atomic(using=self.db):
+            owner_ids = set(
+                contact_model.objects.filter(
+                    contact__in=self.values("id"),
+                ).values_list("owner_id", flat=True),
+            )
+            result = super().delete()
+            self.model.objects.filter(
+                id__in=owner_ids,
+            ).refresh_total_contacts()
+        return result
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
+    def search(self, value: str) -> typing.Self:
+        """Filter users by search phrase and order them by relevance.
+
+        Matching is done against trigram indexed `search_document` and
+        clinician type labels, ranking uses weighted `search_vector`.
+
+        """
+        clinician_type_filter_list = [
+            code
+            for code, label in ClinicianType.choices
+            if value.lower() in label.lower()
+        ]
+        queryset = self.filter(
+            models.Q(search_document__icontains=value)
+            | models.Q(clinician_type__in=clinician_type_filter_list),
+        )
+        search_query = get_search_query(value)
+        if search_query is None:
+            return queryset
+        return queryset.annotate(
+            search_rank=SearchRank(models.F("search_vector"), search_query),
+        ).order_by("-search_rank", "id")
+
+
+class ContactQuerySet(models.QuerySet):
+    """Keep owners' `total_contacts` counters in sync on bulk operations."""
+
+    def _refresh_owners_total_contacts(self, owner_ids: set[int]) -> None:
+        """Recompute counters of contacts' owners."""
+        owner_model = self.model._meta.get_field("owner").related_model
+        owner_model.objects.filter(id__in=owner_ids).refresh_total_contacts()
+
+    def bulk_create(self, objs, *args, **kwargs):
+        """Create contacts and recompute counters of their owners.
+
+        Counters are recomputed instead of incremented, because contacts
+        skipped with `ignore_conflicts` can't be told apart.
+
+        """
+        objs = list(objs)
+        with transaction.atomic(using=self.db):
+            created_objs = super().bulk_create(objs, *args, **kwargs)
+            self._refresh_owners_total_contacts(
+                {obj.owner_id for obj in objs},
+            )
+        return created_objs
+
+    def delete(self):
+        """Delete contacts and recompute counters of their owners."""
+        with transaction.atomic(using=self.db):
+            owner_ids = set(self.values_list("owner_id", flat=True))
+            result = super().delete()
+            self._refresh_owners_total_contacts(owner_ids)
+        return result
+
+    delete.alters_data = True
+    delete.queryset_only = True
@@ -0,0 +1,88 @@
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchVector
+from django.db import models
+from django.db.models.functions import Concat
+
+# Postgres text search config, `simple` doesn't stem names or specialties
+SEARCH_CONFIG = "simple"
+
+# Fields which are used to build user's search document and vector
+SEARCH_FIELDS = (
+    "username",
+    "first_name",
+    "last_name",
+    "entity",
+    "specialty",
+    "specialty_area",
+)
+
+SEARCH_TERM_REGEX = re.compile(r"\w+")
+
+
+class ArrayToString(models.Func):
+    """Join items of postgres array into single string."""
+
+    function = "array_to_string"
+    template = "%(function)s(%(expressions)s, ' ')"
+    output_field = models.TextField()
+
+
+def get_search_document_expression() -> models.Expression:
+    """Return expression that joins all searchable fields of user.
+
+    Result is stored in `User.search_document` which is covered by trigram
+    index, so `icontains` lookups on it don't require sequential scans.
+
+    """
+    fields = [
+        ArrayToString(models.F(field_name))
+        if field_name == "specialty"
+        else models.F(field_name)
+        for field_name in SEARCH_FIELDS
+    ]
+    parts = []
+    for field in fields:
+        parts += [field, models.Value(" ")]
+    return Concat(*parts[:-1], output_field=models.TextField())
+
+
+def get_search_vector_expression() -> SearchVector:
+    """Return weighted search vector for user.
+
+    Names have the highest weight, then specialties and then entity.
+
+    """
+    return (
+        SearchVector(
+            "username",
+            "first_name",
+            "last_name",
+            weight="A",
+            config=SEARCH_CONFIG,
+        )
+        + SearchVector(
+            ArrayToString(models.F("specialty")),
+            "specialty_area",
+            weight="B",
+            config=SEARCH_CONFIG,
+        )
+        + SearchVector("entity", weight="C", config=SEARCH_CONFIG)
+    )
+
+
+def get_search_query(value: str) -> SearchQuery | None:
+    """Convert search phrase to prefix query.
+
+    For example `neur sur` becomes `neur:* & sur:*`. Return None if phrase
+    doesn't contain any word.
+
+    """
+    terms = SEARCH_TERM_REGEX.findall(value.lower())
+    if not terms:
+        return None
+    return SearchQuery(
+        " & ".join(f"{term}:*" for term in terms),
+        search_type="raw",
+        config=SEARCH_CONFIG,
+    )
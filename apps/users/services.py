@@ -1,35 +1,77 @@
 from django.contrib.auth.tokens import PasswordResetTokenGenerator
+from django.db import transaction
+from django.db.models import Case, Q, When
 from django.utils.encoding import force_bytes
 from django.utils.http import urlsafe_base64_encode
 
+from apps.consultations.models import UserConsultationStats
+from apps.consultations.services import refresh_consultation_stats
+
 from . import models, notifications
+from .constants import DASHBOARD_MONTHS_COUNT
+
+
+def get_user_by_identity(
+    identity: str,
+    with_npi_number: bool = False,
+) -> models.User | None:
+    """Return user by email or username with single query.
+
+    Each identity is looked up by own index. If identity matches several
+    users, match by email wins over match by username, which wins over
+    match by NPI number.
+
+    NPI number is looked up only if `with_npi_number` is set. It isn't
+    unique, several accounts can share it, so it mustn't be used to log in.
+
+    """
+    if not identity:
+        return None
+    condition = Q(email=identity) | Q(username=identity)
+    if with_npi_number:
+        condition |= Q(npi_number=identity)
+    return models.User.objects.filter(condition).order_by(
+        Case(
+            When(email=identity, then=0),
+            When(username=identity, then=1),
+            default=2,
+        ),
+    ).first()
 
 
 def reset_user_password(
     user: models.User,
-) -> bool:
+) -> None:
     """Reset user password.
 
     This will send to user an email with a link where user can enter new
-    password.
+    password. Email is delivered by celery, so request doesn't wait for mail
+    server. Email is queued once transaction is committed.
 
     """
-    return notifications.UserPasswordResetEmailNotification(
+    notification = notifications.UserPasswordResetEmailNotification(
         user=user,
         uid=urlsafe_base64_encode(force_bytes(user.pk)),
         token=PasswordResetTokenGenerator().make_token(user),
-    ).send()
+    )
+    transaction.on_commit(notification.send_async)
 
 
 def get_dashboard_stats(user: models.User) -> dict:
-    """Return dashboard stats for user."""
-    received_consultation_cost = user.received_consultations.all().values_list(
-        "cost",
-        flat=True,
-    )
-    stats = {
-        "consultation_count": len(received_consultation_cost),
-        "request_count": user.created_consultations.count(),
-        "earnings": sum(received_consultation_cost),
+    """Return dashboard stats for user.
+
+    Stats are read from precomputed tables, they are calculated only once if
+    user doesn't have them yet.
+
+    """
+    stats = UserConsultationStats.objects.filter(user=user).first()
+    if stats is None:
+        stats = refresh_consultation_stats(user)
+    return {
+        "consultation_count": stats.consultation_count,
+        "request_count": stats.request_count,
+        "earnings": stats.earnings,
+        "monthly_earnings": user.monthly_earnings.all()[
+            :DASHBOARD_MONTHS_COUNT
+        ],
     }
-    return stats
@@ -0,0 +1,61 @@
+from django.db import DEFAULT_DB_ALIAS, connections
+
+# Fields which define users suggested to each other, suggested users must
+# share specialty, clinician type and practice state
+SUGGESTION_FIELDS = (
+    "specialty",
+    "clinician_type",
+    "primary_region_practice_state",
+)
+
+
+def rebuild_suggestions(
+    user_model,
+    suggestion_model,
+    user_ids: list[int] | None = None,
+    using: str = DEFAULT_DB_ALIAS,
+) -> None:
+    """Rebuild suggestions feed with set-based queries.
+
+    If `user_ids` are provided, only entries which involve these users are
+    rebuilt. Entries which are inserted concurrently by
+    `User.update_suggestions` are skipped.
+
+    """
+    connection = connections[using]
+    user_table = connection.ops.quote_name(user_model._meta.db_table)
+    suggestion_table = connection.ops.quote_name(
+        suggestion_model._meta.db_table,
+    )
+    delete_sql = f"DELETE FROM {suggestion_table}"
+    users_filter_sql = ""
+    params = None
+    if user_ids is not None:
+        params = {"user_ids": user_ids}
+        delete_sql += (
+            " WHERE user_id = ANY(%(user_ids)s)"
+            " OR suggested_user_id = ANY(%(user_ids)s)"
+        )
+        users_filter_sql = (
+            "WHERE viewer.id = ANY(%(user_ids)s)"
+            " OR suggested.id = ANY(%(user_ids)s)"
+        )
+    with connection.cursor() as cursor:
+        cursor.execute(delete_sql, params)
+        cursor.execute(
+            f"""
+            INSERT INTO {suggestion_table}
+                (created, modified, user_id, suggested_user_id)
+            SELECT NOW(), NOW(), viewer.id, suggested.id
+            FROM {user_table} viewer
+            JOIN {user_table} suggested
+                ON suggested.specialty && viewer.specialty
+                AND suggested.clinician_type = viewer.clinician_type
+                AND suggested.primary_region_practice_state
+                    = viewer.primary_region_practice_state
+                AND suggested.id <> viewer.id
+            {users_filter_sql}
+            ON CONFLICT (user_id, suggested_user_id) DO NOTHING
+            """,
+            params,
+        )
@@ -0,0 +1,123 @@
+from django.core.cache import cache
+from django.urls import reverse_lazy
+
+from rest_framework import status, test
+
+import pytest
+from knox.models import AuthToken
+
+from ... import factories, models
+from ...caches import get_auth_token_key
+
+
+def test_login_with_identities(
+    api_client: test.APIClient,
+    clinician_user: models.User,
+):
+    """Ensure user can log in with email or username, not NPI number.
+
+    NPI number isn't unique, so it can't identify account on login.
+
+    """
+    identities = (
+        clinician_user.email.upper(),
+        clinician_user.username,
+    )
+    for identity in identities:
+        response = api_client.post(
+            reverse_lazy("v1:login"),
+            data={
+                "username": identity,
+                "password": factories.DEFAULT_PASSWORD,
+            },
+        )
+        assert response.status_code == status.HTTP_200_OK, response.data
+
+    response = api_client.post(
+        reverse_lazy("v1:login"),
+        data={
+            "username": clinician_user.npi_number,
+            "password": factories.DEFAULT_PASSWORD,
+        },
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_login_throttling(api_client: test.APIClient, user: models.User):
+    """Ensure login attempts against single account are throttled."""
+    data = {"username": user.email, "password": "wrong"}
+    for _ in range(10):
+        response = api_client.post(reverse_lazy("v1:login"), data=data)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+    response = api_client.post(reverse_lazy("v1:login"), data=data)
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert int(response["Retry-After"]) > 0
+
+    # Other accounts can still be logged into from the same IP
+    response = api_client.post(
+        reverse_lazy("v1:login"),
+        data={"username": user.username, "password": "wrong"},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_register_throttling_spoofed_ip(api_client: test.APIClient):
+    """Ensure IP throttle can't be bypassed with `X-Forwarded-For`."""
+    for index in range(10):
+        response = api_client.post(
+            reverse_lazy("v1:register"),
+            data={},
+            HTTP_X_FORWARDED_FOR=f"10.0.0.{index}, 127.0.0.1",
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+    response = api_client.post(
+        reverse_lazy("v1:register"),
+        data={},
+        HTTP_X_FORWARDED_FOR="10.0.1.1, 127.0.0.1",
+    )
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+
+@pytest.mark.no_queries_budget
+def test_auth_token_cache(django_capture_on_commit_callbacks):
+    """Ensure verified token is cached and dropped on logout."""
+    user = factories.UserFactory()
+    auth_token, token = AuthToken.objects.create(user)
+    client = test.APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Token {token}")
+
+    response = client.get(reverse_lazy("v1:profile"))
+    assert response.status_code == status.HTTP_200_OK, response.data
+    assert cache.get(get_auth_token_key(auth_token.digest)) == (
+        user.id,
+        auth_token.expiry,
+    )
+    response = client.get(reverse_lazy("v1:profile"))
+    assert response.status_code == status.HTTP_200_OK, response.data
+
+    with django_capture_on_commit_callbacks(execute=True):
+        response = client.post(reverse_lazy("v1:logout"))
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    assert cache.get(get_auth_token_key(auth_token.digest)) is None
+    response = client.get(reverse_lazy("v1:profile"))
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.no_queries_budget
+def test_auth_token_cache_user_deactivation(
+    django_capture_on_commit_callbacks,
+):
+    """Ensure cached tokens of deactivated user are rejected."""
+    user = factories.UserFactory()
+    auth_token, token = AuthToken.objects.create(user)
+    client = test.APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Token {token}")
+    response = client.get(reverse_lazy("v1:profile"))
+    assert response.status_code == status.HTTP_200_OK, response.data
+
+    with django_capture_on_commit_callbacks(execute=True):
+        user.is_active = False
+        user.save()
+    assert cache.get(get_auth_token_key(auth_token.digest)) is None
+    response = client.get(reverse_lazy("v1:profile"))
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -53,3 +53,59 @@ def test_user_contact_delete_api(
         owner=clinician_user,
         contact=contact.contact,
     ).exists()
+
+
+def test_user_contacts_list_api_cursor(api_client: APIClient) -> None:
+    """Ensure contacts could be paged through with cursor.
+
+    Contacts are ordered by time they were added to contact list, not by
+    time contact users were created.
+
+    """
+    owner = UserFactory()
+    contact_users = UserFactory.create_batch(size=3)
+    contacts = [
+        ContactFactory(owner=owner, contact=contact_user)
+        for contact_user in contact_users[::-1]
+    ]
+    api_client.force_authenticate(owner)
+    url = reverse_lazy("v1:contact-list")
+    response = api_client.get(url, data={"cursor": "", "limit": 2})
+    assert response.status_code == status.HTTP_200_OK
+    assert "count" not in response.data
+    next_response = api_client.get(response.data["next"])
+    assert next_response.status_code == status.HTTP_200_OK
+    assert next_response.data["next"] is None
+    returned_ids = [
+        user["id"]
+        for page in (response, next_response)
+        for user in page.data["results"]
+    ]
+    assert returned_ids == [contact.contact_id for contact in contacts[::-1]]
+
+
+def test_user_contacts_list_api_invalid_cursor(
+    clinician_user: User,
+    api_client: APIClient,
+) -> None:
+    """Ensure malformed cursor is rejected."""
+    api_client.force_authenticate(clinician_user)
+    response = api_client.get(
+        reverse_lazy("v1:contact-list"),
+        data={"cursor": "malformed"},
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_user_contacts_list_api_cursor_with_search(
+    clinician_user: User,
+    api_client: APIClient,
+) -> None:
+    """Ensure cursor can't be combined with search, it defines order."""
+    api_client.force_authenticate(clinician_user)
+    response = api_client.get(
+        reverse_lazy("v1:contact-list"),
+        data={"cursor": "", "search": "john"},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "cursor" in response.data
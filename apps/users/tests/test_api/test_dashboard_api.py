@@ -1,13 +1,92 @@
+from decimal import Decimal
+
 from django.urls import reverse_lazy
 
 from rest_framework import status
 from rest_framework.test import APIClient
 
+from apps.consultations.factories import ConsultationFactory
+from apps.consultations.models import Consultation
+from apps.users.factories import UserFactory
 from apps.users.models import User
 
+dashboard_api = reverse_lazy("v1:profile-get-dashboard")
+
 
 def test_dashboard_api(api_client: APIClient, clinician_user: User) -> None:
     """Ensure authenticated user can view dashboard via API."""
     api_client.force_authenticate(clinician_user)
-    response = api_client.get(reverse_lazy("v1:profile-get-dashboard"))
+    response = api_client.get(dashboard_api)
+    assert response.status_code == status.HTTP_200_OK
+
+
+def test_dashboard_api_stats(
+    api_client: APIClient,
+    clinician_user: User,
+    student_user: User,
+) -> None:
+    """Ensure dashboard stats are kept up to date with consultations."""
+    consultations = ConsultationFactory.create_batch(
+        size=2,
+        from_user=student_user,
+        to_user=clinician_user,
+        cost=Decimal("10.50"),
+    )
+    ConsultationFactory(from_user=clinician_user, to_user=student_user)
+    consultations[0].cost = Decimal("20.50")
+    consultations[0].save()
+
+    api_client.force_authenticate(clinician_user)
+    response = api_client.get(dashboard_api)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["consultation_count"] == 2
+    assert response.data["request_count"] == 1
+    assert response.data["earnings"] == Decimal("31.00")
+    assert len(response.data["monthly_earnings"]) == 1
+    assert response.data["monthly_earnings"][0]["earnings"] == Decimal(
+        "31.00",
+    )
+
+
+def test_dashboard_api_stats_bulk_changes(
+    api_client: APIClient,
+    clinician_user: User,
+    student_user: User,
+) -> None:
+    """Ensure stats are recomputed after bulk changes of consultations.
+
+    Bulk updates, bulk deletes and cascade deletes of users bypass
+    consultation's `save` and `delete`.
+
+    """
+    ConsultationFactory.create_batch(
+        size=3,
+        from_user=student_user,
+        to_user=clinician_user,
+        cost=Decimal("10.00"),
+    )
+    other_user = UserFactory()
+    ConsultationFactory(
+        from_user=other_user,
+        to_user=clinician_user,
+        cost=Decimal("5.00"),
+    )
+    Consultation.objects.filter(from_user=student_user).update(
+        cost=Decimal("20.00"),
+    )
+    Consultation.objects.filter(
+        from_user=student_user,
+    ).order_by("id").first().delete()
+    Consultation.objects.filter(
+        id=Consultation.objects.filter(from_user=student_user).first().id,
+    ).delete()
+    other_user.delete()
+
+    api_client.force_authenticate(clinician_user)
+    response = api_client.get(dashboard_api)
     assert response.status_code == status.HTTP_200_OK
+    assert response.data["consultation_count"] == 1
+    assert response.data["earnings"] == Decimal("20.00")
+    assert response.data["monthly_earnings"][0]["earnings"] == Decimal(
+        "20.00",
+    )
@@ -6,11 +6,15 @@ from rest_framework.test import APIClient
 import pytest
 
 from apps.core.test_utils import get_test_file_url
+from apps.payments.test_utils import FakeStripeClient
 from apps.users.constants import ClinicianType, PrivacyFields, PrivacyOptions
 from apps.users.models import User
 
 user_profile_api = reverse_lazy("v1:profile")
 user_privacy_settings_api = reverse_lazy("v1:profile-privacy-settings")
+user_connected_account_api = reverse_lazy(
+    "v1:profile-get-connected-account",
+)
 
 
 @pytest.fixture
@@ -85,3 +89,54 @@ def test_user_profile_privacy_settings_update_api(
     }
     response = api_client.put(user_privacy_settings_api, data=privacy_settings)
     assert response.status_code == status.HTTP_200_OK
+
+
+def test_user_profile_connected_account_api(
+    api_client: APIClient,
+    clinician_user: User,
+    fake_stripe_client: FakeStripeClient,
+):
+    """Ensure connected account state is returned from local mirror."""
+    api_client.force_authenticate(clinician_user)
+    response = api_client.get(user_connected_account_api)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data == {
+        "details_submitted": False,
+        "charges_enabled": False,
+    }
+    api_client.get(user_connected_account_api)
+    assert fake_stripe_client.accounts.retrieve_calls_count == 0
+
+
+def test_user_profile_privacy_settings_users_cards_api(
+    api_client: APIClient,
+    user: User,
+    student_user: User,
+):
+    """Ensure users of all privacy fields are represented as cards."""
+    api_client.force_authenticate(user)
+    privacy_settings = {
+        privacy_field: {"type": PrivacyOptions.PUBLIC, "users": []}
+        for privacy_field in PrivacyFields.values
+    }
+    privacy_settings[PrivacyFields.ABOUT_ME.value] = {
+        "type": PrivacyOptions.CUSTOM,
+        "users": [student_user.id],
+    }
+    privacy_settings[PrivacyFields.SPECIALITY.value] = {
+        "type": PrivacyOptions.CUSTOM_INV,
+        "users": [student_user.id, 10**9],
+    }
+    response = api_client.put(user_privacy_settings_api, data=privacy_settings)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    privacy_settings[PrivacyFields.SPECIALITY.value]["users"] = [
+        student_user.id,
+    ]
+    api_client.put(user_privacy_settings_api, data=privacy_settings)
+    response = api_client.get(user_privacy_settings_api)
+    assert response.status_code == status.HTTP_200_OK
+    about_me_users = response.data[PrivacyFields.ABOUT_ME.value]["users"]
+    assert [card["id"] for card in about_me_users] == [student_user.id]
+    assert "email" not in about_me_users[0]
+    assert "specialty" not in about_me_users[0]
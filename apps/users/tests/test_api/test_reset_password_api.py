@@ -29,13 +29,18 @@ def _get_reset_token_from_email(user_email: str) -> typing.Tuple[str, str]:
     return uid, "-".join(token_parts)
 
 
-def test_password_reset(user_api_client: test.APIClient, user: models.User):
+def test_password_reset(
+    user_api_client: test.APIClient,
+    user: models.User,
+    django_capture_on_commit_callbacks,
+):
     """Test that user can request password rest and it will sent it email."""
     for info in (user.email, user.username, user.npi_number):
-        response: Response = user_api_client.post(
-            path=reverse_lazy("v1:password-reset"),
-            data={"information": info},
-        )
+        with django_capture_on_commit_callbacks(execute=True):
+            response: Response = user_api_client.post(
+                path=reverse_lazy("v1:password-reset"),
+                data={"information": info},
+            )
         assert response.status_code == status.HTTP_200_OK, response.data
         # Check that email was sent and contains needed token
         assert _get_reset_token_from_email(user_email=user.email)
@@ -44,9 +49,11 @@ def test_password_reset(user_api_client: test.APIClient, user: models.User):
 def test_password_reset_confirm(
     user_api_client: test.APIClient,
     user: models.User,
+    django_capture_on_commit_callbacks,
 ):
     """Test that user can change password with token."""
-    services.reset_user_password(user=user)
+    with django_capture_on_commit_callbacks(execute=True):
+        services.reset_user_password(user=user)
     uid, token = _get_reset_token_from_email(user_email=user.email)
     new_password = factories.DEFAULT_PASSWORD + "?"
     response: Response = user_api_client.post(
@@ -81,9 +88,11 @@ def test_password_reset_confirm(
 def test_password_reset_confirm_reuse(
     user_api_client: test.APIClient,
     user: models.User,
+    django_capture_on_commit_callbacks,
 ):
     """Test that user can't reuse token for password change."""
-    services.reset_user_password(user=user)
+    with django_capture_on_commit_callbacks(execute=True):
+        services.reset_user_password(user=user)
     uid, token = _get_reset_token_from_email(user_email=user.email)
     new_password = factories.DEFAULT_PASSWORD + "?"
     response: Response = user_api_client.post(
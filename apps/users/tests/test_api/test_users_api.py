@@ -7,8 +7,8 @@ from rest_framework.test import APIClient
 
 import pytest
 
-from apps.users.constants import ClinicianType
-from apps.users.factories import UserFactory
+from apps.users.constants import ClinicianType, PrivacyFields, PrivacyOptions
+from apps.users.factories import ContactFactory, UserFactory
 from apps.users.models import User
 
 
@@ -58,3 +58,99 @@ def test_user_detail_api(api_client: APIClient, clinician_user: User) -> None:
     )
     assert response.status_code == status.HTTP_200_OK
     assert response.data["id"] == clinician_user.id
+
+
+def test_user_list_api_search(api_client: APIClient, user: User) -> None:
+    """Ensure users are found by part of searchable fields."""
+    searched_user = UserFactory(
+        last_name="Zebrowski",
+        specialty=["Neurosurgery"],
+    )
+    UserFactory(entity="Zebrowski Clinic")
+    api_client.force_authenticate(user)
+    response = api_client.get(user_list_api, data={"search": "zebrow"})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["count"] == 2
+    # Match in name has higher weight than match in entity
+    assert response.data["results"][0]["id"] == searched_user.id
+
+
+def test_user_search_fields_update_on_save(user: User) -> None:
+    """Ensure search document is refreshed when user is saved."""
+    user.entity = "Brand New Entity"
+    user.save()
+    assert User.objects.search("new entity").filter(id=user.id).exists()
+
+
+def test_user_list_api_suggested(api_client: APIClient) -> None:
+    """Ensure default users list returns matching users from feed."""
+    user_kwargs = {
+        "clinician_type": ClinicianType.PA,
+        "specialty": ["Cardiology"],
+        "primary_region_practice_state": "NY",
+    }
+    user = UserFactory(**user_kwargs)
+    suggested_user = UserFactory(**user_kwargs)
+    moved_user = UserFactory(**user_kwargs)
+    moved_user.primary_region_practice_state = "CA"
+    moved_user.save(update_fields=["primary_region_practice_state"])
+    api_client.force_authenticate(user)
+    response = api_client.get(user_list_api)
+    assert response.status_code == status.HTTP_200_OK
+    assert [item["id"] for item in response.data["results"]] == [
+        suggested_user.id,
+    ]
+
+
+def test_user_detail_api_privacy(api_client: APIClient, user: User) -> None:
+    """Ensure fields restricted by privacy settings are hidden for viewer."""
+    viewed_user = UserFactory(description="About me", specialty_area="Area")
+    viewed_user.privacy_settings[PrivacyFields.ABOUT_ME.value] = {
+        "type": PrivacyOptions.ONLY_ME,
+        "users": [],
+    }
+    viewed_user.privacy_settings[PrivacyFields.PRACTICE_AREA.value] = {
+        "type": PrivacyOptions.CUSTOM,
+        "users": [user.id],
+    }
+    viewed_user.save(update_fields=["privacy_settings"])
+    api_client.force_authenticate(user)
+    response = api_client.get(user_detail_api(kwargs={"pk": viewed_user.id}))
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["description"] is None
+    assert response.data["specialty_area"] == "Area"
+
+
+def test_user_detail_api_cache(
+    api_client: APIClient,
+    user: User,
+    django_capture_on_commit_callbacks,
+) -> None:
+    """Ensure cached profile is refreshed on user's and contacts' changes."""
+    viewed_user = UserFactory()
+    api_client.force_authenticate(user)
+    url = user_detail_api(kwargs={"pk": viewed_user.id})
+    response = api_client.get(url)
+    assert response.data["has_contact"] is False
+    assert response.data["total_contacts"] == 0
+
+    with django_capture_on_commit_callbacks(execute=True):
+        ContactFactory(owner=user, contact=viewed_user)
+        ContactFactory(owner=viewed_user, contact=user)
+    response = api_client.get(url)
+    assert response.data["has_contact"] is True
+    assert response.data["total_contacts"] == 1
+
+    with django_capture_on_commit_callbacks(execute=True):
+        viewed_user.first_name = "Renamed"
+        viewed_user.save(update_fields=["first_name"])
+    response = api_client.get(url)
+    assert response.data["first_name"] == "Renamed"
+    # Stale profile isn't served even if invalidation didn't run yet
+    viewed_user.first_name = "Renamed again"
+    viewed_user.save(update_fields=["first_name"])
+    response = api_client.get(url)
+    assert response.data["first_name"] == "Renamed again"
+    # Contact status of other viewers isn't taken from cache
+    api_client.force_authenticate(UserFactory())
+    assert api_client.get(url).data["has_contact"] is False
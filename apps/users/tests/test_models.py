@@ -1,8 +1,13 @@
+import io
+from unittest import mock
+
 from django.core.exceptions import ValidationError
 
 import pytest
 
-from .. import models
+from .. import factories, models
+from ..onboarding import import_users
+from ..privacy import hide_restricted_fields
 
 
 def test_unique_email_validation(user: models.User):
@@ -11,3 +16,99 @@ def test_unique_email_validation(user: models.User):
     with pytest.raises(ValidationError) as exc:
         new_user.full_clean()
     assert "email" in exc.value.error_dict
+
+
+def test_hide_restricted_fields(user: models.User):
+    """Ensure fields of users fetched without visibility are hidden."""
+    data = {"description": "About me", "first_name": "John"}
+    assert hide_restricted_fields(user, dict(data), viewer=user) == data
+    hidden_data = hide_restricted_fields(
+        user,
+        dict(data),
+        viewer=factories.UserFactory(),
+    )
+    assert hidden_data == {"description": None, "first_name": "John"}
+
+
+def test_total_contacts_counter(user: models.User):
+    """Ensure contacts counter follows created and deleted contacts."""
+    owner = factories.UserFactory()
+    contact = factories.ContactFactory(owner=owner, contact=user)
+    models.Contact.objects.bulk_create(
+        [
+            models.Contact(owner=owner, contact=new_contact)
+            for new_contact in factories.UserFactory.create_batch(size=2)
+        ],
+    )
+    owner.refresh_from_db()
+    assert owner.total_contacts == 3
+
+    contact.delete()
+    models.Contact.objects.filter(owner=owner).first().delete()
+    owner.refresh_from_db()
+    assert owner.total_contacts == 1
+
+    models.Contact.objects.filter(owner=owner).delete()
+    owner.refresh_from_db()
+    assert owner.total_contacts == 0
+
+
+def test_total_contacts_counter_on_repeated_and_bulk_delete():
+    """Ensure counter is kept by stale deletes and bulk users deletes."""
+    owner = factories.UserFactory()
+    contact = factories.ContactFactory(owner=owner)
+    stale_contact = models.Contact.objects.get(id=contact.id)
+    contact.delete()
+    stale_contact.delete()
+    owner.refresh_from_db()
+    assert owner.total_contacts == 0
+
+    contacts = factories.ContactFactory.create_batch(size=2, owner=owner)
+    models.User.objects.filter(id=contacts[0].contact_id).delete()
+    owner.refresh_from_db()
+    assert owner.total_contacts == 1
+
+
+def test_total_contacts_kept_on_save():
+    """Ensure full save of stale user doesn't overwrite contacts counter."""
+    owner = factories.UserFactory()
+    factories.ContactFactory(owner=owner)
+    owner.first_name = "Updated"
+    owner.save()
+    owner.refresh_from_db()
+    assert owner.first_name == "Updated"
+    assert owner.total_contacts == 1
+
+
+def test_suggestions_updated_on_change():
+    """Ensure suggestions feed is rebuilt only when its fields change."""
+    user = models.User.objects.get(id=factories.UserFactory().id)
+    with mock.patch.object(models.User, "update_suggestions") as update_mock:
+        user.entity = "New Entity"
+        user.save()
+        update_mock.assert_not_called()
+        user.specialty = [*user.specialty, "Oncology"]
+        user.save()
+        update_mock.assert_called_once()
+
+
+def test_import_users(user: models.User):
+    """Ensure valid rows are imported and invalid ones are reported."""
+    csv_file = io.StringIO(
+        "email,username,first_name,last_name,role,specialty,clinician_type,"
+        "primary_region_practice_state,address_state\n"
+        f"{user.email.upper()},taken,John,Doe,student,Surgery,stu,NY,NY\n"
+        "new@example.com,new,Jane,Doe,student,Surgery;Oncology,stu,NY,CA\n"
+        "NEW@example.com,new-user-2,Jack,Doe,student,Surgery,stu,NY,NY\n"
+        "other@example.com,other-user,,Doe,student,Surgery,stu,NY,NY\n",
+    )
+    result = import_users(csv_file, batch_size=1)
+    assert result.created_count == 1
+    assert [error.line for error in result.errors] == [2, 4, 5]
+    assert "email" in result.errors[0].errors
+    assert "email" in result.errors[1].errors
+    assert "first_name" in result.errors[2].errors
+
+    new_user = models.User.objects.get(username="new")
+    assert new_user.specialty == ["Surgery", "Oncology"]
+    assert not new_user.has_usable_password()
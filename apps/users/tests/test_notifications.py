@@ -0,0 +1,143 @@
+import pickle
+import smtplib
+from unittest import mock
+
+from django.core import mail
+from django.core.mail.backends import locmem
+
+from libs.notifications import tasks
+from libs.notifications.email import render_many, send_many_async
+from libs.notifications.fan_out import fan_out, get_progress
+
+from .. import factories, models, notifications
+
+
+class TrackedPasswordResetEmailNotification(
+    notifications.UserPasswordResetEmailNotification,
+):
+    """Remember whether delivery callback was called."""
+
+    is_sent = False
+
+    def on_email_send_succeed(self):
+        """Mark notification as sent."""
+        self.is_sent = True
+
+
+def test_send_many_async(user: models.User):
+    """Ensure queued emails are delivered and callbacks are called."""
+    users = [user, factories.UserFactory()]
+    email_notifications = [
+        TrackedPasswordResetEmailNotification(user=recipient)
+        for recipient in users
+    ]
+    send_many_async(email_notifications, batch_size=1)
+    assert all(
+        notification.is_sent for notification in email_notifications
+    )
+    assert {
+        tuple(email.to) for email in mail.outbox
+    } >= {(recipient.email,) for recipient in users}
+
+
+def test_send_many_async_retry(user: models.User):
+    """Ensure failed emails are retried with picklable arguments."""
+    notification = TrackedPasswordResetEmailNotification(user=user)
+    send_messages = locmem.EmailBackend.send_messages
+    sent_batches = []
+
+    def flaky_send_messages(backend, messages):
+        """Drop connection on the first attempt."""
+        sent_batches.append(messages)
+        if len(sent_batches) == 1:
+            raise smtplib.SMTPServerDisconnected
+        return send_messages(backend, messages)
+
+    retry = tasks.send_emails.retry
+
+    def checked_retry(*args, **kwargs):
+        """Ensure retried emails can be sent to broker."""
+        (emails,) = kwargs["args"]
+        assert all(email.connection is None for _, email in emails)
+        pickle.dumps(emails)
+        return retry(*args, **kwargs)
+
+    with (
+        mock.patch.object(
+            locmem.EmailBackend,
+            "send_messages",
+            flaky_send_messages,
+        ),
+        mock.patch.object(
+            tasks.send_emails,
+            "retry",
+            side_effect=checked_retry,
+        ) as retry_mock,
+    ):
+        send_many_async([notification])
+    assert retry_mock.call_count == 1
+    assert len(sent_batches) == 2
+    assert notification.is_sent
+
+
+def test_render_many(user: models.User):
+    """Ensure emails are rendered for each notification."""
+    email_notifications = [
+        notifications.UserPasswordResetEmailNotification(
+            user=user,
+            token=token,
+        )
+        for token in ("first-token", "second-token")
+    ]
+    emails = render_many(email_notifications)
+    assert [email.to for email in emails] == [[user.email], [user.email]]
+    assert "first-token" in emails[0].alternatives[0][0]
+    assert "second-token" in emails[1].alternatives[0][0]
+    assert emails[0].body != emails[1].body
+
+
+def test_fan_out():
+    """Ensure notification is sent to each user of queryset."""
+    users = factories.UserFactory.create_batch(3, allow_notifications=True)
+    fan_out_id = fan_out(
+        notifications.UserAnnouncementEmailNotification,
+        models.User.objects.filter(id__in=[user.id for user in users]),
+        chunk_size=2,
+        subject="News",
+        message="New feature is released.",
+    )
+    progress = get_progress(fan_out_id)
+    assert progress.total == progress.sent == len(users)
+    assert progress.is_finished
+    recipients = [
+        email.to[0] for email in mail.outbox if email.subject.endswith("News")
+    ]
+    assert sorted(recipients) == sorted(user.email for user in users)
+
+
+def test_fan_out_chunk_skips_unmatched_recipients():
+    """Ensure recipients which stopped matching fan-out's query are skipped."""
+    user, opted_out_user = factories.UserFactory.create_batch(
+        2,
+        allow_notifications=True,
+    )
+    queryset = models.User.objects.filter(
+        id__in=[user.id, opted_out_user.id],
+        allow_notifications=True,
+    )
+    opted_out_user.allow_notifications = False
+    opted_out_user.save(update_fields=["allow_notifications"])
+    with mock.patch.object(tasks, "track_progress") as track_progress_mock:
+        tasks.send_fan_out_chunk(
+            fan_out_id="fan-out",
+            notification_class=notifications.UserAnnouncementEmailNotification,
+            model=models.User,
+            query=queryset.query,
+            pks=[user.id, opted_out_user.id],
+            template_context={"subject": "News", "message": "Update."},
+        )
+    assert track_progress_mock.call_args.kwargs["total"] == -1
+    recipients = [
+        email.to[0] for email in mail.outbox if email.subject.endswith("News")
+    ]
+    assert recipients == [user.email]
@@ -27,3 +27,12 @@ def default_privacy_settings() -> dict[str, dict]:
         privacy_field: asdict(PrivacySetting(PrivacyOptions.PUBLIC))
         for privacy_field in PrivacyFields
     }
+
+
+def get_privacy_user_ids(privacy_settings: dict[str, dict]) -> set[int]:
+    """Return ids of users referenced by any of privacy settings fields."""
+    return {
+        user_id
+        for privacy_setting in privacy_settings.values()
+        for user_id in privacy_setting.get("users", ())
+    }
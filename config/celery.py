@@ -9,3 +9,4 @@ app = Celery("wrdoc-backend")
 app.config_from_object("django.conf:settings", namespace="CELERY")
 
 app.autodiscover_tasks()
+app.autodiscover_tasks(("libs.notifications",))
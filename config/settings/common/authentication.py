@@ -2,8 +2,7 @@
 AUTH_USER_MODEL = "users.User"
 
 AUTHENTICATION_BACKENDS = (
-    "django.contrib.auth.backends.ModelBackend",
-    "apps.users.auth_backends.UsernameBackend",
+    "apps.users.auth_backends.IdentityBackend",
 )
 
 
@@ -1 +1,25 @@
 # This file holds settings specific to the project
+import datetime
+
+# How long mirrored Stripe account state is served without asking Stripe
+STRIPE_ACCOUNT_CACHE_TTL = datetime.timedelta(minutes=15)
+# Max number of Stripe webhook events processed by one celery task
+STRIPE_EVENTS_BATCH_SIZE = 500
+# Number of times failed Stripe event is processed before it's given up
+STRIPE_EVENTS_MAX_ATTEMPTS = 5
+
+# Emails delivery by celery
+EMAIL_DELIVERY_BATCH_SIZE = 50
+EMAIL_DELIVERY_MAX_RETRIES = 5
+# Delay before first retry in seconds, doubled for each next retry
+EMAIL_DELIVERY_RETRY_DELAY = 30
+# Recipients count in chunk of notifications fan-out
+NOTIFICATIONS_FAN_OUT_CHUNK_SIZE = 100
+# Max rate of sending fan-out chunks per worker
+NOTIFICATIONS_FAN_OUT_RATE_LIMIT = "30/m"
+# Max age of responses of static data endpoints (like constants) in seconds
+STATIC_DATA_CACHE_MAX_AGE = 60 * 60 * 24
+# How long users' consultation rate cards are cached in seconds
+RATE_CARD_CACHE_TIMEOUT = 60 * 60 * 24
+# Number of users created in one transaction by CSV users import
+USERS_IMPORT_BATCH_SIZE = 500
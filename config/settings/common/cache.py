@@ -5,8 +5,18 @@ CACHES = {
         "BACKEND": "django_redis.cache.RedisCache",
         "OPTIONS": {
             "CLIENT_CLASS": "django_redis.client.DefaultClient",
-            "MAX_ENTRIES": 1000,
         },
         "KEY_PREFIX": "wrdoc",
     },
 }
+
+# Two-tier cache (libs.cache), in-process LRU in front of redis
+# Max number of entries kept in memory of each process
+LOCAL_CACHE_MAX_ENTRIES = 1000
+# Max age of in-process entries in seconds, bounds staleness if
+# invalidation message is lost
+LOCAL_CACHE_TIMEOUT = 60
+# Default timeout of redis entries in seconds
+CACHE_NAMESPACE_TIMEOUT = 60 * 60 * 24
+# Redis pub/sub channel for invalidation messages
+CACHE_INVALIDATION_CHANNEL = "wrdoc:cache-invalidation"
@@ -1,3 +1,5 @@
+import datetime
+
 CELERY_TASK_SERIALIZER = "pickle"
 CELERY_ACCEPT_CONTENT = ["pickle", "json"]
 
@@ -15,3 +17,12 @@ CELERY_BROKER_TRANSPORT_OPTIONS = {
     "socket_timeout": 5,
     "global_keyprefix": "wrdoc:",
 }
+
+# Periodic tasks, they are synced to django-celery-beat's database scheduler
+# on beat start
+CELERY_BEAT_SCHEDULE = {
+    "sweep-stripe-events": {
+        "task": "apps.payments.tasks.sweep_stripe_events",
+        "schedule": datetime.timedelta(minutes=5),
+    },
+}
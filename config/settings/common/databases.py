@@ -6,7 +6,20 @@
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.postgresql",
-        "ATOMIC_REQUESTS": True,
+        # Requests are run in transactions by
+        # `libs.transactions.TransactionPolicyMiddleware`
+        "ATOMIC_REQUESTS": False,
         "CONN_MAX_AGE": 600,
     },
 }
+
+# Read replicas, see `libs.db.routers.ReplicaRouter`
+DATABASE_ROUTERS = ("libs.db.routers.ReplicaRouter",)
+# Aliases of replicas in `DATABASES`
+DATABASE_REPLICAS = ()
+# Max replication lag in seconds, lagging replica isn't used
+REPLICA_MAX_LAG = 5
+# How often each process checks replicas' lag in seconds
+REPLICA_LAG_CHECK_INTERVAL = 10
+# Seconds client reads from primary after changing data
+REPLICA_STICKINESS_TIMEOUT = 10
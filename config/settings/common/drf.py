@@ -6,7 +6,7 @@ from libs.utils import get_latest_version
 # https://www.django-rest-framework.org/api-guide/settings/
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "knox.auth.TokenAuthentication",
+        "apps.users.api.auth.authentication.CachedTokenAuthentication",
         # SessionAuthentication is also used for CSRF
         # validation on ajax calls from the frontend
         "rest_framework.authentication.SessionAuthentication",
@@ -29,11 +29,27 @@ REST_FRAMEWORK = {
     ),
     "PAGE_SIZE": 25,
     "EXCEPTION_HANDLER": "drf_standardized_errors.handler.exception_handler",
+    # Rates of `libs.api.throttling` throttles by `<view scope>.<kind>`
+    "DEFAULT_THROTTLE_RATES": {
+        "login.ip": "30/min",
+        "login.identifier": "10/min",
+        "register.ip": "10/hour",
+        "register.identifier": "5/hour",
+        "password-reset.ip": "10/hour",
+        "password-reset.identifier": "3/hour",
+        "consultations.user": "60/hour",
+    },
+    # Number of proxies in front of app, throttles take client's IP from
+    # `X-Forwarded-For` entry added by the outermost one, so values sent by
+    # clients are ignored
+    "NUM_PROXIES": 1,
     "TEST_REQUEST_DEFAULT_FORMAT": "json",
 }
 
 # Limit max objects in list APIs
 MAX_PAGINATION_SIZE = 100
+# Max number of objects counted by `capped` pagination count strategy
+PAGINATION_COUNT_CAP = 1000
 
 # https://drf-spectacular.readthedocs.io/en/latest/settings.html
 SPECTACULAR_SETTINGS = {
@@ -72,3 +88,6 @@ REST_KNOX = {
     "AUTO_REFRESH": False,
     "USER_SERIALIZER": "apps.users.api.serializers.UserBaseSerializer",
 }
+
+# Max time in seconds verified auth token is remembered in cache
+AUTH_TOKEN_CACHE_TIMEOUT = 60 * 5
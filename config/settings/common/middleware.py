@@ -7,4 +7,7 @@ MIDDLEWARE = (
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "libs.db.middleware.ReplicaRoutingMiddleware",
+    # Should be the last one, it calls views itself
+    "libs.transactions.TransactionPolicyMiddleware",
 )
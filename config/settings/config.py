@@ -25,6 +25,51 @@ DATABASES["default"].update(
     HOST=decouple.config("RDS_DB_HOST"),
     PORT=decouple.config("RDS_DB_PORT"),
 )
+# Take connections from per-process pool instead of keeping persistent one,
+# idle connections above min size are closed after `max_idle` seconds
+if decouple.config("DATABASE_POOL_ENABLED", default=False, cast=bool):
+    DATABASES["default"].update(
+        ENGINE="libs.db.backends.postgresql_pool",
+        CONN_MAX_AGE=0,
+    )
+    DATABASES["default"].setdefault("OPTIONS", {})["pool"] = {
+        "min_size": decouple.config(
+            "DATABASE_POOL_MIN_SIZE",
+            default=1,
+            cast=int,
+        ),
+        "max_size": decouple.config(
+            "DATABASE_POOL_MAX_SIZE",
+            default=4,
+            cast=int,
+        ),
+        # Seconds to wait for free connection
+        "timeout": decouple.config(
+            "DATABASE_POOL_TIMEOUT",
+            default=10,
+            cast=float,
+        ),
+        "max_idle": decouple.config(
+            "DATABASE_POOL_MAX_IDLE",
+            default=60,
+            cast=float,
+        ),
+    }
+# Read replicas share everything with primary except host
+replica_hosts = decouple.config(
+    "RDS_DB_REPLICA_HOSTS",
+    default="",
+    cast=decouple.Csv(),
+)
+for index, replica_host in enumerate(replica_hosts):
+    DATABASES[f"replica_{index}"] = {
+        **DATABASES["default"],
+        "HOST": replica_host,
+        "TEST": {"MIRROR": "default"},
+    }
+DATABASE_REPLICAS = tuple(
+    f"replica_{index}" for index in range(len(replica_hosts))
+)
 
 # ------------------------------------------------------------------------------
 # AWS S3 - Django Storages S3
@@ -77,6 +122,11 @@ CACHES["default"].update(
 # https://docs.djangoproject.com/en/dev/ref/settings/#secret-key
 # ------------------------------------------------------------------------------
 SECRET_KEY = decouple.config("DJANGO_SECRET_KEY")
+REST_FRAMEWORK["NUM_PROXIES"] = decouple.config(
+    "NUM_PROXIES",
+    default=REST_FRAMEWORK["NUM_PROXIES"],
+    cast=int,
+)
 ALLOWED_HOSTS = ["*"]
 
 # disable django DEBUG if we run celery worker
@@ -99,3 +149,4 @@ ZOOM_VIDEO_APP_KEY = decouple.config("ZOOM_VIDEO_APP_KEY")
 ZOOM_VIDEO_SECRET_KEY = decouple.config("ZOOM_VIDEO_SECRET_KEY")
 
 STRIPE_API_KEY = decouple.config("STRIPE_API_KEY")
+STRIPE_WEBHOOK_SECRET = decouple.config("STRIPE_WEBHOOK_SECRET")
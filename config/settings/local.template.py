@@ -32,6 +32,12 @@ DATABASES["default"].update(
     PORT="5432",
     CONN_MAX_AGE=0,
 )
+# Uncomment to try replicas routing with second connection to same database
+# DATABASES["replica"] = {
+#     **DATABASES["default"],
+#     "TEST": {"MIRROR": "default"},
+# }
+# DATABASE_REPLICAS = ("replica",)
 
 # Don't use celery when you're local
 CELERY_TASK_ALWAYS_EAGER = True
@@ -89,3 +95,4 @@ ZOOM_VIDEO_APP_KEY = ""
 ZOOM_VIDEO_SECRET_KEY = ""
 
 STRIPE_API_KEY = ""
+STRIPE_WEBHOOK_SECRET = ""
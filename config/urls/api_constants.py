@@ -1,9 +1,25 @@
 from apps.users.api import views as user_views
 from apps.consultations.api import views as consultation_views
+from apps.core.api.views import StringOptionBundleAPIView
 from django.urls import path
 
 
 urlpatterns = [
+    path(
+        "",
+        StringOptionBundleAPIView.as_view(
+            option_views={
+                "state_choices": user_views.StateChoiceAPIView,
+                "clinician_choices": user_views.ClinicianChoiceAPIView,
+                "specialty_choices": user_views.SpecialtyChoiceAPIView,
+                "session_types": (
+                    consultation_views.SessionTypeChoiceAPIView
+                ),
+                "privacy_choices": user_views.PrivacyChoiceAPIView,
+            },
+        ),
+        name="constants",
+    ),
     path(
         "state-choices",
         user_views.StateChoiceAPIView.as_view(),
@@ -1,22 +1,29 @@
 """Configuration file for pytest."""
 from django.conf import settings
+from django.core.cache import cache
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.utils.module_loading import import_string
 
 import pytest
 import pytest_lazy_fixtures
 
+from libs.cache import local_cache
+
 from apps.users.constants import UserRole
 from apps.users.factories import UserFactory
 from apps.users.models import User
 
 
-def pytest_configure():
+def pytest_configure(config):
     """Set up Django settings for tests.
 
     `pytest` automatically calls this function once when tests are run.
 
     """
+    config.addinivalue_line(
+        "markers",
+        "no_queries_budget: disable views queries budgets checks in test",
+    )
     pytest.lazy_fixture = pytest_lazy_fixtures.lf
 
     settings.DEBUG = False
@@ -33,6 +40,9 @@ def pytest_configure():
     # To disable celery in tests
     settings.CELERY_TASK_ALWAYS_EAGER = True
 
+    # Keep tests' cache entries apart from local ones
+    settings.CACHES["default"]["KEY_PREFIX"] = "wrdoc-test"
+
 
 @pytest.fixture(scope="session", autouse=True)
 def django_db_setup(django_db_setup):
@@ -45,6 +55,13 @@ def enable_db_access_for_all_tests(django_db_setup, db):
     """Enable access to DB for all tests."""
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Drop cache entries, which could outlive rolled back test data."""
+    cache.delete_pattern("*")
+    local_cache.clear()
+
+
 @pytest.fixture(scope="session", autouse=True)
 def temp_directory_for_media(tmp_path_factory):
     """Fixture that set temp directory for all media files.
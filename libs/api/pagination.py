@@ -1,9 +1,282 @@
+import base64
+import json
+
 from django.conf import settings
+from django.db import connections, models
+from django.db.models.lookups import LessThan
+from django.utils.dateparse import parse_datetime
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import BasePagination, LimitOffsetPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+class CountStrategy(models.TextChoices):
+    """Represent ways to count objects of paginated queryset."""
+
+    EXACT = "exact", _("Exact")
+    CAPPED = "capped", _("Capped")
+    ESTIMATE = "estimate", _("Estimate")
+
+
+def get_estimated_count(queryset: models.QuerySet) -> int:
+    """Return number of rows which Postgres planner expects for queryset."""
+    sql, params = queryset.query.sql_with_params()
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class RowValue(models.Func):
+    """Represent SQL row value like `(created, id)`.
+
+    Row values are compared element by element, so keyset condition is
+    matched by composite index.
+
+    """
+
+    function = ""
+    output_field = models.Field()
+
+
+class CountStrategyMixin:
+    """Count queryset with strategy declared by view.
+
+    Views declare strategy with `pagination_count_strategy`, exact count is
+    used by default. Capped count stops counting at `PAGINATION_COUNT_CAP`,
+    estimated count is taken from query plan and doesn't scan table.
+
+    """
+
+    default_count_strategy = CountStrategy.EXACT
+    count_cap = settings.PAGINATION_COUNT_CAP
+
+    def get_count_strategy(self, view) -> str | None:
+        """Return count strategy declared by view."""
+        return getattr(
+            view,
+            "pagination_count_strategy",
+            self.default_count_strategy,
+        )
+
+    def count_queryset(self, queryset: models.QuerySet, view) -> int | None:
+        """Return number of objects in queryset using view's strategy."""
+        match self.get_count_strategy(view):
+            case CountStrategy.EXACT:
+                return queryset.count()
+            case CountStrategy.CAPPED:
+                return queryset[:self.count_cap].count()
+            case CountStrategy.ESTIMATE:
+                return get_estimated_count(queryset)
+        return None
+
 
-from rest_framework.pagination import LimitOffsetPagination
+class KeysetPagination(CountStrategyMixin, BasePagination):
+    """Paginate queryset by `(created, id)` keyset.
 
+    Objects are ordered from newest to oldest. Cursor is opaque string with
+    values of last returned object, so page is fetched by index at any depth
+    and isn't shifted by newly created objects. Views can declare other
+    creation time and id fields with `cursor_keyset_fields`, keyset should be
+    covered by composite index. Count isn't returned unless view declares
+    `pagination_count_strategy`.
 
-class CustomLimitOffsetPagination(LimitOffsetPagination):
-    """Customized paginator class to limit max objects in list APIs."""
+    """
 
+    cursor_query_param = "cursor"
+    limit_query_param = "limit"
+    default_limit = settings.REST_FRAMEWORK["PAGE_SIZE"]
     max_limit = settings.MAX_PAGINATION_SIZE
+    keyset_fields = ("created", "id")
+    default_count_strategy = None
+    invalid_cursor_message = _("Invalid cursor")
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Return page of objects which go after cursor."""
+        self.request = request
+        self.limit = self.get_limit(request)
+        self.count = self.count_queryset(queryset, view)
+        self.fields = getattr(view, "cursor_keyset_fields", self.keyset_fields)
+        cursor = self.decode_cursor(request)
+        queryset = queryset.order_by(
+            *(f"-{field_name}" for field_name in self.fields),
+        )
+        if cursor:
+            queryset = queryset.filter(
+                LessThan(
+                    RowValue(*self.fields),
+                    RowValue(*(models.Value(value) for value in cursor)),
+                ),
+            )
+        results = list(queryset[:self.limit + 1])
+        self.has_next = len(results) > self.limit
+        results = results[:self.limit]
+        self.next_cursor = (
+            self.encode_cursor(results[-1]) if self.has_next else None
+        )
+        return results
+
+    def get_limit(self, request) -> int:
+        """Return page size requested by client."""
+        try:
+            limit = int(request.query_params[self.limit_query_param])
+        except (KeyError, ValueError):
+            return self.default_limit
+        if limit <= 0:
+            return self.default_limit
+        return min(limit, self.max_limit)
+
+    def encode_cursor(self, obj: models.Model) -> str:
+        """Encode position of object into opaque cursor."""
+        created_field, pk_field = self.fields
+        position = json.dumps(
+            (
+                getattr(obj, created_field).isoformat(),
+                getattr(obj, pk_field),
+            ),
+        )
+        return base64.urlsafe_b64encode(position.encode()).decode()
+
+    def decode_cursor(self, request) -> tuple | None:
+        """Decode position from cursor passed by client."""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            created, pk = json.loads(base64.urlsafe_b64decode(encoded))
+            created = parse_datetime(created)
+            pk = int(pk)
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message) from None
+        if created is None:
+            raise NotFound(self.invalid_cursor_message)
+        return created, pk
+
+    def get_next_link(self) -> str | None:
+        """Return URL of the next page."""
+        if self.next_cursor is None:
+            return None
+        return replace_query_param(
+            self.request.build_absolute_uri(),
+            self.cursor_query_param,
+            self.next_cursor,
+        )
+
+    def get_paginated_response(self, data) -> Response:
+        """Return page with link to the next one."""
+        response_data = {"next": self.get_next_link(), "results": data}
+        if self.count is not None:
+            response_data = {"count": self.count, **response_data}
+        return Response(response_data)
+
+    def get_paginated_response_schema(self, schema: dict) -> dict:
+        """Describe paginated response for API schema."""
+        return {
+            "type": "object",
+            "required": ["next", "results"],
+            "properties": {
+                "count": {"type": "integer", "example": 123},
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view) -> list[dict]:
+        """Describe cursor and limit query params for API schema."""
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": str(_("The pagination cursor value.")),
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.limit_query_param,
+                "required": False,
+                "in": "query",
+                "description": str(
+                    _("Number of results to return per page."),
+                ),
+                "schema": {"type": "integer"},
+            },
+        ]
+
+
+class CustomLimitOffsetPagination(CountStrategyMixin, LimitOffsetPagination):
+    """Customized paginator class to limit max objects in list APIs.
+
+    Views which set `allow_cursor_pagination` are paginated with
+    `KeysetPagination` when request has `cursor` query param, empty value
+    requests the first page. Cursor can't be combined with search or
+    ordering, because keyset defines order of objects.
+
+    """
+
+    max_limit = settings.MAX_PAGINATION_SIZE
+    cursor_pagination_class = KeysetPagination
+    cursor_conflict_params = (
+        api_settings.SEARCH_PARAM,
+        api_settings.ORDERING_PARAM,
+    )
+    cursor_conflict_message = _(
+        "Cursor pagination can't be combined with search or ordering.",
+    )
+
+    def get_cursor_paginator(self, request, view) -> KeysetPagination | None:
+        """Return keyset paginator if view and request use it."""
+        if not getattr(view, "allow_cursor_pagination", False):
+            return None
+        paginator = self.cursor_pagination_class()
+        if paginator.cursor_query_param not in request.query_params:
+            return None
+        if any(
+            request.query_params.get(param)
+            for param in self.cursor_conflict_params
+        ):
+            raise ValidationError(
+                {paginator.cursor_query_param: self.cursor_conflict_message},
+            )
+        return paginator
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Paginate queryset by cursor if requested, else by offset."""
+        self.view = view
+        self.cursor_paginator = self.get_cursor_paginator(request, view)
+        if self.cursor_paginator:
+            return self.cursor_paginator.paginate_queryset(
+                queryset,
+                request,
+                view,
+            )
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_count(self, queryset) -> int:
+        """Count queryset with view's count strategy."""
+        return self.count_queryset(queryset, self.view)
+
+    def get_paginated_response(self, data) -> Response:
+        """Return response of the paginator which was used."""
+        if self.cursor_paginator:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def get_schema_operation_parameters(self, view) -> list[dict]:
+        """Add cursor param for views which allow it."""
+        parameters = super().get_schema_operation_parameters(view)
+        if not getattr(view, "allow_cursor_pagination", False):
+            return parameters
+        cursor_paginator = self.cursor_pagination_class()
+        return parameters + [
+            parameter
+            for parameter in cursor_paginator.get_schema_operation_parameters(
+                view,
+            )
+            if parameter["name"] == cursor_paginator.cursor_query_param
+        ]
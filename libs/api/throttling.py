@@ -0,0 +1,141 @@
+import hashlib
+import logging
+import time
+import uuid
+
+from django.core.cache import cache
+
+from rest_framework.throttling import SimpleRateThrottle
+
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+logger = logging.getLogger("django")
+
+# Sliding window log: timestamps of allowed requests are kept in sorted set,
+# timestamps which are older than window are dropped before counting. Script
+# is atomic, so concurrent requests can't exceed the limit.
+SLIDING_WINDOW_SCRIPT = """
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+redis.call("ZREMRANGEBYSCORE", KEYS[1], "-inf", now - window)
+if redis.call("ZCARD", KEYS[1]) >= limit then
+    local oldest = redis.call("ZRANGE", KEYS[1], 0, 0, "WITHSCORES")
+    return tonumber(oldest[2]) + window - now
+end
+redis.call("ZADD", KEYS[1], now, ARGV[4])
+redis.call("PEXPIRE", KEYS[1], window)
+return 0
+"""
+
+
+class SlidingWindowThrottle(SimpleRateThrottle):
+    """Limit requests with sliding window counters stored in redis.
+
+    Views declare `throttle_scope`, rate is taken from `THROTTLE_RATES` by
+    `<throttle_scope>.<kind>` key, where kind tells what requests are
+    counted by, like IP or user. Throttles are checked before view's
+    handler, so throttled requests don't reach serializers.
+
+    Requests are allowed if redis is unavailable.
+
+    """
+
+    kind = ""
+    cache_format = "throttle:{scope}:{ident}"
+    _script = None
+
+    # pylint: disable=super-init-not-called
+    def __init__(self):
+        """Postpone rate lookup until view's scope is known."""
+
+    def allow_request(self, request, view) -> bool:
+        """Count request within window, reject if limit is reached."""
+        scope = getattr(view, "throttle_scope", None)
+        if not scope:
+            return True
+        self.scope = f"{scope}.{self.kind}"
+        self.rate = self.get_rate()
+        self.num_requests, self.duration = self.parse_rate(self.rate)
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+        try:
+            self.wait_ms = self.get_script()(
+                keys=(cache.make_key(self.key),),
+                args=(
+                    time.time_ns() // 1_000_000,
+                    self.duration * 1000,
+                    self.num_requests,
+                    uuid.uuid4().hex,
+                ),
+            )
+        except RedisError:
+            logger.exception("Failed to check throttle %s", self.scope)
+            return True
+        return self.wait_ms <= 0
+
+    def wait(self) -> float:
+        """Return number of seconds until request will be allowed."""
+        return self.wait_ms / 1000
+
+    @classmethod
+    def get_script(cls):
+        """Return sliding window script registered in redis."""
+        if cls._script is None:
+            cls._script = get_redis_connection("default").register_script(
+                SLIDING_WINDOW_SCRIPT,
+            )
+        return cls._script
+
+    def get_ident_key(self, ident: str) -> str:
+        """Return key of counter for identity."""
+        return self.cache_format.format(scope=self.scope, ident=ident)
+
+
+class IPRateThrottle(SlidingWindowThrottle):
+    """Count requests by client's IP."""
+
+    kind = "ip"
+
+    def get_cache_key(self, request, view) -> str:
+        """Return key of client's IP counter."""
+        return self.get_ident_key(self.get_ident(request))
+
+
+class UserRateThrottle(SlidingWindowThrottle):
+    """Count requests by authenticated user, anonymous are counted by IP."""
+
+    kind = "user"
+
+    def get_cache_key(self, request, view) -> str:
+        """Return key of user's counter."""
+        if request.user and request.user.is_authenticated:
+            return self.get_ident_key(f"user-{request.user.pk}")
+        return self.get_ident_key(self.get_ident(request))
+
+
+class IdentifierRateThrottle(SlidingWindowThrottle):
+    """Count requests by account identifier sent in request's data.
+
+    Limits attempts against single account, which are spread across many
+    IPs. View declares data field with `throttle_identifier_field`.
+
+    """
+
+    kind = "identifier"
+
+    def get_cache_key(self, request, view) -> str | None:
+        """Return key of identifier's counter."""
+        try:
+            identifier = request.data.get(view.throttle_identifier_field)
+        except AttributeError:
+            return None
+        if not identifier or not isinstance(identifier, str):
+            return None
+        # Identifiers are hashed to keep emails out of redis keys
+        identifier = hashlib.sha256(
+            identifier.strip().lower().encode(),
+        ).hexdigest()
+        return self.get_ident_key(identifier)
@@ -0,0 +1 @@
+from .namespaces import CacheNamespace, local_cache, register_warm_up, warm_up
@@ -0,0 +1,60 @@
+import json
+import logging
+import os
+import threading
+import typing
+
+from django.conf import settings
+
+from django_redis import get_redis_connection
+
+logger = logging.getLogger("django")
+
+_listener_lock = threading.Lock()
+_listener_pid: int | None = None
+
+
+def publish(message: dict) -> None:
+    """Send invalidation message to all processes."""
+    get_redis_connection("default").publish(
+        settings.CACHE_INVALIDATION_CHANNEL,
+        json.dumps(message),
+    )
+
+
+def _listen(handler: typing.Callable[[dict], None]) -> None:
+    """Pass invalidation messages to handler until process exits."""
+    while True:
+        try:
+            pubsub = get_redis_connection("default").pubsub(
+                ignore_subscribe_messages=True,
+            )
+            pubsub.subscribe(settings.CACHE_INVALIDATION_CHANNEL)
+            for message in pubsub.listen():
+                handler(json.loads(message["data"]))
+        # pylint: disable=broad-except
+        except Exception:
+            # Local entries expire by timeout while listener reconnects
+            logger.exception("Cache invalidation listener failed")
+            threading.Event().wait(settings.LOCAL_CACHE_TIMEOUT)
+
+
+def ensure_listener(handler: typing.Callable[[dict], None]) -> None:
+    """Start listener thread in current process if it's not running.
+
+    Process id is checked, because threads don't survive fork of workers.
+
+    """
+    global _listener_pid  # pylint: disable=global-statement
+    if _listener_pid == os.getpid():
+        return
+    with _listener_lock:
+        if _listener_pid == os.getpid():
+            return
+        threading.Thread(
+            target=_listen,
+            args=(handler,),
+            name="cache-invalidation-listener",
+            daemon=True,
+        ).start()
+        _listener_pid = os.getpid()
@@ -0,0 +1,146 @@
+import typing
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .invalidation import ensure_listener, publish
+from .local import LRUCache
+
+# In-process tier shared by all namespaces
+local_cache = LRUCache(
+    max_entries=settings.LOCAL_CACHE_MAX_ENTRIES,
+    timeout=settings.LOCAL_CACHE_TIMEOUT,
+)
+
+_warm_up_functions: list[typing.Callable[[], None]] = []
+
+
+class CacheNamespace:
+    """Two-tier cache of related entries with versioned keys.
+
+    Values are looked up in bounded in-process LRU first and in Redis next.
+    Keys include namespace's version stored in Redis, so whole namespace is
+    invalidated by incrementing version. Invalidations are published over
+    Redis pub/sub, so other processes drop their in-process entries.
+
+    Example:
+        templates_cache = CacheNamespace("consultation-templates")
+        templates_cache.get_or_set("ids", load_template_ids)
+
+    """
+
+    def __init__(self, name: str, timeout: int | None = None):
+        self.name = name
+        self.timeout = timeout or settings.CACHE_NAMESPACE_TIMEOUT
+
+    @property
+    def version_key(self) -> str:
+        """Return key of namespace's version."""
+        return f"cache-version:{self.name}"
+
+    def get_version(self) -> int:
+        """Return current version of namespace."""
+        version = local_cache.get(self.version_key)
+        if version is None:
+            version = cache.get_or_set(self.version_key, 1, timeout=None)
+            local_cache.set(self.version_key, version)
+        return version
+
+    def make_key(self, key) -> str:
+        """Return versioned cache key."""
+        return f"{self.name}:v{self.get_version()}:{key}"
+
+    def get_many_or_set(
+        self,
+        keys: typing.Iterable,
+        loader: typing.Callable[[list], dict],
+    ) -> dict:
+        """Return values of keys, load missing ones with `loader`.
+
+        `loader` receives list of missing keys and returns dict of their
+        values, keys which are absent in result aren't cached.
+
+        """
+        ensure_listener(handle_invalidation_message)
+        cache_keys = {key: self.make_key(key) for key in keys}
+        values = {}
+        for key, cache_key in cache_keys.items():
+            value = local_cache.get(cache_key)
+            if value is not None:
+                values[key] = value
+        missing_keys = [key for key in cache_keys if key not in values]
+        if missing_keys:
+            remote_values = cache.get_many(
+                [cache_keys[key] for key in missing_keys],
+            )
+            for key in missing_keys:
+                if cache_keys[key] in remote_values:
+                    values[key] = remote_values[cache_keys[key]]
+                    local_cache.set(cache_keys[key], values[key])
+        missing_keys = [key for key in cache_keys if key not in values]
+        if missing_keys:
+            loaded_values = loader(missing_keys)
+            self.set_many(loaded_values)
+            values.update(loaded_values)
+        return values
+
+    def get_or_set(self, key, default: typing.Callable[[], typing.Any]):
+        """Return value of key, calculate it with `default` on miss."""
+        return self.get_many_or_set(
+            [key],
+            lambda keys: {key: default()},
+        )[key]
+
+    def set_many(self, values: dict) -> None:
+        """Store values in both tiers."""
+        cache_values = {
+            self.make_key(key): value for key, value in values.items()
+        }
+        cache.set_many(cache_values, self.timeout)
+        for cache_key, value in cache_values.items():
+            local_cache.set(cache_key, value)
+
+    def set(self, key, value) -> None:
+        """Store value in both tiers."""
+        self.set_many({key: value})
+
+    def delete(self, *keys) -> None:
+        """Drop keys from Redis and in-process tiers of all processes."""
+        cache_keys = [self.make_key(key) for key in keys]
+        cache.delete_many(cache_keys)
+        for cache_key in cache_keys:
+            local_cache.delete(cache_key)
+        publish({"keys": cache_keys})
+
+    def invalidate(self) -> None:
+        """Drop all entries of namespace by incrementing its version."""
+        try:
+            version = cache.incr(self.version_key)
+        except ValueError:
+            version = self.get_version() + 1
+            cache.set(self.version_key, version, timeout=None)
+        handle_invalidation_message({"namespace": self.name})
+        publish({"namespace": self.name})
+
+
+def handle_invalidation_message(message: dict) -> None:
+    """Drop in-process entries invalidated by any process."""
+    namespace = message.get("namespace")
+    if namespace:
+        local_cache.delete_prefix(f"{namespace}:")
+        local_cache.delete(f"cache-version:{namespace}")
+    for cache_key in message.get("keys", ()):
+        local_cache.delete(cache_key)
+
+
+def register_warm_up(func: typing.Callable[[], None]):
+    """Register function which fills caches on deploy."""
+    _warm_up_functions.append(func)
+    return func
+
+
+def warm_up() -> list[str]:
+    """Run registered warm-up functions, return their names."""
+    for func in _warm_up_functions:
+        func()
+    return [func.__qualname__ for func in _warm_up_functions]
@@ -0,0 +1,106 @@
+import os
+import threading
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.postgresql import base
+
+from psycopg import IsolationLevel
+from psycopg_pool import ConnectionPool
+
+# Pools by process id, database alias and name. Pools are created on first
+# connection, so processes forked by uWSGI or celery get their own pools.
+pools: dict[tuple[int, str, str], ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_process_pools() -> dict[str, ConnectionPool]:
+    """Return pools of current process by database alias."""
+    pid = os.getpid()
+    return {
+        alias: pool
+        for (pool_pid, alias, _), pool in pools.items()
+        if pool_pid == pid
+    }
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """PostgreSQL backend which takes connections from psycopg's pool.
+
+    Pool is configured with `OPTIONS["pool"]`, which is passed to
+    `psycopg_pool.ConnectionPool` (`min_size`, `max_size`, `timeout`,
+    `max_idle` and so on). Connections are checked on checkout and
+    returned to pool when Django closes them, so `CONN_MAX_AGE` has to be 0.
+
+    """
+
+    def __init__(self, settings_dict, *args, **kwargs):
+        if settings_dict["CONN_MAX_AGE"] != 0:
+            raise ImproperlyConfigured(
+                "Pooled connections require CONN_MAX_AGE to be 0.",
+            )
+        super().__init__(settings_dict, *args, **kwargs)
+
+    @property
+    def pool(self) -> ConnectionPool:
+        """Return connections pool of current process."""
+        key = (os.getpid(), self.alias, self.settings_dict["NAME"])
+        if key not in pools:
+            with _pools_lock:
+                if key not in pools:
+                    pools[key] = self.create_pool()
+        return pools[key]
+
+    def create_pool(self) -> ConnectionPool:
+        """Open connections pool with connection params from settings."""
+        return ConnectionPool(
+            kwargs=self.get_connection_params(),
+            name=self.alias,
+            check=ConnectionPool.check_connection,
+            open=True,
+            **self.settings_dict["OPTIONS"].get("pool", {}),
+        )
+
+    def get_connection_params(self) -> dict:
+        """Drop pool options from params of connections."""
+        conn_params = super().get_connection_params()
+        conn_params.pop("pool", None)
+        return conn_params
+
+    def get_new_connection(self, conn_params: dict):
+        """Take connection from pool instead of opening new one."""
+        isolation_level = self.settings_dict["OPTIONS"].get("isolation_level")
+        self.isolation_level = IsolationLevel(
+            isolation_level or IsolationLevel.READ_COMMITTED,
+        )
+        connection = self.pool.getconn()
+        if isolation_level is not None:
+            connection.isolation_level = self.isolation_level
+        return connection
+
+    def _close(self) -> None:
+        """Return connection to pool instead of closing it."""
+        if self.connection is None:
+            return
+        with self.wrap_database_errors:
+            self.pool.putconn(self.connection)
+
+
+def get_pool_stats(pool: ConnectionPool) -> dict:
+    """Return pool's counters along with average wait and utilization.
+
+    Counters are accumulated since pool was opened, utilization is share of
+    `max_size` connections, which are taken at the moment.
+
+    """
+    stats = pool.get_stats()
+    requests_num = stats.get("requests_num", 0)
+    in_use = stats["pool_size"] - stats["pool_available"]
+    return {
+        **stats,
+        "requests_wait_avg_ms": (
+            stats.get("requests_wait_ms", 0) / requests_num
+            if requests_num
+            else 0
+        ),
+        "utilization": in_use / stats["pool_max"],
+    }
@@ -0,0 +1,51 @@
+import typing
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+
+from rest_framework.permissions import SAFE_METHODS
+
+from . import replicas
+
+
+class ReplicaRoutingMiddleware:
+    """Allow reads from replicas for views, which opt in.
+
+    Views set `allow_replica_reads`, their safe requests are read from
+    replicas unless client has changed data recently. Requests which change
+    data pin client to primary, so client reads own writes.
+
+    """
+
+    def __init__(self, get_response: typing.Callable):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if not settings.DATABASE_REPLICAS:
+            return self.get_response(request)
+        token = replicas.replica_reads_allowed.set(False)
+        try:
+            response = self.get_response(request)
+        finally:
+            replicas.replica_reads_allowed.reset(token)
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            replicas.pin_to_primary(request)
+        return response
+
+    def process_view(
+        self,
+        request: HttpRequest,
+        view_func: typing.Callable,
+        view_args: tuple,
+        view_kwargs: dict,
+    ) -> None:
+        """Allow replica reads if view and request permit it."""
+        if not settings.DATABASE_REPLICAS:
+            return
+        view_class = getattr(view_func, "cls", None)
+        if (
+            request.method in SAFE_METHODS
+            and getattr(view_class, "allow_replica_reads", False)
+            and not replicas.is_pinned_to_primary(request)
+        ):
+            replicas.replica_reads_allowed.set(True)
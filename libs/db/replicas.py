@@ -0,0 +1,118 @@
+import contextvars
+import hashlib
+import logging
+import random
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+from django.http import HttpRequest
+
+from rest_framework.throttling import BaseThrottle
+
+logger = logging.getLogger("django")
+
+# Whether reads of current request may go to replicas, replicas are used
+# only by requests which allow it, so celery tasks and commands read from
+# primary database
+replica_reads_allowed = contextvars.ContextVar(
+    "replica_reads_allowed",
+    default=False,
+)
+
+PRIMARY_PIN_CACHE_KEY = "db:primary-pin:{client}"
+
+# Replica is up to date, when it has replayed all received WAL, otherwise
+# lag is time since the last replayed transaction. Primary database (or
+# database which isn't replica) has no lag.
+REPLICA_LAG_SQL = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(
+            EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()),
+            0
+        )
+    END
+"""
+
+# Result of last lag check of replica: (checked at, is replica usable)
+_replica_checks: dict[str, tuple[float, bool]] = {}
+
+
+def get_replica_lag(alias: str) -> float:
+    """Return replication lag of database in seconds."""
+    with connections[alias].cursor() as cursor:
+        cursor.execute(REPLICA_LAG_SQL)
+        return float(cursor.fetchone()[0])
+
+
+def is_replica_usable(alias: str) -> bool:
+    """Check whether replica's lag is within `REPLICA_MAX_LAG`.
+
+    Lag is checked once per `REPLICA_LAG_CHECK_INTERVAL` seconds in each
+    process, replica which can't be checked isn't used.
+
+    """
+    checked_at, is_usable = _replica_checks.get(alias, (None, False))
+    now = time.monotonic()
+    if (
+        checked_at is not None
+        and now - checked_at < settings.REPLICA_LAG_CHECK_INTERVAL
+    ):
+        return is_usable
+    try:
+        is_usable = get_replica_lag(alias) <= settings.REPLICA_MAX_LAG
+    except DatabaseError:
+        logger.exception("Failed to check lag of replica %s", alias)
+        is_usable = False
+    _replica_checks[alias] = (now, is_usable)
+    return is_usable
+
+
+def get_replica_alias() -> str | None:
+    """Return random usable replica, if there is any."""
+    aliases = [
+        alias
+        for alias in settings.DATABASE_REPLICAS
+        if is_replica_usable(alias)
+    ]
+    return random.choice(aliases) if aliases else None
+
+
+def get_client_keys(request: HttpRequest) -> list[str]:
+    """Return cache keys of primary pins of request's client.
+
+    Client is identified by credentials and by IP, so requests with token
+    received on login or registration are pinned as well.
+
+    """
+    clients = [f"ip:{BaseThrottle().get_ident(request)}"]
+    credentials = request.headers.get("Authorization") or request.COOKIES.get(
+        settings.SESSION_COOKIE_NAME,
+    )
+    if credentials:
+        # Credentials are hashed to keep them out of cache keys
+        clients.append(
+            f"auth:{hashlib.sha256(credentials.encode()).hexdigest()}",
+        )
+    return [PRIMARY_PIN_CACHE_KEY.format(client=client) for client in clients]
+
+
+def pin_to_primary(request: HttpRequest) -> None:
+    """Make client's reads go to primary for `REPLICA_STICKINESS_TIMEOUT`."""
+    cache.set_many(
+        {key: True for key in get_client_keys(request)},
+        timeout=settings.REPLICA_STICKINESS_TIMEOUT,
+    )
+
+
+def is_pinned_to_primary(request: HttpRequest) -> bool:
+    """Check whether client has recently changed data."""
+    return bool(cache.get_many(get_client_keys(request)))
+
+
+def is_in_primary_transaction() -> bool:
+    """Check whether primary database has open transaction."""
+    return connections[DEFAULT_DB_ALIAS].in_atomic_block
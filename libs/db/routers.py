@@ -0,0 +1,45 @@
+from django.db import DEFAULT_DB_ALIAS
+
+from . import replicas
+
+# Models which are always read from primary, because they are read right
+# after they are written by another request, like tokens after login
+PRIMARY_MODELS = (
+    "knox.authtoken",
+    "sessions.session",
+)
+
+
+class ReplicaRouter:
+    """Send reads of requests, which allow it, to read replicas.
+
+    Reads go to replica only if `ReplicaRoutingMiddleware` allowed them for
+    current request, primary has no open transaction and there is replica
+    with acceptable lag. Writes and migrations go to primary.
+
+    """
+
+    def db_for_read(self, model, **hints) -> str | None:
+        """Return replica for reads if it can be used."""
+        instance = hints.get("instance")
+        if instance is not None and instance._state.db:
+            return instance._state.db
+        if (
+            not replicas.replica_reads_allowed.get()
+            or model._meta.label_lower in PRIMARY_MODELS
+            or replicas.is_in_primary_transaction()
+        ):
+            return DEFAULT_DB_ALIAS
+        return replicas.get_replica_alias() or DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints) -> str:
+        """Send all writes to primary."""
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints) -> bool:
+        """Allow relations, replicas have the same data as primary."""
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints) -> bool:
+        """Migrate only primary, replicas get changes by replication."""
+        return db == DEFAULT_DB_ALIAS
@@ -0,0 +1,20 @@
+import typing
+
+from django.db import models
+
+
+def iterate_pk_chunks(
+    queryset: models.QuerySet,
+    chunk_size: int,
+) -> typing.Iterator[list]:
+    """Yield primary keys of queryset in chunks.
+
+    Keyset pagination is used, so each chunk is fetched by index and all
+    primary keys are never loaded at once.
+
+    """
+    queryset = queryset.order_by("pk").values_list("pk", flat=True)
+    chunk = list(queryset[:chunk_size])
+    while chunk:
+        yield chunk
+        chunk = list(queryset.filter(pk__gt=chunk[-1])[:chunk_size])
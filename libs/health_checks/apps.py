@@ -13,6 +13,7 @@ class HealthChecksConfig(AppConfig):
         from . import backends
         backends_to_register = (
             backends.EmailHealthCheck,
+            backends.DatabasePoolHealthCheck,
         )
         for backend in backends_to_register:
             plugin_dir.register(backend)
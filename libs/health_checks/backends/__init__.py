@@ -1 +1,2 @@
+from .database_pool import DatabasePoolHealthCheck
 from .email import EmailHealthCheck
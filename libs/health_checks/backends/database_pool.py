@@ -0,0 +1,42 @@
+import json
+
+from health_check.backends import BaseHealthCheckBackend
+from health_check.exceptions import ServiceUnavailable
+from psycopg_pool import PoolTimeout
+
+from libs.db.backends.postgresql_pool.base import (
+    get_pool_stats,
+    get_process_pools,
+)
+
+
+class DatabasePoolHealthCheck(BaseHealthCheckBackend):
+    """Check that pools of current process hand out connections.
+
+    Status also reports pools' wait time and utilization, so they can be
+    collected from each worker.
+
+    """
+
+    critical_service = False
+
+    def check_status(self):
+        """Take connection from each pool and collect pools' stats."""
+        self.stats = {}
+        for alias, pool in get_process_pools().items():
+            try:
+                with pool.connection(timeout=pool.timeout):
+                    pass
+            except PoolTimeout as error:
+                self.add_error(
+                    error=ServiceUnavailable(f"{alias}: {error}"),
+                    cause=error,
+                )
+            self.stats[alias] = get_pool_stats(pool)
+
+    def pretty_status(self) -> str:
+        """Add pools' stats to status."""
+        status = super().pretty_status()
+        if not getattr(self, "stats", None):
+            return status
+        return f"{status} {json.dumps(self.stats)}"
@@ -1,19 +1,27 @@
 # pylint: skip-file
+import itertools
 import logging
+import smtplib
 import typing
 from collections import namedtuple
 from urllib.error import HTTPError
 
 from django.conf import settings
+from django.core import mail as django_mail
 from django.core.mail import EmailMultiAlternatives
-from django.template.loader import render_to_string
 
-from html_sanitizer import Sanitizer
+from . import rendering
 
 logger = logging.getLogger("django")
 
 EmailFile = namedtuple("EmailFile", ["filename", "content", "mimetype"])
 
+# Errors after which email delivery can be retried
+DELIVERY_ERRORS = (smtplib.SMTPException, OSError, HTTPError)
+
+# Connections to mail server by backend, reused by deliveries in the process
+_connections = {}
+
 
 class EmailNotification:
     """Wrap up of django.core send_mail function.
@@ -100,7 +108,7 @@ class EmailNotification:
 
     def prepare_html_text(self):
         """Prepare html message for email."""
-        html_message = render_to_string(
+        html_message = rendering.render(
             self.get_template(), self.get_template_context(),
         )
         return html_message
@@ -113,13 +121,12 @@ class EmailNotification:
 
         """
         if message_template := self.get_plain_template():
-            plain_message = render_to_string(
+            plain_message = rendering.render(
                 message_template, self.get_template_context(),
             )
             return plain_message
 
-        sanitizer = Sanitizer()
-        plain_message = sanitizer.sanitize(html_message)
+        plain_message = rendering.html_to_plain_text(html_message)
         return plain_message
 
     def prepare_mail_text(self):
@@ -145,14 +152,8 @@ class EmailNotification:
             "files": files,
         }
 
-    def send(self) -> bool:
-        """Send email.
-
-        Returns:
-            True: if it succeeded
-            False: if it failed
-
-        """
+    def prepare_mail(self) -> EmailMultiAlternatives:
+        """Render email message with html content and attachments."""
         email_args = self.prepare_mail_args()
         html_message = email_args.pop("html_message")
         files = email_args.pop("files")
@@ -167,6 +168,17 @@ class EmailNotification:
                 content=file.content,
                 mimetype=file.mimetype,
             )
+        return mail
+
+    def send(self) -> bool:
+        """Send email.
+
+        Returns:
+            True: if it succeeded
+            False: if it failed
+
+        """
+        mail = self.prepare_mail()
 
         # Send email
         try:
@@ -175,11 +187,19 @@ class EmailNotification:
             return True
         except HTTPError as error:
             logger.error(
-                f"Error while sending email to {email_args['to']}: {error}",
+                f"Error while sending email to {mail.to}: {error}",
             )
             self.on_email_send_failed(error)
             return False
 
+    def send_async(self) -> None:
+        """Render email and queue it for delivery by celery.
+
+        Callbacks are called by celery worker after delivery.
+
+        """
+        send_many_async([self])
+
     def on_email_send_succeed(self):
         """Perform action, when email sending succeed."""
 
@@ -187,6 +207,76 @@ class EmailNotification:
         """Perform action, when email sending failed."""
 
 
+def send_many_async(
+    notifications: typing.Iterable[EmailNotification],
+    batch_size: int | None = None,
+) -> None:
+    """Render emails and queue them for delivery in batches.
+
+    Each batch is sent by celery over single connection to mail server.
+
+    """
+    from .tasks import send_emails
+
+    batch_size = batch_size or settings.EMAIL_DELIVERY_BATCH_SIZE
+    notifications = iter(notifications)
+    while batch := list(itertools.islice(notifications, batch_size)):
+        send_emails.delay(list(zip(batch, render_many(batch))))
+
+
+def render_many(
+    notifications: typing.Iterable[EmailNotification],
+) -> list[EmailMultiAlternatives]:
+    """Render emails for notifications.
+
+    Sanitizer is shared by all notifications and compiled templates are
+    kept by Django's cached template loader, so bulk rendering only
+    evaluates templates with each context.
+
+    """
+    return [notification.prepare_mail() for notification in notifications]
+
+
+def get_connection():
+    """Return connection to mail server shared by deliveries of process."""
+    if settings.EMAIL_BACKEND not in _connections:
+        _connections[settings.EMAIL_BACKEND] = django_mail.get_connection()
+    return _connections[settings.EMAIL_BACKEND]
+
+
+def deliver(
+    emails: typing.Sequence[tuple[EmailNotification, EmailMultiAlternatives]],
+) -> list[tuple[EmailNotification, EmailMultiAlternatives, Exception]]:
+    """Send rendered emails over shared connection.
+
+    Connection is opened once for the batch and closed after it. Success
+    callback is called for each sent email, failed emails are returned with
+    errors and without connection, so they can be passed to celery to be
+    retried.
+
+    """
+    connection = get_connection()
+    failed = []
+    try:
+        for notification, mail in emails:
+            mail.connection = connection
+            try:
+                # Connection is reopened if server dropped it on failure
+                connection.open()
+                mail.send()
+            except DELIVERY_ERRORS as error:
+                connection.close()
+                failed.append((notification, mail, error))
+                continue
+            finally:
+                # Connection holds socket and lock, which can't be pickled
+                mail.connection = None
+            notification.on_email_send_succeed()
+    finally:
+        connection.close()
+    return failed
+
+
 class DefaultEmailNotification(EmailNotification):
     """Used to send mails from app default address."""
 
@@ -0,0 +1,95 @@
+import dataclasses
+import datetime
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import models
+
+from .email import EmailNotification
+
+PROGRESS_FIELDS = ("total", "sent", "failed")
+PROGRESS_TIMEOUT = datetime.timedelta(days=7).total_seconds()
+
+
+@dataclasses.dataclass
+class FanOutProgress:
+    """Represent progress of sending notification to many recipients.
+
+    `failed` counts emails which couldn't be sent at the first attempt, they
+    are retried by `send_emails` task.
+
+    """
+
+    total: int
+    sent: int
+    failed: int
+
+    @property
+    def is_finished(self) -> bool:
+        """Check if all recipients were processed."""
+        return self.sent + self.failed >= self.total
+
+
+def _get_progress_key(fan_out_id: str, field: str) -> str:
+    """Return cache key for progress counter."""
+    return f"notifications:fan-out:{fan_out_id}:{field}"
+
+
+def get_progress(fan_out_id: str) -> FanOutProgress | None:
+    """Return progress of fan-out, None if it's unknown or expired."""
+    keys = {
+        field: _get_progress_key(fan_out_id, field)
+        for field in PROGRESS_FIELDS
+    }
+    values = cache.get_many(keys.values())
+    if len(values) != len(keys):
+        return None
+    return FanOutProgress(
+        **{field: values[key] for field, key in keys.items()},
+    )
+
+
+def track_progress(fan_out_id: str, **deltas: int) -> None:
+    """Increment progress counters of fan-out."""
+    for field, delta in deltas.items():
+        if delta:
+            cache.incr(_get_progress_key(fan_out_id, field), delta)
+
+
+def fan_out(
+    notification_class: type[EmailNotification],
+    queryset: models.QuerySet,
+    chunk_size: int | None = None,
+    **template_context,
+) -> str:
+    """Send notification to each object of queryset.
+
+    Notification is created for each object as
+    `notification_class(obj, **template_context)`, so personalized context is
+    built only when chunk of recipients is rendered by celery. Chunks are
+    sent by rate limited celery task.
+
+    Return id for `get_progress`.
+
+    """
+    from .tasks import dispatch_fan_out
+
+    fan_out_id = uuid.uuid4().hex
+    cache.set_many(
+        {
+            _get_progress_key(fan_out_id, "total"): queryset.count(),
+            _get_progress_key(fan_out_id, "sent"): 0,
+            _get_progress_key(fan_out_id, "failed"): 0,
+        },
+        timeout=PROGRESS_TIMEOUT,
+    )
+    dispatch_fan_out.delay(
+        fan_out_id=fan_out_id,
+        notification_class=notification_class,
+        model=queryset.model,
+        query=queryset.query,
+        chunk_size=chunk_size or settings.NOTIFICATIONS_FAN_OUT_CHUNK_SIZE,
+        template_context=template_context,
+    )
+    return fan_out_id
@@ -0,0 +1,25 @@
+import functools
+
+from django.template import loader
+
+from html_sanitizer import Sanitizer
+
+
+@functools.cache
+def get_sanitizer() -> Sanitizer:
+    """Return sanitizer shared by the process."""
+    return Sanitizer()
+
+
+def render(template_name: str, context: dict) -> str:
+    """Render template with context.
+
+    Compiled templates are kept by Django's cached template loader.
+
+    """
+    return loader.render_to_string(template_name, context)
+
+
+def html_to_plain_text(html_message: str) -> str:
+    """Convert html to plain text keeping links."""
+    return get_sanitizer().sanitize(html_message)
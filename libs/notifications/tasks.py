@@ -0,0 +1,103 @@
+import logging
+
+from django.conf import settings
+from django.db import models
+
+from celery import shared_task
+
+from libs.db.utils import iterate_pk_chunks
+
+from .email import EmailNotification, deliver, render_many
+from .fan_out import track_progress
+
+logger = logging.getLogger("django")
+
+
+def get_fan_out_queryset(model: type[models.Model], query) -> models.QuerySet:
+    """Return queryset of fan-out recipients from its pickled query."""
+    queryset = model._default_manager.all()
+    queryset.query = query
+    return queryset
+
+
+@shared_task(bind=True, max_retries=settings.EMAIL_DELIVERY_MAX_RETRIES)
+def send_emails(self, emails: list) -> None:
+    """Send batch of rendered emails, retry failed ones with backoff.
+
+    `emails` is list of pairs of notification and its rendered message, when
+    all retries are exhausted failure callbacks of notifications are called.
+
+    """
+    failed = deliver(emails)
+    if not failed:
+        return
+    if self.request.retries < self.max_retries:
+        raise self.retry(
+            args=([(notification, mail) for notification, mail, _ in failed],),
+            countdown=settings.EMAIL_DELIVERY_RETRY_DELAY
+            * 2 ** self.request.retries,
+        )
+    for notification, mail, error in failed:
+        logger.error(f"Error while sending email to {mail.to}: {error}")
+        notification.on_email_send_failed(error)
+
+
+@shared_task
+def dispatch_fan_out(
+    fan_out_id: str,
+    notification_class: type[EmailNotification],
+    model: type[models.Model],
+    query,
+    chunk_size: int,
+    template_context: dict,
+) -> None:
+    """Split recipients of fan-out into chunks and queue their sending."""
+    queryset = get_fan_out_queryset(model, query)
+    for pks in iterate_pk_chunks(queryset, chunk_size):
+        send_fan_out_chunk.delay(
+            fan_out_id=fan_out_id,
+            notification_class=notification_class,
+            model=model,
+            query=query,
+            pks=pks,
+            template_context=template_context,
+        )
+
+
+@shared_task(rate_limit=settings.NOTIFICATIONS_FAN_OUT_RATE_LIMIT)
+def send_fan_out_chunk(
+    fan_out_id: str,
+    notification_class: type[EmailNotification],
+    model: type[models.Model],
+    query,
+    pks: list,
+    template_context: dict,
+) -> None:
+    """Render and send notifications for chunk of fan-out recipients.
+
+    Recipients are fetched with fan-out's query, so ones which stopped
+    matching it since fan-out start (e.g. opted out of notifications) are
+    skipped. Emails which failed at first attempt are passed to
+    `send_emails` to be retried.
+
+    """
+    notifications = [
+        notification_class(recipient, **template_context)
+        for recipient in get_fan_out_queryset(model, query).filter(
+            pk__in=pks,
+        )
+    ]
+    emails = list(zip(notifications, render_many(notifications)))
+    failed = deliver(emails)
+    track_progress(
+        fan_out_id,
+        # Recipients, which were deleted or stopped matching query after
+        # fan-out start, are skipped
+        total=len(notifications) - len(pks),
+        sent=len(emails) - len(failed),
+        failed=len(failed),
+    )
+    if failed:
+        send_emails.delay(
+            [(notification, mail) for notification, mail, _ in failed],
+        )
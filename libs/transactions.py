@@ -0,0 +1,84 @@
+import typing
+
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.http import HttpRequest, HttpResponse
+
+from rest_framework.permissions import SAFE_METHODS
+
+
+def non_atomic_handler(handler: typing.Callable) -> typing.Callable:
+    """Mark view's handler or viewset's action to run without transaction.
+
+    Used for handlers, which call external APIs like Stripe, so database
+    connection isn't kept in transaction during network round trips. Such
+    handlers open transactions around their database work themselves.
+
+    """
+    handler.non_atomic = True
+    return handler
+
+
+def get_handler(
+    request: HttpRequest,
+    view_func: typing.Callable,
+) -> typing.Callable | None:
+    """Return method of class-based view, which handles request."""
+    view_class = getattr(view_func, "cls", None)
+    if view_class is None:
+        return view_func
+    method = request.method.lower()
+    # Viewsets map HTTP methods to actions
+    actions = getattr(view_func, "actions", None)
+    handler_name = actions.get(method) if actions else method
+    return getattr(view_class, handler_name or method, None)
+
+
+def is_atomic_request(
+    request: HttpRequest,
+    view_func: typing.Callable,
+) -> bool:
+    """Check whether request has to be handled in transaction.
+
+    Safe methods don't change data, so they run without transaction. Views
+    opt out with `non_atomic_handler` or Django's `non_atomic_requests`.
+
+    """
+    if request.method in SAFE_METHODS:
+        return False
+    if DEFAULT_DB_ALIAS in getattr(view_func, "_non_atomic_requests", ()):
+        return False
+    handler = get_handler(request, view_func)
+    return not getattr(handler, "non_atomic", False)
+
+
+class TransactionPolicyMiddleware:
+    """Run views in transaction according to `is_atomic_request`.
+
+    Replaces `ATOMIC_REQUESTS`, which wraps every request in transaction,
+    so connections aren't kept in transactions by read-only requests and
+    by requests waiting for external APIs.
+
+    """
+
+    def __init__(self, get_response: typing.Callable):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        return self.get_response(request)
+
+    def process_view(
+        self,
+        request: HttpRequest,
+        view_func: typing.Callable,
+        view_args: tuple,
+        view_kwargs: dict,
+    ) -> HttpResponse | None:
+        """Call view in transaction if request requires it."""
+        if not is_atomic_request(request, view_func):
+            return None
+        with transaction.atomic():
+            response = view_func(request, *view_args, **view_kwargs)
+            # DRF rolls back handled errors only with `ATOMIC_REQUESTS`
+            if getattr(response, "exception", False):
+                transaction.set_rollback(True)
+        return response